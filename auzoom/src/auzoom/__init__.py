@@ -1,7 +1,19 @@
+from importlib import import_module
 from .models import CodeNode, FetchLevel, NodeType
-from .core.parsing.parser import PythonParser
-from .core.graph.lazy_graph import LazyCodeGraph
-from .mcp.server import AuZoomMCPServer
 
 __version__ = "0.3.0"
 __all__ = ["CodeNode", "FetchLevel", "NodeType", "PythonParser", "LazyCodeGraph", "AuZoomMCPServer"]
+
+# Resolved on first access so `auzoom-mcp` can answer initialize before
+# tree-sitter and the graph modules are imported
+_LAZY_EXPORTS = {
+    "PythonParser": ".core.parsing.parser",
+    "LazyCodeGraph": ".core.graph.lazy_graph",
+    "AuZoomMCPServer": ".mcp.server",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        return getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
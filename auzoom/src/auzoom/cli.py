@@ -3,6 +3,8 @@
 import sys
 import click
 from pathlib import Path
+from .core.validation.rules import RULES
+from .core.validator import DIRECTORY_RULE
 
 
 @click.group()
@@ -13,11 +15,13 @@ def main():
 
 @main.command()
 @click.option('--scope', type=click.Choice(['file', 'directory', 'project']), default='project', help='Validation scope')
+@click.option('--rule', 'rules', multiple=True, type=click.Choice([*RULES, DIRECTORY_RULE]),
+              help='Rule to check (repeatable; default: module_length, function_length, directory_size)')
 @click.argument('path', default='.', type=click.Path(exists=True))
-def validate(scope, path):
+def validate(scope, rules, path):
     """Validate code structure compliance.
 
-    Checks for:
+    Checks for (by default):
     - Functions/methods ≤50 lines
     - Modules ≤250 lines
     - Directories ≤7 files
@@ -26,13 +30,14 @@ def validate(scope, path):
 
     validator = CodeValidator()
     path = str(Path(path).resolve())
+    rules = list(rules) or None
 
     if scope == "file":
-        violations = validator.validate_file(path)
+        violations = validator.validate_file(path, rules)
     elif scope == "directory":
-        violations = validator.validate_directory(path)
+        violations = validator.validate_directory(path, rules)
     else:  # project
-        violations = validator.validate_project(path)
+        violations = validator.validate_project(path, rules)
 
     report = validator.format_report(violations)
     click.echo(report)
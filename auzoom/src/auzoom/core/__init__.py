@@ -1,7 +1,20 @@
 """AuZoom core parsing and validation components."""
 
-from .parsing.parser import PythonParser
-from .graph.lazy_graph import LazyCodeGraph
-from .validator import CodeValidator, Violation
+from importlib import import_module
 
 __all__ = ["PythonParser", "LazyCodeGraph", "CodeValidator", "Violation"]
+
+# Imported on first access: submodules such as core.budget_planner must not
+# pull in tree-sitter just by living in this package
+_LAZY_EXPORTS = {
+    "PythonParser": ".parsing.parser",
+    "LazyCodeGraph": ".graph.lazy_graph",
+    "CodeValidator": ".validator",
+    "Violation": ".validator",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        return getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
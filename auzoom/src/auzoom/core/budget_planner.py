@@ -0,0 +1,153 @@
+"""Per-node detail level selection under a token budget."""
+
+import json
+from typing import Optional
+from ..models import CodeNode, FetchLevel, estimate_tokens
+
+LEVELS = (FetchLevel.SKELETON, FetchLevel.SUMMARY, FetchLevel.FULL)
+
+# Value of showing a node at (omitted, skeleton, summary, full), by role.
+# The target at full outweighs everything else. After that coverage comes
+# first (a skeleton is worth far more than any upgrade, neighbours before
+# unrelated nodes), then neighbours at summary, then any remaining detail.
+ROLE_VALUES = {
+    "target": (0, 20000, 30000, 40000),
+    "neighbor": (0, 1200, 1500, 1550),
+    "other": (0, 1000, 1050, 1060),
+}
+
+MAX_UNITS = 512  # DP capacity; costs are bucketed so large budgets stay cheap
+
+
+def estimate_node_tokens(node: CodeNode) -> list[int]:
+    """Token estimates for a node at skeleton, summary and full level."""
+    return [
+        estimate_tokens(json.dumps(node.to_skeleton())),
+        estimate_tokens(json.dumps(node.to_summary())),
+        estimate_tokens(json.dumps(node.to_full())),
+    ]
+
+
+def node_roles(nodes: list[CodeNode], targets: set[str]) -> list[str]:
+    """Classify nodes as target, neighbor (linked to a target) or other.
+
+    Neighbours are the target's parent and children, callers (dependents)
+    and callees (nodes listing the target as a dependent).
+    """
+    neighbors = set()
+    for node in nodes:
+        if node.id in targets:
+            neighbors.update(node.children)
+            neighbors.update(node.dependents)
+            neighbors.update(n.id for n in nodes if node.id in n.children)
+        elif targets.intersection(node.dependents):
+            neighbors.add(node.id)
+    neighbors -= targets
+    return [
+        "target" if n.id in targets else "neighbor" if n.id in neighbors else "other"
+        for n in nodes
+    ]
+
+
+def plan_levels(costs: list[list[int]], roles: list[str], budget: int) -> list[Optional[FetchLevel]]:
+    """Choose one level per node maximizing value within budget_tokens.
+
+    A multiple-choice knapsack: each node is omitted or shown at exactly
+    one level. Costs are bucketed to at most MAX_UNITS capacity units
+    (rounded up, so the plan never exceeds the budget).
+
+    Args:
+        costs: Per node, token estimates for (skeleton, summary, full)
+        roles: Per node, "target", "neighbor" or "other"
+        budget: Token budget
+
+    Returns:
+        Per node, the chosen FetchLevel, or None if omitted
+    """
+    unit = max(1, -(-budget // MAX_UNITS))
+    capacity = budget // unit
+    best = [0] * (capacity + 1)  # best[c] = max value using at most c units
+    choices = []  # choices[i][c] = option picked for node i at capacity c
+
+    for node_costs, role in zip(costs, roles):
+        values = ROLE_VALUES[role]
+        weights = [0] + [-(-cost // unit) for cost in node_costs]
+        picked = bytearray(capacity + 1)
+        new_best = list(best)
+        for option in (1, 2, 3):
+            weight, value = weights[option], values[option]
+            for c in range(weight, capacity + 1):
+                candidate = best[c - weight] + value
+                if candidate > new_best[c]:
+                    new_best[c] = candidate
+                    picked[c] = option
+        best = new_best
+        choices.append(picked)
+
+    plan: list[Optional[FetchLevel]] = [None] * len(costs)
+    c = capacity
+    for i in range(len(costs) - 1, -1, -1):
+        option = choices[i][c]
+        if option:
+            plan[i] = LEVELS[option - 1]
+            c -= -(-costs[i][option - 1] // unit)
+    return plan
+
+
+def read_within_budget(
+    graph,
+    file_path: str,
+    budget_tokens: int,
+    target: Optional[str] = None,
+    format: str = "standard",
+    fields: Optional[list[str]] = None
+) -> dict:
+    """Serialize a file's code nodes at per-node levels fitting a token budget.
+
+    Args:
+        graph: LazyCodeGraph owning the file
+        file_path: Resolved path of a Python file
+        budget_tokens: Budget for the serialized nodes (imports excluded)
+        target: Node ID, qualified name or bare name to zoom into
+        format: Serialization format ("standard" or "compact")
+        fields: Optional list of fields to include
+
+    Returns:
+        Dict with imports, nodes (each tagged with its "level"), omitted
+        node IDs, matched targets and the planned token estimate
+
+    Raises:
+        RuntimeError: If the file cannot be loaded
+    """
+    errors = graph.load_files([file_path])
+    if errors:
+        raise RuntimeError(errors[file_path])
+
+    imports, nodes = graph.serializer.split_imports(graph.file_nodes(file_path))
+
+    targets = {
+        n.id for n in nodes
+        if target and (n.id == target or n.id.endswith(f"::{target}") or n.name == target)
+    }
+    costs = [graph.get_token_estimates(n) for n in nodes]
+    plan = plan_levels(costs, node_roles(nodes, targets), budget_tokens)
+
+    serialized = []
+    omitted = []
+    planned_tokens = 0
+    for node, level, node_costs in zip(nodes, plan, costs):
+        if level is None:
+            omitted.append(node.id)
+            continue
+        planned_tokens += node_costs[LEVELS.index(level)]
+        entry = graph.serializer.serialize([node], level, format, fields, relative_to=str(graph.project_root))[0]
+        entry["level"] = level.value
+        serialized.append(entry)
+
+    return {
+        "imports": imports,
+        "nodes": serialized,
+        "omitted": omitted,
+        "targets": sorted(targets),
+        "planned_tokens": planned_tokens
+    }
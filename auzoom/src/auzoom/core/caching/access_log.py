@@ -0,0 +1,106 @@
+"""Persisted, decayed per-file access frequency for startup cache warming."""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+from .work_pool import BACKGROUND, PriorityWorkPool
+
+DEFAULT_HALF_LIFE_DAYS = 7.0
+MAX_ENTRIES = 2000  # Lowest-scored files are dropped when saving
+SAVE_EVERY = 25  # Accesses between automatic (background) saves
+
+
+class AccessLog:
+    """Count how often each file is read, favouring recent use.
+
+    Every foreground read adds 1 to the file's score, and scores halve
+    every half-life, so ``top(n)`` ranks what agents have been reading
+    lately. Scores are stored with the time they were last updated and
+    decayed lazily. The log also measures, for this process, how many
+    first reads of a file found it already in memory (the warm hit rate).
+    Automatic saves run on a background writer thread, never on the
+    reading thread; ``close`` flushes the log at shutdown.
+
+    Args:
+        log_file: JSON file the scores persist in
+        half_life_days: Days for an unused file's score to halve
+    """
+
+    def __init__(self, log_file: Path, half_life_days: float = DEFAULT_HALF_LIFE_DAYS):
+        self.log_file = Path(log_file)
+        self.half_life = half_life_days * 86400
+        self.entries = self._load()  # path -> [score, updated_at]
+        self.first_reads = 0
+        self.warm_hits = 0
+        self._seen = set()
+        self._unsaved = 0
+        self._lock = threading.Lock()
+        self._writer = PriorityWorkPool(self.save, 1, name="auzoom-access-log")
+
+    def _load(self) -> dict:
+        """Load persisted scores (empty on first run or corruption)."""
+        try:
+            return json.loads(self.log_file.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def record(self, file_path: str, in_memory: bool, now: Optional[float] = None):
+        """Count one foreground read; in_memory says whether it was served without loading."""
+        now = time.time() if now is None else now
+        with self._lock:
+            if file_path not in self._seen:
+                self._seen.add(file_path)
+                self.first_reads += 1
+                self.warm_hits += in_memory
+            self.entries[file_path] = [self._decayed(file_path, now) + 1.0, now]
+            self._unsaved += 1
+            due = self._unsaved >= SAVE_EVERY
+        if due:
+            self._writer.submit("save", priority=BACKGROUND)
+
+    def _decayed(self, file_path: str, now: float) -> float:
+        """Score of a file as of now."""
+        score, updated_at = self.entries.get(file_path, (0.0, now))
+        return score * 0.5 ** (max(0.0, now - updated_at) / self.half_life)
+
+    def top(self, n: int, now: Optional[float] = None) -> list[str]:
+        """The n highest-scoring files that still exist, best first."""
+        now = time.time() if now is None else now
+        with self._lock:
+            ranked = sorted(self.entries, key=lambda p: self._decayed(p, now), reverse=True)
+        return [p for p in ranked if os.path.exists(p)][:n]
+
+    def stats(self) -> dict:
+        """Warm hit rate of this process's first reads."""
+        rate = self.warm_hits / self.first_reads if self.first_reads else 0
+        return {
+            "first_reads": self.first_reads,
+            "warm_hits": self.warm_hits,
+            "warm_hit_rate": f"{rate:.1%}",
+            "tracked_files": len(self.entries),
+        }
+
+    def save(self):
+        """Persist scores atomically, keeping the MAX_ENTRIES highest."""
+        now = time.time()
+        with self._lock:
+            if not self._unsaved:
+                return
+            kept = sorted(self.entries, key=lambda p: self._decayed(p, now), reverse=True)[:MAX_ENTRIES]
+            self.entries = {p: self.entries[p] for p in kept}
+            snapshot = json.dumps(self.entries)
+            self._unsaved = 0
+        tmp_file = self.log_file.with_name(f"{self.log_file.name}.{threading.get_ident()}.tmp")
+        try:
+            tmp_file.write_text(snapshot)
+            os.replace(tmp_file, self.log_file)
+        except OSError:
+            pass  # Warming is an optimization; a lost save only costs ranking history
+
+    def close(self):
+        """Wait for a queued background save, then persist what is left."""
+        self._writer.shutdown()
+        self.save()
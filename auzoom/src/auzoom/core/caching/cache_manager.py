@@ -2,6 +2,8 @@
 
 import json
 import hashlib
+import os
+import threading
 from pathlib import Path
 from typing import Optional, Union
 from datetime import datetime
@@ -16,6 +18,7 @@ class CacheManager:
         self.metadata_dir.mkdir(parents=True, exist_ok=True)
         self.index_file = cache_dir / "index.json"
         self.file_index = self._load_index()
+        self._index_lock = threading.Lock()
 
     def _load_index(self) -> dict:
         """Load file index from cache."""
@@ -27,8 +30,16 @@ class CacheManager:
         return {}
 
     def save_index(self):
-        """Save file index to cache."""
-        self.index_file.write_text(json.dumps(self.file_index, indent=2))
+        """Save file index to cache.
+
+        Safe to call from several parsing threads: a snapshot of the index is
+        serialized and swapped in atomically under a lock.
+        """
+        with self._index_lock:
+            snapshot = dict(self.file_index)
+            tmp_file = self.index_file.with_name(f"{self.index_file.name}.{threading.get_ident()}.tmp")
+            tmp_file.write_text(json.dumps(snapshot, indent=2))
+            os.replace(tmp_file, self.index_file)
 
     def compute_hash(self, file_path: Union[str, Path]) -> str:
         """Compute SHA256 hash of file contents."""
@@ -1,10 +1,13 @@
 """Cache warming and entry point discovery for lazy code graph."""
 
+import os
+import sys
 import threading
-import time
 from pathlib import Path
 from ...models import FetchLevel
 
+DEFAULT_WARM_TOP_N = 50
+
 
 class CacheWarmer:
     """Handle cache warming and entry point discovery."""
@@ -63,11 +66,12 @@ class CacheWarmer:
             level: Fetch level to cache
         """
         def warm_thread():
+            self.graph.telemetry.set_origin("warmer")
             for path in file_paths:
                 try:
                     self.graph.get_file(path, level)
                 except Exception as e:
-                    print(f"Warning: Failed to warm {path}: {e}")
+                    print(f"Warning: Failed to warm {path}: {e}", file=sys.stderr)
 
         thread = threading.Thread(target=warm_thread, daemon=True)
         thread.start()
@@ -80,8 +84,8 @@ class CacheWarmer:
         if not entry_points:
             return
 
-        print(f"Info: Warming cache for {len(entry_points)} entry points...")
-        self.warm_cache(entry_points)
+        print(f"Info: Warming cache for {len(entry_points)} entry points...", file=sys.stderr)
+        return self.warm_cache(entry_points)
 
     def preload_discovered(self, limit: int = 10):
         """Parse discovered but not-yet-indexed files.
@@ -93,19 +97,30 @@ class CacheWarmer:
         paths = [f["path"] for f in discovered]
 
         if paths:
-            print(f"Info: Preloading {len(paths)} discovered imports...")
-            self.warm_cache(paths)
+            print(f"Info: Preloading {len(paths)} discovered imports...", file=sys.stderr)
+            return self.warm_cache(paths)
 
-    def auto_warm_sequence(self):
-        """Background warming strategy."""
-        # Give main thread a head start
-        time.sleep(0.1)
+    def warm_frequent(self, limit: int = DEFAULT_WARM_TOP_N):
+        """Pre-parse the files read most often (decayed) in earlier runs."""
+        frequent = self.graph.access_log.top(limit)
 
-        # 1. Warm entry points
-        self.warm_entry_points()
+        if frequent:
+            print(f"Info: Warming cache for {len(frequent)} frequently read files...", file=sys.stderr)
+            return self.warm_cache(frequent)
 
-        # 2. Wait for entry points to finish discovering imports
-        time.sleep(0.5)
+    def auto_warm_sequence(self):
+        """Background warming strategy.
 
-        # 3. Warm discovered imports
-        self.preload_discovered(limit=10)
+        Each step waits for the previous one instead of sleeping: the most
+        frequently read files first (AUZOOM_WARM_TOP_N), then entry points,
+        then the imports those entry points discovered.
+        """
+        steps = [
+            lambda: self.warm_frequent(int(os.environ.get("AUZOOM_WARM_TOP_N", DEFAULT_WARM_TOP_N))),
+            self.warm_entry_points,
+            lambda: self.preload_discovered(limit=10),
+        ]
+        for step in steps:
+            thread = step()
+            if thread:
+                thread.join()
@@ -0,0 +1,51 @@
+"""Content-hash keyed JSON index files with a small in-memory LRU."""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable
+
+DEFAULT_MEMORY_ENTRIES = 32
+
+
+class HashIndexStore:
+    """Persist one derived index per file version under ``<content_hash>.json``.
+
+    Indexes are immutable for a given content hash, so there is nothing to
+    invalidate: an edited file simply hashes to a new name. Writes are
+    atomic (temp file + rename), so concurrent builders of the same index
+    are harmless.
+
+    Args:
+        index_dir: Directory for index files
+        memory_entries: Indexes kept in memory (least recently used dropped)
+    """
+
+    def __init__(self, index_dir: Path, memory_entries: int = DEFAULT_MEMORY_ENTRIES):
+        self.index_dir = Path(index_dir)
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self.memory_entries = memory_entries
+        self._memory: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, content_hash: str, build: Callable[[], object]):
+        """Index for content_hash: from memory, then disk, else build() and persist it."""
+        with self._lock:
+            if content_hash in self._memory:
+                self._memory.move_to_end(content_hash)
+                return self._memory[content_hash]
+        index_file = self.index_dir / f"{content_hash}.json"
+        try:
+            index = json.loads(index_file.read_text())
+        except (OSError, ValueError):
+            index = build()
+            tmp_file = index_file.with_name(f"{index_file.name}.{threading.get_ident()}.tmp")
+            tmp_file.write_text(json.dumps(index, separators=(",", ":")))
+            os.replace(tmp_file, index_file)
+        with self._lock:
+            self._memory[content_hash] = index
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+        return index
@@ -0,0 +1,130 @@
+"""Persisted newline-offset index for O(lines requested) range reads."""
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import threading
+from array import array
+from pathlib import Path
+from typing import Optional
+
+SCAN_CHUNK_BYTES = 1 << 20  # Read size while building an index
+_NEWLINE = re.compile(b"\n")
+
+
+class LineOffsetIndex:
+    """Byte offset of every line start, per file, keyed by content hash.
+
+    The first range read of a file scans it once in chunks, hashing and
+    recording line starts in the same pass. Offsets are stored as a flat
+    array of native uint64 (``<hash>.idx``: one entry per line plus the
+    file size as end sentinel), so files with identical content share an
+    index. A small manifest maps each path to the (mtime_ns, size, hash)
+    it was indexed at; while the stat matches, a range read mmaps the
+    index and the file and touches only the lines it returns.
+
+    Args:
+        index_dir: Directory holding ``files.json`` and ``*.idx`` files
+    """
+
+    def __init__(self, index_dir: Path):
+        self.index_dir = Path(index_dir)
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_file = self.index_dir / "files.json"
+        self.files = self._load_manifest()  # path -> [mtime_ns, size, hash]
+        self._lock = threading.Lock()
+
+    def _load_manifest(self) -> dict:
+        """Load the path -> stat/hash manifest."""
+        try:
+            return json.loads(self.manifest_file.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def content_hash(self, file_path: Path) -> str:
+        """Content hash of a file, indexing it first if it is new or changed."""
+        return self._entry(Path(file_path))[2]
+
+    def read_lines(self, file_path: Path, offset: int = 0, limit: Optional[int] = None) -> dict:
+        """Read lines [offset, offset + limit) without loading the whole file.
+
+        Args:
+            file_path: File to read
+            offset: First line (0-based)
+            limit: Maximum lines to return (None/0: to end of file)
+
+        Returns:
+            Dict with content (lines joined by newline), line_count,
+            total_lines, bytes_read and content_hash
+        """
+        file_path = Path(file_path)
+        _, size, content_hash = self._entry(file_path)
+        with open(self._idx_path(content_hash), "rb") as f:
+            total_lines = os.fstat(f.fileno()).st_size // 8 - 1
+            start_line = min(max(offset, 0), total_lines)
+            end_line = total_lines if not limit else min(total_lines, start_line + limit)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as index:
+                offsets = memoryview(index).cast("Q")
+                start, end = offsets[start_line], offsets[end_line]
+                offsets.release()
+
+        if end > start:
+            with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                chunk = data[start:end]
+        else:
+            chunk = b""
+        lines = chunk.decode("utf-8", errors="replace").splitlines()
+        return {
+            "content": "\n".join(lines),
+            "line_count": len(lines),
+            "total_lines": total_lines,
+            "bytes_read": len(chunk),
+            "content_hash": content_hash,
+        }
+
+    def _entry(self, file_path: Path) -> list:
+        """Manifest entry for a file, rebuilding its index if the stat changed."""
+        key = str(file_path)
+        stat = file_path.stat()
+        entry = self.files.get(key)
+        if (entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size
+                and self._idx_path(entry[2]).exists()):
+            return entry
+
+        content_hash, offsets = self._scan(file_path)
+        idx_path = self._idx_path(content_hash)
+        if not idx_path.exists():
+            tmp = idx_path.with_name(f"{idx_path.name}.{threading.get_ident()}.tmp")
+            with open(tmp, "wb") as f:
+                offsets.tofile(f)
+            os.replace(tmp, idx_path)
+
+        entry = [stat.st_mtime_ns, stat.st_size, content_hash]
+        with self._lock:
+            self.files[key] = entry
+            tmp = self.manifest_file.with_name(f"files.json.{threading.get_ident()}.tmp")
+            tmp.write_text(json.dumps(self.files))
+            os.replace(tmp, self.manifest_file)
+        return entry
+
+    def _scan(self, file_path: Path) -> tuple[str, array]:
+        """Hash a file and collect line-start offsets in one chunked pass."""
+        digest = hashlib.sha256()
+        offsets = array("Q", [0])
+        position = 0
+        last = b"\n"
+        with open(file_path, "rb") as f:
+            while chunk := f.read(SCAN_CHUNK_BYTES):
+                digest.update(chunk)
+                offsets.extend(position + m.end() for m in _NEWLINE.finditer(chunk))
+                position += len(chunk)
+                last = chunk[-1:]
+        if last != b"\n":
+            offsets.append(position)  # Unterminated last line ends at EOF
+        return digest.hexdigest()[:8], offsets
+
+    def _idx_path(self, content_hash: str) -> Path:
+        """Offset array file for a content hash."""
+        return self.index_dir / f"{content_hash}.idx"
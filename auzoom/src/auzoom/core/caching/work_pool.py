@@ -0,0 +1,96 @@
+"""Bounded, de-duplicating priority worker pool for background cache work."""
+
+import itertools
+import queue
+import sys
+import threading
+from typing import Callable, Hashable
+
+FOREGROUND = 0  # Work a tool call is waiting to benefit from
+BACKGROUND = 1  # Speculative work (warming, prefetch)
+_STOP = 2  # Sorts after all real work, so shutdown drains the queue first
+
+
+class PriorityWorkPool:
+    """Run ``work(*args)`` on at most max_workers threads, once per key.
+
+    A key that is queued or running is not submitted again; submitting it
+    at a higher priority re-queues it ahead of background work, and the
+    stale lower-priority entry is skipped when it surfaces. Threads are
+    started lazily on first submit. ``shutdown`` lets queued work finish
+    (up to a timeout) before the workers exit.
+
+    Args:
+        work: Callable run for each job; exceptions are logged to stderr
+        max_workers: Maximum worker threads
+        name: Thread name prefix
+    """
+
+    def __init__(self, work: Callable, max_workers: int = 2, name: str = "auzoom-pool"):
+        self.work = work
+        self.max_workers = max(1, max_workers)
+        self.name = name
+        self.stats = {"submitted": 0, "deduplicated": 0, "completed": 0, "failed": 0}
+        self._queue: queue.PriorityQueue = queue.PriorityQueue()
+        self._in_flight: dict[Hashable, int] = {}  # key -> best queued priority
+        self._seq = itertools.count()  # FIFO within a priority
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, key: Hashable, *args, priority: int = FOREGROUND) -> bool:
+        """Queue work for key unless it is already in flight at this priority or better.
+
+        Returns:
+            True if a job was queued
+        """
+        with self._lock:
+            if self._closed:
+                return False
+            queued = self._in_flight.get(key)
+            if queued is not None and queued <= priority:
+                self.stats["deduplicated"] += 1
+                return False
+            self._in_flight[key] = priority
+            self.stats["submitted"] += 1
+            if len(self._threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._worker, name=f"{self.name}-{len(self._threads)}", daemon=True
+                )
+                self._threads.append(thread)
+                thread.start()
+        self._queue.put((priority, next(self._seq), key, args))
+        return True
+
+    def pending(self) -> int:
+        """Keys queued or running."""
+        with self._lock:
+            return len(self._in_flight)
+
+    def shutdown(self, timeout: float = 5.0):
+        """Stop accepting work, let queued jobs finish, then stop the workers."""
+        with self._lock:
+            self._closed = True
+            threads = list(self._threads)
+        for _ in threads:
+            self._queue.put((_STOP, next(self._seq), None, ()))
+        for thread in threads:
+            thread.join(timeout)
+
+    def _worker(self):
+        while True:
+            priority, _, key, args = self._queue.get()
+            if priority == _STOP:
+                return
+            with self._lock:
+                if self._in_flight.get(key) != priority:
+                    continue  # Superseded by a higher-priority entry, or already done
+            try:
+                self.work(*args)
+                outcome = "completed"
+            except Exception as e:
+                print(f"Warning: {self.name} job {key!r} failed: {e}", file=sys.stderr)
+                outcome = "failed"
+            with self._lock:
+                self._in_flight.pop(key, None)
+                self.stats[outcome] += 1
@@ -0,0 +1,91 @@
+"""Streaming JSON tokenizer over bytes/mmap: walk children without parsing values."""
+
+import json
+import mmap
+import re
+from typing import Iterator, Union
+
+Buffer = Union[bytes, mmap.mmap]
+
+_WS = re.compile(rb'[ \t\r\n]*')
+_STRING = re.compile(rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"', re.S)
+_SCALAR = re.compile(rb'[^ \t\r\n,:\]}]+')
+# Everything up to the next bracket outside a string, in one C-level match
+_SKIP = re.compile(rb'(?:[^"{}\[\]]++|"[^"\\]*+(?:\\.[^"\\]*+)*+")*+', re.S)
+
+_OPEN = {ord('{'): ord('}'), ord('['): ord(']')}
+_KINDS = {ord('{'): "object", ord('['): "array", ord('"'): "string", ord('t'): "boolean",
+          ord('f'): "boolean", ord('n'): "null"}
+
+
+def root(buf: Buffer) -> tuple[int, int]:
+    """Byte range of the top-level value."""
+    start = _WS.match(buf, 0).end()
+    return start, value_end(buf, start)
+
+
+def value_kind(buf: Buffer, start: int, end: int) -> str:
+    """JSON type of the value starting at start."""
+    return _KINDS.get(buf[start], "number")
+
+
+def value_end(buf: Buffer, pos: int) -> int:
+    """End offset of the value starting at pos, skipping nested content unparsed."""
+    first = buf[pos]
+    if first == ord('"'):
+        return _match(_STRING, buf, pos).end()
+    if first not in _OPEN:
+        return _match(_SCALAR, buf, pos).end()
+    depth = 0
+    while True:
+        pos = _SKIP.match(buf, pos).end()
+        if pos >= len(buf) or buf[pos] == ord('"'):
+            raise ValueError(f"Unterminated container or string at byte {pos}")
+        depth += 1 if buf[pos] in _OPEN else -1
+        pos += 1
+        if depth == 0:
+            return pos
+
+
+def iter_children(buf: Buffer, start: int, end: int) -> Iterator[tuple[Union[str, int], int, int]]:
+    """Yield (key or index, value start, value end) for an object or array.
+
+    Each child value is skipped with value_end, so one call costs a scan
+    of the container without materializing anything below it.
+    """
+    opener = buf[start]
+    if opener not in _OPEN:
+        return
+    closer = _OPEN[opener]
+    pos = _WS.match(buf, start + 1).end()
+    if buf[pos] == closer:
+        return
+    index = 0
+    while True:
+        if opener == ord('{'):
+            key_match = _match(_STRING, buf, pos)
+            key = json.loads(key_match.group())
+            pos = _WS.match(buf, key_match.end()).end()
+            if buf[pos] != ord(':'):
+                raise ValueError(f"Expected ':' at byte {pos}")
+            pos = _WS.match(buf, pos + 1).end()
+        else:
+            key = index
+        child_end = value_end(buf, pos)
+        yield key, pos, child_end
+        index += 1
+        pos = _WS.match(buf, child_end).end()
+        if buf[pos] == ord(','):
+            pos = _WS.match(buf, pos + 1).end()
+        elif buf[pos] == closer:
+            return
+        else:
+            raise ValueError(f"Expected ',' or closing bracket at byte {pos}")
+
+
+def _match(pattern: re.Pattern, buf: Buffer, pos: int) -> re.Match:
+    """Anchored match that reports the offset on malformed input."""
+    match = pattern.match(buf, pos)
+    if not match:
+        raise ValueError(f"Malformed JSON at byte {pos}")
+    return match
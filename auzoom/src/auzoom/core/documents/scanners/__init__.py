@@ -0,0 +1,7 @@
+"""Streaming scanners that pull summary structure out of non-Python files.
+
+Each scanner is fed a file's lines (or pieces of very long lines) once,
+in order, and keeps only the bounded structure it reports.
+"""
+
+MAX_KEYS = 10  # Keys / imports / exports listed per summary
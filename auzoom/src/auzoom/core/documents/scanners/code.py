@@ -0,0 +1,62 @@
+"""Imports and exports of JS/TS/Go/Rust/Java source files."""
+
+import re
+from . import MAX_KEYS
+
+MAX_STATEMENT_LINES = 20  # Lines buffered for one multi-line import statement
+
+
+class CodeScanner:
+    """Imports and exports of JS/TS/Go/Rust/Java files, line by line.
+
+    Import statements spanning several lines (``import {\\n a,\\n} from 'x'``,
+    ``use a::{\\n b};``) are buffered up to MAX_STATEMENT_LINES.
+    """
+
+    PATTERNS = {
+        'JavaScript': (r'import\s+.*?\s+from\s+[\'"]([^\'"]+)[\'"]',
+                       r'export\s+(?:function|class|const|interface|type|enum)\s+(\w+)'),
+        'Go': (r'import\s+[\'"]([^\'"]+)[\'"]', r'func\s+([A-Z]\w+)'),
+        'Rust': (r'use\s+([^;]+);', r'pub\s+(?:fn|struct|enum|trait)\s+(\w+)'),
+        'Java': (r'import\s+([^;]+);', r'public\s+(?:class|interface|enum)\s+(\w+)'),
+    }
+    PATTERNS['TypeScript'] = PATTERNS['JavaScript']
+
+    def __init__(self, lang: str):
+        self.lang = lang
+        imports, exports = self.PATTERNS[lang]
+        self._imports = re.compile(imports, re.DOTALL)
+        self._exports = re.compile(exports)
+        self._statement_start = re.compile(r'\s*(?:import|use)\b')
+        self.imports = []
+        self.exports = []
+        self.exports_default = False
+        self._buffer = []
+
+    def feed(self, piece: str):
+        if self._buffer or self._statement_start.match(piece):
+            self._buffer.append(piece)
+            if (';' in piece or not piece.strip() or len(self._buffer) >= MAX_STATEMENT_LINES
+                    or self._imports.search("".join(self._buffer))):
+                self._flush()
+        if len(self.exports) < MAX_KEYS:
+            self.exports.extend(self._exports.findall(piece)[:MAX_KEYS - len(self.exports)])
+        if self.lang in ('JavaScript', 'TypeScript') and re.search(r'export\s+default', piece):
+            self.exports_default = True
+
+    def _flush(self):
+        if len(self.imports) < MAX_KEYS:
+            statement = "".join(self._buffer)
+            self.imports.extend(self._imports.findall(statement)[:MAX_KEYS - len(self.imports)])
+        self._buffer = []
+
+    def result(self) -> str:
+        if self._buffer:
+            self._flush()
+        exports = self.exports + (['default'] if self.exports_default else [])
+        result = []
+        if self.imports:
+            result.append(f"Imports: {', '.join(self.imports[:MAX_KEYS])}")
+        if exports:
+            result.append(f"Exports: {', '.join(exports[:MAX_KEYS])}")
+        return "\n".join(result)
@@ -0,0 +1,17 @@
+"""Markdown-style header lines of text documents."""
+
+
+class HeaderScanner:
+    """Collect Markdown-style '#' header lines."""
+
+    def __init__(self):
+        self.headers = []
+        self._line_start = True
+
+    def feed(self, piece: str):
+        if self._line_start:
+            stripped = piece.strip()
+            if stripped.startswith('#'):
+                # Preserve indentation level (# vs ## vs ###)
+                self.headers.append(stripped)
+        self._line_start = piece.endswith("\n")
@@ -0,0 +1,102 @@
+"""Top-level keys of JSON documents, scanned incrementally."""
+
+import json
+import re
+from . import MAX_KEYS
+
+MAX_KEY_CHARS = 200  # Longer JSON keys are truncated
+
+
+class JsonKeyScanner:
+    """Top-level object keys from an incremental scan (no json.loads).
+
+    Only nesting depth and string state are tracked, and the scan jumps
+    between structural characters with regexes, so memory is bounded by
+    MAX_KEYS keys of MAX_KEY_CHARS each however large the document is.
+    Collection stops once MAX_KEYS are found, the top-level object closes,
+    or the document turns out not to be an object.
+    """
+
+    _STRUCTURAL = re.compile(r'["{}\[\]]')
+    _STRING_SPECIAL = re.compile(r'["\\]')
+    _NON_SPACE = re.compile(r'\S')
+
+    def __init__(self):
+        self.keys = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False  # Backslash was the last char of the previous piece
+        self._string = []
+        self._string_chars = 0
+        self._pending_key = None  # Depth-1 string that becomes a key if ':' follows
+        self._done = False
+
+    def feed(self, piece: str):
+        i, n = 0, len(piece)
+        while i < n and not self._done:
+            if self._in_string:
+                if self._escape:
+                    self._collect(piece[i])
+                    self._escape = False
+                    i += 1
+                    continue
+                match = self._STRING_SPECIAL.search(piece, i)
+                end = match.start() if match else n
+                self._collect(piece[i:end])
+                if not match:
+                    return
+                i = end + 1
+                if match.group() == '\\':
+                    self._collect('\\')
+                    self._escape = True
+                else:
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._pending_key = "".join(self._string)
+            elif self._pending_key is not None or self._depth == 0:
+                match = self._NON_SPACE.search(piece, i)
+                if not match:
+                    return
+                char, i = match.group(), match.end()
+                if self._pending_key is not None:
+                    if char == ':':
+                        self.keys.append(_unescape(self._pending_key))
+                        self._done = len(self.keys) >= MAX_KEYS
+                    else:
+                        i -= 1  # Re-scan it as structure
+                    self._pending_key = None
+                elif char == '{':
+                    self._depth = 1
+                else:
+                    self._done = True  # Top level is an array or scalar
+            else:
+                match = self._STRUCTURAL.search(piece, i)
+                if not match:
+                    return
+                char, i = match.group(), match.end()
+                if char == '"':
+                    self._in_string = True
+                    self._string, self._string_chars = [], 0
+                elif char in '{[':
+                    self._depth += 1
+                else:
+                    self._depth -= 1
+                    self._done = self._depth == 0
+
+    def _collect(self, text: str):
+        """Keep up to MAX_KEY_CHARS of a depth-1 string."""
+        if self._depth == 1 and self._string_chars < MAX_KEY_CHARS:
+            text = text[:MAX_KEY_CHARS - self._string_chars]
+            self._string.append(text)
+            self._string_chars += len(text)
+
+    def result(self) -> str:
+        return "Top-level keys: " + ", ".join(self.keys) if self.keys else ""
+
+
+def _unescape(raw: str) -> str:
+    """Decode JSON string escapes (raw text is kept if truncation broke one)."""
+    try:
+        return json.loads(f'"{raw}"')
+    except ValueError:
+        return raw
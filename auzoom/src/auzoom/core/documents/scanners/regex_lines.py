@@ -0,0 +1,24 @@
+"""Line-anchored regex matches (YAML top-level keys, TOML sections)."""
+
+import re
+from . import MAX_KEYS
+
+
+class RegexScanner:
+    """First MAX_KEYS line-anchored matches of one pattern."""
+
+    def __init__(self, pattern: re.Pattern, label: str):
+        self.pattern = pattern
+        self.label = label
+        self.matches = []
+        self._line_start = True
+
+    def feed(self, piece: str):
+        if self._line_start and len(self.matches) < MAX_KEYS:
+            match = self.pattern.match(piece)
+            if match:
+                self.matches.append(match.group(1))
+        self._line_start = piece.endswith("\n")
+
+    def result(self) -> str:
+        return f"{self.label}: " + ", ".join(self.matches) if self.matches else ""
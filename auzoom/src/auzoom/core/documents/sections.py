@@ -0,0 +1,181 @@
+"""Heading index for Markdown/reStructuredText: read one section by path or index."""
+
+import mmap
+import re
+from pathlib import Path
+from typing import Union
+
+from ..caching.index_store import HashIndexStore
+
+SECTION_SUFFIXES = (".md", ".markdown", ".rst", ".txt")
+MAX_SECTION_BYTES = 512 * 1024
+PATH_SEPARATOR = "/"
+
+_ATX = re.compile(rb'^ {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$')
+_SETEXT = re.compile(rb'^ {0,3}(=+|-+)[ \t]*$')
+_FENCE = re.compile(rb'^ {0,3}(`{3,}|~{3,})')
+_RST_ADORNMENT = re.compile(rb'^([=\-`:\'"~^_*+#<>.!$%&(),/;?@\[\]\\{|}])\1+[ \t]*$')
+
+# Index rows: [title, depth, start byte, end byte, first line, last line, parent row or -1]
+TITLE, DEPTH, START, END, LINE, LAST_LINE, PARENT = range(7)
+
+
+class SectionIndex:
+    """Locate and read document sections without reading the whole file.
+
+    One line-by-line pass records every heading (ATX and setext headings
+    for Markdown, skipping fenced code and front matter; underlined or
+    over-and-underlined titles for reStructuredText, ranked by first use of
+    each adornment style) with the byte range of its section: up to the
+    next heading at the same or a shallower depth. Rows are persisted per
+    content hash, so later reads mmap the file and slice one range.
+
+    Args:
+        index_dir: Directory for persisted heading indexes
+    """
+
+    def __init__(self, index_dir: Path):
+        self.indexes = HashIndexStore(index_dir)
+
+    def headings(self, file_path: Path, content_hash: str) -> list[list]:
+        """All heading rows of one file version, in document order."""
+        return self.indexes.get(content_hash, lambda: _scan(file_path))
+
+    def outline(self, rows: list[list], row: int = -1) -> list[dict]:
+        """Headings nested under a row (-1: the whole document)."""
+        depth, start, end = (0, 0, float("inf")) if row < 0 else (rows[row][DEPTH], rows[row][START], rows[row][END])
+        return [
+            {"index": i, "title": r[TITLE], "depth": r[DEPTH], "line": r[LINE], "bytes": r[END] - r[START]}
+            for i, r in enumerate(rows)
+            if i != row and start <= r[START] < end and r[DEPTH] > depth
+        ]
+
+    def describe(self, rows: list[list], row: int) -> dict:
+        """Position of one section: index, heading path and line range."""
+        return {
+            "index": row,
+            "path": section_path(rows, row),
+            "line_start": rows[row][LINE],
+            "line_end": rows[row][LAST_LINE],
+        }
+
+    def read(self, file_path: Path, row: list) -> dict:
+        """Text of one section, heading included."""
+        start, end = row[START], row[END]
+        with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            raw = data[start:min(end, start + MAX_SECTION_BYTES)]
+        return {
+            "content": raw.decode("utf-8", errors="replace").rstrip("\n"),
+            "truncated": end - start > MAX_SECTION_BYTES,
+        }
+
+
+def find_section(rows: list[list], selector: Union[int, str]) -> int:
+    """Row number of the section addressed by selector.
+
+    An int (or digit string) is a position in document order. Otherwise
+    the selector is a heading path such as "Design/Storage": the last part
+    names the heading and earlier parts name its ancestors, outermost
+    first (not necessarily every level). Titles compare case-insensitively.
+
+    Raises:
+        KeyError: (message, top-level titles) if nothing matches
+    """
+    if isinstance(selector, int) or str(selector).strip().isdigit():
+        position = int(selector)
+        if 0 <= position < len(rows):
+            return position
+        raise KeyError(f"Section index {position} out of range (0-{len(rows) - 1})", _top_titles(rows))
+
+    parts = [p.strip().lower() for p in str(selector).split(PATH_SEPARATOR) if p.strip()]
+    for i, row in enumerate(rows):
+        if row[TITLE].lower() == str(selector).strip().lower():
+            return i  # Whole selector is one title (may itself contain the separator)
+    for i, row in enumerate(rows):
+        if parts and row[TITLE].lower() == parts[-1] and _has_ancestors(rows, i, parts[:-1]):
+            return i
+    raise KeyError(f"No section matches {selector!r}", _top_titles(rows))
+
+
+def section_path(rows: list[list], row: int) -> list[str]:
+    """Titles from the outermost ancestor down to row."""
+    path = []
+    while row >= 0:
+        path.append(rows[row][TITLE])
+        row = rows[row][PARENT]
+    return path[::-1]
+
+
+def _has_ancestors(rows: list[list], row: int, wanted: list[str]) -> bool:
+    """True if wanted (outermost first) appear in order among row's ancestors."""
+    ancestors = [title.lower() for title in section_path(rows, row)[:-1]]
+    position = 0
+    for title in ancestors:
+        if position < len(wanted) and title == wanted[position]:
+            position += 1
+    return position == len(wanted)
+
+
+def _top_titles(rows: list[list]) -> list[str]:
+    """Titles of the shallowest headings (shown when a selector misses)."""
+    if not rows:
+        return []
+    top = min(r[DEPTH] for r in rows)
+    return [r[TITLE] for r in rows if r[DEPTH] == top][:20]
+
+
+def _scan(file_path: Path) -> list[list]:
+    """One pass over the file collecting heading rows with section ranges."""
+    rst = file_path.suffix == ".rst"
+    rows, rst_styles = [], []
+    fence = None
+    prev = None  # (start byte, line number, stripped bytes) of the previous line
+    before_prev = None
+    pos = line_no = 0
+    with open(file_path, "rb") as f:
+        for raw in f:
+            line_no += 1
+            line = raw.rstrip(b"\r\n")
+            heading = None  # (title bytes, depth key, start byte, line number)
+            if rst:
+                if (prev and prev[2] and _RST_ADORNMENT.match(line) and not _RST_ADORNMENT.match(prev[2])
+                        and len(line.rstrip()) >= len(prev[2].strip().decode("utf-8", errors="replace"))):
+                    overlined = before_prev is not None and before_prev[2] == line
+                    heading_start = before_prev if overlined else prev
+                    style = (line[:1], overlined)
+                    if style not in rst_styles:
+                        rst_styles.append(style)
+                    heading = (prev[2].strip(), rst_styles.index(style) + 1, heading_start[0], heading_start[1])
+            elif fence:
+                if line.lstrip().startswith(fence):
+                    fence = None
+                line = b""  # Fenced lines are never setext titles
+            elif _FENCE.match(line):
+                fence, line = _FENCE.match(line).group(1)[:3], b""
+            elif line_no == 1 and line == b"---":
+                fence, line = b"---", b""  # YAML front matter runs to the next ---
+            elif _ATX.match(line):
+                match = _ATX.match(line)
+                heading = ((match.group(2) or b"").strip(), len(match.group(1)), pos, line_no)
+            elif prev and prev[2].strip() and _SETEXT.match(line) and not _ATX.match(prev[2]):
+                heading = (prev[2].strip(), 1 if line.strip().startswith(b"=") else 2, prev[0], prev[1])
+            if heading:
+                rows.append([heading[0].decode("utf-8", errors="replace"), heading[1], heading[2], None, heading[3], None, -1])
+                line = b""  # A heading's underline never starts the next heading
+            before_prev, prev = prev, (pos, line_no, line)
+            pos += len(raw)
+    return _close_sections(rows, pos, line_no)
+
+
+def _close_sections(rows: list[list], size: int, total_lines: int) -> list[list]:
+    """Fill in section ends and parents: a section ends at the next heading at its depth or above."""
+    stack = []
+    for i, row in enumerate(rows):
+        while stack and rows[stack[-1]][DEPTH] >= row[DEPTH]:
+            closed = rows[stack.pop()]
+            closed[END], closed[LAST_LINE] = row[START], row[LINE] - 1
+        row[PARENT] = stack[-1] if stack else -1
+        stack.append(i)
+    for i in stack:
+        rows[i][END], rows[i][LAST_LINE] = size, total_lines
+    return rows
@@ -0,0 +1,227 @@
+"""Subtree reads of JSON/YAML/TOML files by key path, via a persisted key-offset index."""
+
+import json
+import mmap
+import os
+import tomllib
+from collections import deque
+from pathlib import Path
+from typing import Optional, Union
+
+from ..caching.index_store import HashIndexStore
+from . import json_tokens, yaml_blocks
+
+FORMATS = {".json": json_tokens, ".yaml": yaml_blocks, ".yml": yaml_blocks}
+STRUCTURED_SUFFIXES = (*FORMATS, ".toml")
+CONTAINER_KINDS = ("object", "array")
+INDEX_DEPTH = 3  # Levels below the root recorded in the persisted index
+MAX_INDEX_ENTRIES = 50000  # Per file; deeper lookups scan from the nearest indexed ancestor
+MAX_LISTED_CHILDREN = 200
+MAX_SUBTREE_BYTES = 512 * 1024
+
+
+def parse_key_path(key_path: str) -> list[str]:
+    """Split a JSON pointer ("/paths/~1users/get") or dotted path ("paths.servers.0").
+
+    "", "/" and "." all address the document root.
+    """
+    if key_path in ("", "/", "."):
+        return []
+    if key_path.startswith("/"):
+        return [t.replace("~1", "/").replace("~0", "~") for t in key_path[1:].split("/")]
+    return key_path.split(".")
+
+
+class StructureIndex:
+    """Navigate structured files without parsing them whole.
+
+    JSON and YAML are walked with streaming tokenizers (json_tokens,
+    yaml_blocks) that skip over values they do not need. The first read
+    of a file version records the byte range, kind and child keys of
+    every node down to INDEX_DEPTH in ``<content_hash>.json``; a lookup
+    starts from the deepest indexed ancestor of its path and scans only
+    that ancestor's bytes for the rest. TOML files are small in practice
+    and are read with tomllib; their subtrees are returned as JSON.
+
+    Args:
+        index_dir: Directory for persisted indexes
+    """
+
+    def __init__(self, index_dir: Path):
+        self.indexes = HashIndexStore(index_dir)
+
+    def read(self, file_path: Path, content_hash: str, key_path: str, level: str = "skeleton") -> dict:
+        """Read the node at key_path: child listing (skeleton) or its text (summary/full).
+
+        Raises:
+            KeyError: If a path segment does not exist (args: message, available keys)
+            ValueError: If the file is not well-formed enough to walk
+        """
+        tokens = parse_key_path(key_path)
+        if file_path.suffix == ".toml":
+            return _read_toml(file_path, tokens, level)
+
+        fmt = FORMATS[file_path.suffix]
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError("File is empty")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                index = self.indexes.get(content_hash, lambda: _build_index(fmt, buf))
+                start, end, kind = self._resolve(fmt, buf, index, tokens)
+                node = {"kind": kind, "bytes": end - start}
+                if level == "skeleton":
+                    pointer = _pointer(tokens)
+                    node.update(self._children(fmt, buf, index, pointer, start, end, kind))
+                else:
+                    node.update(_subtree_text(buf, start, end))
+                return node
+
+    def _resolve(self, fmt, buf, index: dict, tokens: list[str]) -> tuple[int, int, str]:
+        """Byte range and kind of the node at tokens."""
+        depth = len(tokens)
+        while _pointer(tokens[:depth]) not in index:
+            depth -= 1
+        start, end, kind = index[_pointer(tokens[:depth])][:3]
+        for position, token in enumerate(tokens[depth:], start=depth):
+            if kind not in CONTAINER_KINDS:
+                raise KeyError(f"{_pointer(tokens[:position]) or '/'} is a {kind}, not a container", [])
+            for key, child_start, child_end in fmt.iter_children(buf, start, end):
+                if str(key) == token:
+                    start, end = child_start, child_end
+                    kind = fmt.value_kind(buf, start, end)
+                    break
+            else:
+                available = [str(k) for k, _, _ in _take(fmt.iter_children(buf, start, end), 20)]
+                raise KeyError(f"Key {token!r} not found under {_pointer(tokens[:position]) or '/'}", available)
+        return start, end, kind
+
+    def _children(self, fmt, buf, index: dict, pointer: str, start: int, end: int, kind: str) -> dict:
+        """Child keys with kind, size and (for containers) child count."""
+        entry = index.get(pointer)
+        if entry and entry[4] is not None:
+            children = []
+            for key in entry[4][:MAX_LISTED_CHILDREN]:
+                child_start, child_end, child_kind, count, _ = index[_pointer_join(pointer, key)]
+                if count is None and child_kind in CONTAINER_KINDS:
+                    count = _count(fmt, buf, child_start, child_end)
+                children.append(_child(key, child_kind, child_end - child_start, count))
+            total = entry[3]
+        else:
+            children, total = [], 0
+            for key, child_start, child_end in fmt.iter_children(buf, start, end):
+                total += 1
+                if total <= MAX_LISTED_CHILDREN:
+                    child_kind = fmt.value_kind(buf, child_start, child_end)
+                    count = _count(fmt, buf, child_start, child_end) if child_kind in CONTAINER_KINDS else None
+                    children.append(_child(key, child_kind, child_end - child_start, count))
+        return {"children": children, "child_count": total, "truncated": total > len(children)}
+
+
+def _build_index(fmt, buf) -> dict:
+    """Breadth-first index: pointer -> [start, end, kind, child count, child keys].
+
+    Child count and keys stay None for containers below INDEX_DEPTH, and
+    child keys stay None where MAX_INDEX_ENTRIES cut the listing short.
+    """
+    start, end = fmt.root(buf)
+    index = {"": [start, end, fmt.value_kind(buf, start, end), None, None]}
+    queue = deque([("", 0)]) if index[""][2] in CONTAINER_KINDS else deque()
+    while queue:
+        pointer, depth = queue.popleft()
+        entry = index[pointer]
+        keys, count = [], 0
+        for key, child_start, child_end in fmt.iter_children(buf, entry[0], entry[1]):
+            count += 1
+            if keys is None or len(index) >= MAX_INDEX_ENTRIES:
+                keys = None
+                continue
+            child_pointer = _pointer_join(pointer, key)
+            child_kind = fmt.value_kind(buf, child_start, child_end)
+            index[child_pointer] = [child_start, child_end, child_kind, None, None]
+            keys.append(key)
+            if child_kind in CONTAINER_KINDS and depth + 1 < INDEX_DEPTH:
+                queue.append((child_pointer, depth + 1))
+        entry[3], entry[4] = count, keys
+    return index
+
+
+def _read_toml(file_path: Path, tokens: list[str], level: str) -> dict:
+    """Navigate a TOML file parsed with tomllib."""
+    value = tomllib.loads(file_path.read_text())
+    for position, token in enumerate(tokens):
+        if isinstance(value, dict) and token in value:
+            value = value[token]
+        elif isinstance(value, list) and token.isdigit() and int(token) < len(value):
+            value = value[int(token)]
+        else:
+            available = [str(k) for k in value][:20] if isinstance(value, dict) else []
+            raise KeyError(f"Key {token!r} not found under {_pointer(tokens[:position]) or '/'}", available)
+    text = json.dumps(value, indent=2, default=str)
+    node = {"kind": _toml_kind(value), "bytes": len(text.encode())}
+    if level != "skeleton":
+        node.update(_truncate(text))
+    elif isinstance(value, (dict, list)):
+        items = list(value.items() if isinstance(value, dict) else enumerate(value))
+        node["children"] = [
+            _child(key, _toml_kind(child), len(json.dumps(child, default=str)),
+                   len(child) if isinstance(child, (dict, list)) else None)
+            for key, child in items[:MAX_LISTED_CHILDREN]
+        ]
+        node.update(child_count=len(items), truncated=len(items) > MAX_LISTED_CHILDREN)
+    return node
+
+
+def _subtree_text(buf, start: int, end: int) -> dict:
+    """Decoded node text, dedented to the column where the node starts."""
+    raw = buf[start:min(end, start + MAX_SUBTREE_BYTES)]
+    first, *rest = raw.decode("utf-8", errors="replace").split("\n")
+    column = start - (buf.rfind(b"\n", 0, start) + 1) + len(first) - len(first.lstrip(" "))
+    indents = [len(line) - len(line.lstrip(" ")) for line in rest if line.strip()]
+    strip = min([column, *indents])
+    text = "\n".join([first.lstrip(" "), *(line[strip:] for line in rest)])
+    return {"content": text, "truncated": end - start > MAX_SUBTREE_BYTES}
+
+
+def _truncate(text: str) -> dict:
+    """Content capped at MAX_SUBTREE_BYTES."""
+    encoded = text.encode()
+    if len(encoded) <= MAX_SUBTREE_BYTES:
+        return {"content": text, "truncated": False}
+    return {"content": encoded[:MAX_SUBTREE_BYTES].decode(errors="ignore"), "truncated": True}
+
+
+def _count(fmt, buf, start: int, end: int) -> int:
+    """Number of children of a container (one scan of its bytes)."""
+    return sum(1 for _ in fmt.iter_children(buf, start, end))
+
+
+def _child(key: Union[str, int], kind: str, size: int, count: Optional[int]) -> dict:
+    """One entry of a skeleton child listing."""
+    child = {"key": key, "kind": kind, "bytes": size}
+    if count is not None:
+        child["children"] = count
+    return child
+
+
+def _toml_kind(value) -> str:
+    """Kind name for a parsed TOML value."""
+    if isinstance(value, dict):
+        return "object"
+    if isinstance(value, list):
+        return "array"
+    return type(value).__name__
+
+
+def _take(iterator, n: int) -> list:
+    """First n items of an iterator."""
+    return [item for _, item in zip(range(n), iterator)]
+
+
+def _pointer(tokens: list) -> str:
+    """Canonical JSON pointer for path tokens (index key)."""
+    return "".join("/" + str(t).replace("~", "~0").replace("/", "~1") for t in tokens)
+
+
+def _pointer_join(pointer: str, key: Union[str, int]) -> str:
+    """Pointer of a child node."""
+    return pointer + _pointer([key])
@@ -0,0 +1,84 @@
+"""Streaming metadata summaries for non-Python files (bounded memory)."""
+
+import re
+from pathlib import Path
+from typing import Iterator
+from .scanners.code import CodeScanner
+from .scanners.headers import HeaderScanner
+from .scanners.json_keys import JsonKeyScanner
+from .scanners.regex_lines import RegexScanner
+
+MAX_PIECE_CHARS = 64 * 1024  # Longer lines are scanned in pieces of this size
+
+TEXT_SUFFIXES = ('.md', '.txt', '.rst')
+CONFIG_SUFFIXES = ('.json', '.yaml', '.yml', '.toml')
+CODE_LANGUAGES = {
+    '.js': 'JavaScript',
+    '.jsx': 'JavaScript',
+    '.ts': 'TypeScript',
+    '.tsx': 'TypeScript',
+    '.go': 'Go',
+    '.rs': 'Rust',
+    '.java': 'Java'
+}
+
+
+def iter_pieces(file_path: Path) -> Iterator[str]:
+    """Yield the file's lines, splitting any line longer than MAX_PIECE_CHARS.
+
+    Only a piece ending in a newline completes a line, so minified files
+    with one enormous line are scanned without ever holding that line.
+    """
+    with open(file_path, encoding="utf-8", errors="replace") as f:
+        while piece := f.readline(MAX_PIECE_CHARS):
+            yield piece
+
+
+def summarize_file(file_path: Path) -> dict:
+    """Summarize a file in one streaming pass.
+
+    Returns:
+        Dict with summary text, line_count and size_bytes
+    """
+    file_path = Path(file_path)
+    suffix = file_path.suffix
+    if suffix in TEXT_SUFFIXES:
+        scanner = HeaderScanner()
+    elif suffix == '.json':
+        scanner = JsonKeyScanner()
+    elif suffix in ('.yaml', '.yml'):
+        scanner = RegexScanner(re.compile(r'^(\w+):'), "Top-level keys")
+    elif suffix == '.toml':
+        scanner = RegexScanner(re.compile(r'^\[([^\]]+)\]'), "Sections")
+    elif suffix in CODE_LANGUAGES:
+        scanner = CodeScanner(CODE_LANGUAGES[suffix])
+    else:
+        scanner = None
+
+    line_count = 0
+    ends_with_newline = True
+    for piece in iter_pieces(file_path):
+        ends_with_newline = piece.endswith("\n")
+        line_count += ends_with_newline
+        if scanner:
+            scanner.feed(piece)
+    line_count += not ends_with_newline  # Unterminated last line
+    size = file_path.stat().st_size
+
+    name = file_path.name
+    if suffix in TEXT_SUFFIXES:
+        headers = "\n".join(scanner.headers) or "No headers"
+        text = f"Document: {name}\nType: {suffix}\nLines: {line_count}\nHeaders:\n{headers}"
+    elif suffix in CONFIG_SUFFIXES:
+        text = f"Configuration: {name}\nType: {suffix}\nLines: {line_count}\nSize: {size} bytes"
+        structure = scanner.result()
+        if structure:
+            text += f"\n\nStructure:\n{structure}"
+    elif scanner:
+        text = f"Code file: {name}\nLanguage: {scanner.lang}\nLines: {line_count}"
+        structure = scanner.result()
+        if structure:
+            text += f"\n\n{structure}"
+    else:
+        text = f"File: {name}\nType: {suffix}\nLines: {line_count}\nSize: {size} bytes"
+    return {"summary": text, "line_count": line_count, "size_bytes": size}
@@ -0,0 +1,126 @@
+"""Indentation-based walker for block-style YAML over bytes/mmap.
+
+Covers the block mappings and sequences that config files and OpenAPI
+documents are written in. Flow collections (``{a: 1}``, ``[1, 2]``),
+block scalars and plain multi-line scalars are treated as opaque scalar
+values spanning their lines. Anchors, aliases and tags are not resolved.
+"""
+
+import json
+import re
+from typing import Iterator, Optional, Union
+
+from .json_tokens import Buffer
+
+_KEY = re.compile(rb'''(?P<key>"(?:[^"\\]|\\.)*"|'[^']*'|[^\s#'"\-?][^#]*?|-[^\s#][^#]*?)\s*:(?:[ \t\r]|$)''')
+_SEQUENCE_ITEM = re.compile(rb'-(?:[ \t\r]|$)')
+_DOCUMENT_MARKER = re.compile(rb'(?:---|\.\.\.)(?:[ \t\r]|$)')
+
+
+def root(buf: Buffer) -> tuple[int, int]:
+    """Byte range of the first document (directives and markers excluded)."""
+    start, end = 0, len(buf)
+    for content_start, indent, line_end in _lines(buf, 0, end):
+        line = buf[content_start:line_end]
+        if indent == 0 and (line.startswith(b"%") or _DOCUMENT_MARKER.match(line)):
+            start = min(line_end + 1, end)
+            continue
+        break  # First content line: the document runs to the next marker
+    for content_start, indent, line_end in _lines(buf, start, end):
+        if indent == 0 and _DOCUMENT_MARKER.match(buf[content_start:line_end]):
+            return start, content_start
+    return start, end
+
+
+def value_kind(buf: Buffer, start: int, end: int) -> str:
+    """"object", "array" or "scalar" for the value in [start, end)."""
+    first = _first_line(buf, start, end)
+    if first is None:
+        return "null"
+    line = buf[first[0]:first[2]]
+    if _SEQUENCE_ITEM.match(line):
+        return "array"
+    if _KEY.match(line):
+        return "object"
+    return "scalar"
+
+
+def iter_children(buf: Buffer, start: int, end: int) -> Iterator[tuple[Union[str, int], int, int]]:
+    """Yield (key or index, value start, value end) for a block mapping or sequence.
+
+    Children start on lines at the block's own indentation; everything
+    more indented (or a same-indent "- item" under a mapping key) belongs
+    to the preceding child. A value written on the key/dash line starts
+    there, mid-line, and its block is measured from that column.
+    """
+    kind = value_kind(buf, start, end)
+    if kind not in ("object", "array"):
+        return
+    block_indent = None
+    current = None  # [key, value start, value end]
+    index = 0
+    for content_start, indent, line_end in _lines(buf, start, end):
+        if block_indent is None:
+            block_indent = indent
+        line = buf[content_start:line_end]
+        starts_child = indent == block_indent and (
+            _SEQUENCE_ITEM.match(line) if kind == "array" else _KEY.match(line)
+        )
+        if not starts_child:
+            if current:
+                current[2] = line_end
+            continue
+        if current:
+            yield tuple(current)
+        if kind == "array":
+            key, value_offset = index, 1
+            index += 1
+        else:
+            match = _KEY.match(line)
+            key, value_offset = _unquote(match.group("key")), match.end()
+        inline = line[value_offset:].lstrip(b" \t")
+        if inline.strip() and not inline.startswith(b"#"):
+            value_start = line_end - len(inline)
+        else:
+            value_start = min(line_end + 1, end)
+        current = [key, value_start, max(line_end, value_start)]
+    if current:
+        yield tuple(current)
+
+
+def _first_line(buf: Buffer, start: int, end: int) -> Optional[tuple[int, int, int]]:
+    """First content line of a range."""
+    return next(_lines(buf, start, end), None)
+
+
+def _lines(buf: Buffer, start: int, end: int) -> Iterator[tuple[int, int, int]]:
+    """Yield (content start, indent column, line end) for non-blank, non-comment lines.
+
+    When start falls mid-line (a value after "key: " or "- "), that first
+    line's indent is its column in the file, so nested blocks line up.
+    """
+    pos = start
+    column = start - (buf.rfind(b"\n", 0, start) + 1)
+    while pos < end:
+        newline = buf.find(b"\n", pos, end)
+        line_end = end if newline == -1 else newline
+        segment = buf[pos:line_end]
+        body = segment.lstrip(b" ")
+        text = body.strip()
+        if text and not text.startswith(b"#"):
+            yield pos + len(segment) - len(body), column + len(segment) - len(body), line_end
+        pos = line_end + 1
+        column = 0
+
+
+def _unquote(key: bytes) -> str:
+    """Plain, 'single' or "double" quoted key as text."""
+    text = key.decode("utf-8", errors="replace").strip()
+    if text.startswith('"'):
+        try:
+            return json.loads(text)
+        except ValueError:
+            return text[1:-1]
+    if text.startswith("'"):
+        return text[1:-1].replace("''", "'")
+    return text
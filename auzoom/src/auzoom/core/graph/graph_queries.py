@@ -3,6 +3,7 @@
 from typing import Optional
 from ...models import FetchLevel, TraversalStrategy, TraversalDirection, NodeType
 from .graph_traversal import SelectiveGraphTraversal
+from .traversal_cursors import TraversalCursorStore
 
 
 class GraphQueries:
@@ -11,6 +12,7 @@ class GraphQueries:
     def __init__(self, graph):
         self.graph = graph
         self.traversal = SelectiveGraphTraversal(graph)
+        self.cursors = TraversalCursorStore()
 
     def get_node(self, node_id: str, level: FetchLevel) -> dict:
         """Get single node, parsing file if needed."""
@@ -32,11 +34,58 @@ class GraphQueries:
             return node.to_full()
 
     def get_children(self, node_id: str, level: FetchLevel) -> list[dict]:
-        """Get child nodes."""
+        """Get child nodes (one batched read of their file)."""
         node = self.graph.nodes.get(node_id)
         if not node:
             return []
-        return [self.get_node(cid, level) for cid in node.children]
+        return self.get_nodes(node.children, level)["nodes"]
+
+    def get_nodes(
+        self,
+        node_ids: list[str],
+        level: FetchLevel,
+        format: str = "standard",
+        fields: Optional[list[str]] = None,
+        max_workers: int = 4
+    ) -> dict:
+        """Get many nodes at once, loading each distinct file a single time.
+
+        Node IDs are grouped by file; files not yet in memory are loaded
+        (from disk cache or by parsing) in parallel, then every requested
+        node is serialized in request order.
+
+        Args:
+            node_ids: Node IDs to fetch ("file_path::qualified_name")
+            level: Detail level for all nodes
+            format: Serialization format ("standard" or "compact")
+            fields: Optional list of fields to include
+            max_workers: Maximum files loaded concurrently
+
+        Returns:
+            Dict with nodes (found, in request order), missing (IDs not found),
+            errors (file_path -> load error) and files (distinct files touched)
+        """
+        files = list(dict.fromkeys(nid.split("::")[0] for nid in node_ids))
+        errors = self.graph.load_files(files, max_workers=max_workers)
+
+        found = []
+        missing = []
+        for nid in node_ids:
+            node = self.graph.nodes.get(nid)
+            if node:
+                found.append(node)
+            else:
+                missing.append(nid)
+
+        serializer = self.graph.serializer
+        if format == "compact":
+            nodes = serializer.serialize_file_compact(
+                found, level, relative_to=str(self.graph.project_root), fields=fields
+            )
+        else:
+            nodes = serializer.serialize_file(found, level, fields=fields)
+
+        return {"nodes": nodes, "missing": missing, "errors": errors, "files": len(files)}
 
     def get_dependencies(
         self,
@@ -44,7 +93,9 @@ class GraphQueries:
         depth: int = 1,
         strategy: Optional[TraversalStrategy] = None,
         direction: Optional[TraversalDirection] = None,
-        node_type_filter: Optional[list[NodeType]] = None
+        node_type_filter: Optional[list[NodeType]] = None,
+        max_nodes: Optional[int] = None,
+        max_tokens: Optional[int] = None
     ) -> list[dict]:
         """Get dependency nodes with advanced traversal options.
 
@@ -54,9 +105,12 @@ class GraphQueries:
             strategy: BFS (breadth-first) or DFS (depth-first), default: BFS
             direction: FORWARD (calls), REVERSE (callers), or BOTH, default: REVERSE
             node_type_filter: Optional list of NodeTypes to include
+            max_nodes: Optional cap on returned nodes (early termination)
+            max_tokens: Optional cap on the token estimate of returned nodes
 
         Returns:
             List of dependency nodes with depth annotation
+            (a TraversalResult whose ``truncated`` flag reports budget cut-off)
 
         Examples:
             # Impact analysis (default): Who depends on this?
@@ -93,15 +147,102 @@ class GraphQueries:
             strategy=strategy,
             direction=direction,
             node_type_filter=node_type_filter,
-            batch_load=True  # Enable BFS optimization
+            batch_load=True,  # Enable BFS optimization
+            max_nodes=max_nodes,
+            max_tokens=max_tokens
         )
 
         return result
 
+    def get_dependencies_page(
+        self,
+        node_id: Optional[str] = None,
+        depth: int = 1,
+        strategy: Optional[TraversalStrategy] = None,
+        direction: Optional[TraversalDirection] = None,
+        node_type_filter: Optional[list[NodeType]] = None,
+        page_size: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> dict:
+        """Get one page of dependency nodes, resumable via a continuation cursor.
+
+        The traversal runs as a generator, so only the nodes on the requested
+        page (plus one look-ahead node) are visited and serialized. When more
+        results remain, the suspended traversal is kept in the cursor store
+        and ``next_cursor`` resumes it exactly where this page stopped.
+
+        Args:
+            node_id: Starting node ID (when resuming, must match the cursor's)
+            depth: Maximum traversal depth
+            strategy: BFS or DFS, default: BFS
+            direction: FORWARD, REVERSE or BOTH, default: REVERSE
+            node_type_filter: Optional list of NodeTypes to include
+            page_size: Maximum nodes per page
+            max_tokens: Maximum token estimate per page
+            cursor: Continuation cursor from a previous page
+
+        Returns:
+            Dict with items, context (node_id, depth, strategy, direction)
+            and next_cursor (None when the traversal is exhausted)
+
+        Raises:
+            KeyError: If the cursor is unknown or expired
+            ValueError: If the cursor was issued for a different node_id
+        """
+        if cursor:
+            return self.cursors.next_page(cursor, page_size, max_tokens, node_id=node_id)
+
+        strategy = strategy or TraversalStrategy.BFS
+        direction = direction or TraversalDirection.REVERSE
+        context = {
+            "node_id": node_id,
+            "depth": depth,
+            "strategy": strategy.value,
+            "direction": direction.value
+        }
+
+        if depth < 1:
+            return {"items": [], "context": context, "next_cursor": None}
+
+        if node_id not in self.graph.nodes:
+            try:
+                self.get_node(node_id, FetchLevel.SKELETON)
+            except KeyError:
+                return {"items": [], "context": context, "next_cursor": None}
+
+        items = self.traversal.iter_traverse(
+            node_id, depth, strategy, direction, node_type_filter
+        )
+        return self.cursors.first_page(items, context, page_size, max_tokens)
+
+    def get_impact(self, node_id: str, limit: Optional[int] = None) -> Optional[dict]:
+        """Transitive impact of a node from the precomputed index.
+
+        Loads the node's file if needed, then answers from the impact index
+        without traversing the graph.
+
+        Args:
+            node_id: Node to analyze
+            limit: Optional cap on returned member IDs
+
+        Returns:
+            Dict with impact_count and members, or None if the index is disabled
+        """
+        impact = self.graph.impact
+        if not impact:
+            return None
+        if node_id not in self.graph.nodes:
+            self.get_node(node_id, FetchLevel.SKELETON)
+        count = impact.impact_count(node_id)
+        if count is None:
+            raise KeyError(f"Node {node_id} not found")
+        return {"impact_count": count, "members": impact.impact_members(node_id, limit)}
+
     def find_by_name(self, name_pattern: str) -> list[dict]:
         """Search across all loaded nodes."""
         matches = []
-        for node in self.graph.nodes.values():
+        for node in list(self.graph.nodes.values()):
             if name_pattern.lower() in node.name.lower():
                 matches.append(node.to_skeleton())
         return matches
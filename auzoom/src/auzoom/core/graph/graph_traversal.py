@@ -1,8 +1,14 @@
 """Advanced graph traversal with strategy, direction, and filtering support."""
 
-from collections import deque
-from typing import Optional
-from ...models import CodeNode, NodeType, TraversalStrategy, TraversalDirection
+import json
+from typing import Iterable, Iterator, Optional
+from ...models import NodeType, TraversalStrategy, TraversalDirection, estimate_tokens
+
+
+class TraversalResult(list):
+    """List of traversal results that records whether a budget cut it short."""
+
+    truncated: bool = False
 
 
 class SelectiveGraphTraversal:
@@ -12,7 +18,8 @@ class SelectiveGraphTraversal:
     - BFS vs DFS strategies
     - Forward/Reverse/Bidirectional directions
     - Node type filtering
-    - Batch loading optimization for BFS
+    - Lazy generator traversal (pay only for consumed results)
+    - Node/token budgets with early termination
     """
 
     def __init__(self, graph):
@@ -30,8 +37,10 @@ class SelectiveGraphTraversal:
         strategy: TraversalStrategy = TraversalStrategy.DFS,
         direction: TraversalDirection = TraversalDirection.REVERSE,
         node_type_filter: Optional[list[NodeType]] = None,
-        batch_load: bool = True
-    ) -> list[dict]:
+        batch_load: bool = True,
+        max_nodes: Optional[int] = None,
+        max_tokens: Optional[int] = None
+    ) -> TraversalResult:
         """Traverse graph with full control over strategy and filtering.
 
         Args:
@@ -40,10 +49,13 @@ class SelectiveGraphTraversal:
             strategy: BFS (breadth-first) or DFS (depth-first)
             direction: FORWARD (what I call), REVERSE (who calls me), or BOTH
             node_type_filter: Optional list of NodeTypes to include (e.g., [NodeType.FUNCTION, NodeType.METHOD])
-            batch_load: Enable batch loading optimization for BFS (recommended)
+            batch_load: Kept for API compatibility; nodes are now loaded lazily as consumed
+            max_nodes: Stop after this many result nodes (None = unlimited)
+            max_tokens: Stop before results exceed this token estimate (None = unlimited)
 
         Returns:
-            List of node dicts with depth annotation
+            List of node dicts with depth annotation; ``truncated`` is True
+            when a budget stopped the traversal before it was exhausted
 
         Examples:
             # Impact analysis: Who depends on this function?
@@ -57,91 +69,96 @@ class SelectiveGraphTraversal:
             # Filter to functions only
             traverse("service.py::login", depth=3, node_type_filter=[NodeType.FUNCTION, NodeType.METHOD])
             → Ignores imports, classes
+
+            # Hub function: cap the result instead of returning thousands of callers
+            traverse("utils.py::log", depth=3, max_nodes=50, max_tokens=2000)
+        """
+        items = self.iter_traverse(start_node_id, depth, strategy, direction, node_type_filter)
+        return self._collect_within_budget(items, max_nodes, max_tokens)
+
+    def iter_traverse(
+        self,
+        start_node_id: str,
+        depth: int = 1,
+        strategy: TraversalStrategy = TraversalStrategy.DFS,
+        direction: TraversalDirection = TraversalDirection.REVERSE,
+        node_type_filter: Optional[list[NodeType]] = None
+    ) -> Iterator[dict]:
+        """Lazily traverse the graph, yielding one result node at a time.
+
+        Nothing beyond the consumed prefix is visited or serialized, so a
+        paginated caller only pays for the pages it actually reads.
+
+        Args:
+            start_node_id: Starting node ID
+            depth: Maximum depth to traverse (1 = immediate neighbors)
+            strategy: BFS (breadth-first) or DFS (depth-first)
+            direction: FORWARD (what I call), REVERSE (who calls me), or BOTH
+            node_type_filter: Optional list of NodeTypes to include
+
+        Yields:
+            Node dicts with depth annotation
         """
         if strategy == TraversalStrategy.BFS:
-            return self._bfs_traverse(start_node_id, depth, direction, node_type_filter, batch_load)
-        else:
-            return self._dfs_traverse(start_node_id, depth, direction, node_type_filter)
+            return self._bfs_traverse(start_node_id, depth, direction, node_type_filter)
+        return self._dfs_traverse(start_node_id, depth, direction, node_type_filter)
 
     def _bfs_traverse(
         self,
         start_node_id: str,
         max_depth: int,
         direction: TraversalDirection,
-        node_type_filter: Optional[list[NodeType]],
-        batch_load: bool
-    ) -> list[dict]:
+        node_type_filter: Optional[list[NodeType]]
+    ) -> Iterator[dict]:
         """Breadth-first traversal with level-by-level processing.
 
         BFS shows immediate impacts first, then progressively deeper dependencies.
         Ideal for impact analysis and understanding breadth of changes.
 
-        Optimization: Batch loads all nodes at each depth level in parallel.
+        Runs as a generator: each level is expanded only once the consumer
+        has taken every result of the previous level.
 
         Args:
             start_node_id: Starting node
             max_depth: Maximum depth
             direction: Traversal direction
             node_type_filter: Optional type filter
-            batch_load: Enable batch loading (3-5× speedup)
 
-        Returns:
-            List of nodes with depth annotation, ordered by depth
+        Yields:
+            Node dicts with depth annotation, ordered by depth
         """
-        visited = set()
-        result = []
-        queue = deque([(start_node_id, 0)])  # (node_id, depth)
-
-        while queue:
-            # Collect all nodes at current depth level (for batch loading)
-            current_level = []
-            next_queue = deque()
-
-            # Process entire current depth level
-            while queue:
-                node_id, current_depth = queue.popleft()
+        handles = self.graph.handles
+        visited = handles.new_bitset()
+        allowed = set(node_type_filter) if node_type_filter else None
+        level = [start_node_id]
+        current_depth = 0
+
+        while level and current_depth <= max_depth:
+            next_level = []
+            for node_id in level:
+                handle = handles.handle(node_id)
+                if handle in visited:
+                    continue
+                visited.add(handle)
 
-                if node_id in visited or current_depth > max_depth:
+                node = self.graph.nodes.get(node_id)
+                if not node:
                     continue
 
-                visited.add(node_id)
-                current_level.append((node_id, current_depth))
+                if allowed is None or node.node_type in allowed:
+                    yield {
+                        **node.to_skeleton(),
+                        "depth": current_depth,
+                        "direction": direction.value
+                    }
 
-                # Get neighbors for next level
                 if current_depth < max_depth:
-                    neighbors = self._get_neighbors(node_id, direction)
-                    for neighbor_id in neighbors:
-                        if neighbor_id not in visited:
-                            next_queue.append((neighbor_id, current_depth + 1))
-
-            # Batch load all nodes at this depth level
-            if batch_load and current_level:
-                node_ids = [nid for nid, _ in current_level]
-                loaded_nodes = self._batch_load_nodes(node_ids)
-
-                # Filter and add to results
-                for (node_id, depth), node_data in zip(current_level, loaded_nodes):
-                    if self._matches_filter(node_data, node_type_filter):
-                        result.append({
-                            **node_data,
-                            "depth": depth,
-                            "direction": direction.value
-                        })
-            else:
-                # Non-batch mode: load individually
-                for node_id, depth in current_level:
-                    node_data = self._load_node(node_id)
-                    if node_data and self._matches_filter(node_data, node_type_filter):
-                        result.append({
-                            **node_data,
-                            "depth": depth,
-                            "direction": direction.value
-                        })
-
-            # Move to next level
-            queue = next_queue
+                    for neighbor_id in self._get_neighbors(node_id, direction):
+                        if handles.handle(neighbor_id) not in visited:
+                            next_level.append(neighbor_id)
 
-        return result
+            level = next_level
+            current_depth += 1
 
     def _dfs_traverse(
         self,
@@ -149,46 +166,89 @@ class SelectiveGraphTraversal:
         max_depth: int,
         direction: TraversalDirection,
         node_type_filter: Optional[list[NodeType]]
-    ) -> list[dict]:
-        """Depth-first traversal with recursive exploration.
+    ) -> Iterator[dict]:
+        """Depth-first traversal with an explicit stack.
 
         DFS follows call chains deep before exploring breadth.
         Ideal for call chain analysis and understanding execution paths.
 
+        Iterative rather than recursive so deep call chains cannot hit the
+        interpreter recursion limit. Visited state is a bitset over integer
+        node handles, and the type filter is checked on the in-memory node
+        before it is serialized, so rejected nodes cost no serialization.
+        Yields lazily: a budgeted caller stops the walk as soon as it stops
+        consuming.
+
         Args:
             start_node_id: Starting node
             max_depth: Maximum depth
             direction: Traversal direction
             node_type_filter: Optional type filter
 
-        Returns:
-            List of nodes with depth annotation, ordered by traversal
+        Yields:
+            Node dicts with depth annotation, in pre-order
         """
-        visited = set()
-        result = []
+        handles = self.graph.handles
+        visited = handles.new_bitset()
+        allowed = set(node_type_filter) if node_type_filter else None
+        stack = [(start_node_id, 0)]
+
+        while stack:
+            node_id, current_depth = stack.pop()
+            handle = handles.handle(node_id)
+            if handle in visited:
+                continue
+            visited.add(handle)
 
-        def dfs_recursive(node_id: str, current_depth: int):
-            if node_id in visited or current_depth > max_depth:
-                return
-
-            visited.add(node_id)
+            node = self.graph.nodes.get(node_id)
+            if not node:
+                continue
 
-            # Load current node
-            node_data = self._load_node(node_id)
-            if node_data and self._matches_filter(node_data, node_type_filter):
-                result.append({
-                    **node_data,
+            if allowed is None or node.node_type in allowed:
+                yield {
+                    **node.to_skeleton(),
                     "depth": current_depth,
                     "direction": direction.value
-                })
+                }
 
-            # Recurse into neighbors
             if current_depth < max_depth:
-                neighbors = self._get_neighbors(node_id, direction)
-                for neighbor_id in neighbors:
-                    dfs_recursive(neighbor_id, current_depth + 1)
+                # Push in reverse so neighbors pop in their stored order
+                for neighbor_id in reversed(self._get_neighbors(node_id, direction)):
+                    if handles.handle(neighbor_id) not in visited:
+                        stack.append((neighbor_id, current_depth + 1))
+
+    def _collect_within_budget(
+        self,
+        items: Iterable[dict],
+        max_nodes: Optional[int],
+        max_tokens: Optional[int]
+    ) -> TraversalResult:
+        """Consume traversal results until a node or token budget is reached.
 
-        dfs_recursive(start_node_id, 0)
+        The first result is always included, so a budget smaller than a
+        single node still makes progress.
+
+        Args:
+            items: Traversal results (list or lazy generator)
+            max_nodes: Maximum number of results (None = unlimited)
+            max_tokens: Maximum summed token estimate (None = unlimited)
+
+        Returns:
+            Collected results with ``truncated`` set if the budget was hit
+        """
+        result = TraversalResult()
+        tokens = 0
+        for item in items:
+            if max_nodes is not None and len(result) >= max_nodes:
+                result.truncated = True
+                break
+            if max_tokens is not None:
+                cost = estimate_tokens(json.dumps(item))
+                if result and tokens + cost > max_tokens:
+                    result.truncated = True
+                    break
+                tokens += cost
+            result.append(item)
         return result
 
     def _get_neighbors(self, node_id: str, direction: TraversalDirection) -> list[str]:
@@ -219,65 +279,6 @@ class SelectiveGraphTraversal:
 
         return neighbors
 
-    def _load_node(self, node_id: str) -> Optional[dict]:
-        """Load a single node from graph.
-
-        Args:
-            node_id: Node ID to load
-
-        Returns:
-            Node dict (skeleton) or None if not found
-        """
-        node = self.graph.nodes.get(node_id)
-        if not node:
-            return None
-
-        return node.to_skeleton()
-
-    def _batch_load_nodes(self, node_ids: list[str]) -> list[dict]:
-        """Batch load multiple nodes for performance.
-
-        BFS optimization: Load entire depth levels in parallel rather than one-by-one.
-        Expected speedup: 3-5× for graphs with 10+ nodes per level.
-
-        Args:
-            node_ids: List of node IDs to load
-
-        Returns:
-            List of node dicts (skeletons)
-        """
-        results = []
-        for node_id in node_ids:
-            node = self.graph.nodes.get(node_id)
-            if node:
-                results.append(node.to_skeleton())
-            else:
-                results.append(None)
-        return results
-
-    def _matches_filter(self, node_data: dict, node_type_filter: Optional[list[NodeType]]) -> bool:
-        """Check if node matches type filter.
-
-        Args:
-            node_data: Node dict
-            node_type_filter: Optional list of NodeTypes to include
-
-        Returns:
-            True if node matches filter (or no filter), False otherwise
-        """
-        if not node_type_filter:
-            return True  # No filter = include all
-
-        if not node_data:
-            return False
-
-        node_type_str = node_data.get("type")
-        if not node_type_str:
-            return False
-
-        # Check if node type matches any in filter
-        return any(nt.value == node_type_str for nt in node_type_filter)
-
 
 def find_circular_dependencies(
     graph,
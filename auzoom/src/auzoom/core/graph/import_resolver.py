@@ -3,6 +3,7 @@
 from pathlib import Path
 from typing import Optional
 from ...models import CodeNode, NodeType
+from ..indexing.module_map import ModuleMap
 
 
 class ImportResolver:
@@ -10,6 +11,7 @@ class ImportResolver:
 
     def __init__(self, project_root: Path):
         self.project_root = project_root
+        self.module_map = ModuleMap(project_root)
 
     def extract_imports(self, nodes: list[CodeNode]) -> list[str]:
         """Get list of imported file paths from nodes."""
@@ -24,26 +26,29 @@ class ImportResolver:
     def resolve_import(self, import_name: str, from_file: str) -> Optional[str]:
         """Convert import name to file path.
 
-        Simple resolution for V1:
-        - Relative imports: resolve relative to from_file
-        - Absolute imports: resolve from project root
+        Resolution is a lookup in the precomputed module map (no filesystem
+        calls per import):
+        - Relative imports: each leading dot beyond the first climbs one
+          package up from from_file's directory
+        - Absolute imports: dotted name looked up across all source roots
+          (project root, src/ layouts, nested projects)
         """
         # Remove "from" and "import" keywords if present
         import_name = import_name.replace("from ", "").replace("import ", "").split()[0]
 
-        # Handle relative imports
         if import_name.startswith("."):
-            base_dir = Path(from_file).parent
-            import_path = import_name.lstrip(".")
-            potential = base_dir / f"{import_path}.py"
-        else:
-            # Absolute from project root
-            import_path = import_name.replace(".", "/")
-            potential = self.project_root / "src" / f"{import_path}.py"
-            if not potential.exists():
-                potential = self.project_root / f"{import_path}.py"
-
-        if potential.exists():
-            return str(potential.resolve())
-
-        return None
+            module_name = import_name.lstrip(".")
+            package_dir = Path(from_file).parent
+            for _ in range(len(import_name) - len(module_name) - 1):
+                package_dir = package_dir.parent
+            return self.module_map.resolve_relative(str(package_dir), module_name)
+
+        return self.module_map.resolve(import_name)
+
+    def on_file_created(self, file_path: str):
+        """Keep the module map fresh when a file appears."""
+        self.module_map.add_file(file_path)
+
+    def on_file_deleted(self, file_path: str):
+        """Keep the module map fresh when a file disappears."""
+        self.module_map.remove_file(file_path)
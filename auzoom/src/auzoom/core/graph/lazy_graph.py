@@ -1,37 +1,57 @@
 from pathlib import Path
-import json
-from typing import Optional, Union, List
-from ...models import CodeNode, FetchLevel, NodeType
-from ..parsing.parser import PythonParser
+import threading
+from typing import Optional, List
+from ...models import CodeNode, FetchLevel
+from ..parsing.file_loader import FileLoader
 from ..caching.cache_manager import CacheManager
 from ..node_serializer import NodeSerializer
 from .import_resolver import ImportResolver
+from ..caching.access_log import AccessLog
 from ..caching.cache_warmer import CacheWarmer
 from .graph_queries import GraphQueries
+from .node_handles import NodeHandleTable
+from ..indexing.impact_index import ImpactIndex
+from ..indexing.import_graph import ImportGraph
+from ..indexing.class_hierarchy import ClassHierarchy
+from ..budget_planner import estimate_node_tokens, read_within_budget
+from ..telemetry import Telemetry
 
 
 class LazyCodeGraph:
     """Graph that indexes files on-demand with persistent caching."""
 
-    def __init__(self, project_root: str, auto_warm: bool = True):
+    def __init__(
+        self,
+        project_root: str,
+        auto_warm: bool = True,
+        impact_index: bool = True,
+        telemetry: Optional[Telemetry] = None
+    ):
         self.project_root = Path(project_root).resolve()
+        self.telemetry = telemetry or Telemetry()  # Phase timings, bytes read, parse origin
         cache_dir = self.project_root / ".auzoom"
         cache_dir.mkdir(parents=True, exist_ok=True)
 
         self.cache = CacheManager(cache_dir)
-        self.parser = PythonParser()
+        self.loader = FileLoader(self)  # Disk cache and parse paths
         self.serializer = NodeSerializer()
         self.import_resolver = ImportResolver(self.project_root)
         self.cache_warmer = CacheWarmer(self.project_root, self)
         self.queries = GraphQueries(self)
         self.nodes = {}
+        self.handles = NodeHandleTable()  # node_id <-> int handle for traversal bitsets
+        self.impact = ImpactIndex() if impact_index else None  # Transitive reverse-reachability
         self.file_index = {}  # Maps file_path -> [node_ids]
+        self.token_estimates = {}  # node_id -> [skeleton, summary, full] tokens
         self.index = self.cache.file_index  # Cache index with metadata
         self.metadata_dir = cache_dir / "metadata"
         self.stats = {"cache_hits": 0, "cache_misses": 0, "parses": 0}
+        # Guards nodes, file_index, index, stats and the impact index across
+        # concurrent tool calls; parsing and disk I/O run outside it
+        self._lock = threading.RLock()
+        self.access_log = AccessLog(cache_dir / "access_log.json")  # Ranks files for warming
 
         if auto_warm:
-            import threading
             threading.Thread(
                 target=self.cache_warmer.auto_warm_sequence,
                 daemon=True
@@ -63,175 +83,93 @@ class LazyCodeGraph:
         file_path = str(Path(file_path).resolve())
 
         # 1. Already in memory?
-        if self._is_loaded(file_path):
-            self.stats["cache_hits"] += 1
-            return self._get_serialized_nodes(file_path, level, format, fields)
-
-        # 2. On disk with valid hash?
-        cached = self._load_from_cache(file_path)
-        if cached:
-            self.stats["cache_hits"] += 1
-            self._load_nodes_into_memory(cached)
-            return self._get_serialized_nodes(file_path, level, format, fields)
-
-        # 3. Parse now (first access or stale)
-        self.stats["cache_misses"] += 1
-        self._parse_and_cache(file_path)
+        with self._lock:
+            loaded = self.loader.is_loaded(file_path)
+            if loaded:
+                self.stats["cache_hits"] += 1
+        if not loaded:
+            # 2./3. Disk cache with a valid hash, else parse now
+            self.loader.load(file_path)
         return self._get_serialized_nodes(file_path, level, format, fields)
 
-    def _is_loaded(self, file_path: str) -> bool:
-        """Check if file's nodes are in memory."""
-        return file_path in self.file_index
-
-    def _load_from_cache(self, file_path: str) -> Optional[dict]:
-        """Try to load from disk cache if hash matches."""
-        if file_path not in self.index:
-            return None
-
-        entry = self.index[file_path]
-        if not entry.get("indexed"):
-            return None
-
-        # Validate content hasn't changed
-        try:
-            current_hash = self.cache.compute_hash(file_path)
-        except FileNotFoundError:
-            return None
-
-        if current_hash != entry["hash"]:
-            # File changed, check if summary needs update
-            if self._should_update_summary(file_path, entry):
-                return None  # Force re-parse
-            # Content changed but summary still valid
-            entry["hash"] = current_hash
-            self.cache.save_index()
+    def is_loaded(self, file_path: str) -> bool:
+        """Whether the current version of a file is in memory."""
+        with self._lock:
+            return self.loader.is_loaded(str(Path(file_path).resolve()))
 
-        # Load metadata
-        cache_file = self.metadata_dir / f"{file_path.replace('/', '_')}_{entry['hash']}.json"
-        if cache_file.exists():
-            return json.loads(cache_file.read_text())
+    def load_files(self, file_paths: list[str], max_workers: int = 4) -> dict[str, str]:
+        """Delegate to file loader."""
+        return self.loader.load_files(file_paths, max_workers)
 
-        return None
-
-    def _should_update_summary(self, file_path: str, old_entry: dict) -> bool:
-        """Determine if file changes require re-parsing.
-
-        Simple strategy: content hash changed = re-parse.
-        Claude Code (the orchestrator LLM) makes higher-level decisions
-        about when to fetch fresh data vs use cached results.
-
-        Args:
-            file_path: Path to changed file
-            old_entry: Previous index entry
+    def get_token_estimates(self, node: CodeNode) -> list[int]:
+        """Memoized [skeleton, summary, full] token estimates for a node."""
+        estimates = self.token_estimates.get(node.id)
+        if estimates is None:
+            estimates = self.token_estimates[node.id] = estimate_node_tokens(node)
+        return estimates
 
-        Returns:
-            True if should re-parse (always True for hash mismatch)
-        """
-        # File content changed → re-parse
-        # This is correct and simple: parse is cheap (~5ms), correctness is critical
-        return True
-
-    def _parse_and_cache(self, file_path: str):
-        """Parse file and cache metadata to disk."""
-        self.stats["parses"] += 1
-        nodes = self.parser.parse_file(file_path)
-        # Store in memory
-        node_ids = []
-        for node in nodes:
-            self.nodes[node.id] = node
-            node_ids.append(node.id)
-        self.file_index[file_path] = node_ids
-        # Extract imports and cache to disk
-        imports = self.import_resolver.extract_imports(nodes)
-        content_hash = self.cache.compute_hash(file_path)
-        cache_data = {
-            "file_path": file_path,
-            "hash": content_hash,
-            "indexed_at": self.cache.timestamp(),
-            "nodes": [self.serializer.serialize_node_for_cache(n) for n in nodes],
-            "imports": imports
-        }
-        cache_file = self.metadata_dir / f"{file_path.replace('/', '_')}_{content_hash}.json"
-        cache_file.write_text(json.dumps(cache_data, indent=2))
-        # Update index
-        self.index[file_path] = {
-            "hash": content_hash,
-            "indexed": True,
-            "indexed_at": self.cache.timestamp(),
-            "imports": imports,
-            "node_count": len(nodes)
-        }
-        # Discover imports (but don't parse them)
-        for imp in imports:
-            if imp not in self.index:
-                self.index[imp] = {
-                    "hash": None,
-                    "indexed": False,
-                    "discovered_at": self.cache.timestamp()
-                }
-        self.cache.save_index()
-
-    def _load_nodes_into_memory(self, cache_data: dict):
-        """Hydrate nodes from cache and load into memory."""
-        nodes = self.serializer.hydrate_nodes(cache_data)
-        file_path = cache_data["file_path"]
-        node_ids = []
-        for node in nodes:
-            self.nodes[node.id] = node
-            node_ids.append(node.id)
-        self.file_index[file_path] = node_ids
-
-    def _get_serialized_nodes(
+    def get_file_within_budget(
         self,
         file_path: str,
-        level: FetchLevel,
+        budget_tokens: int,
+        target: Optional[str] = None,
         format: str = "standard",
         fields: Optional[List[str]] = None
-    ) -> tuple[list[str], list[dict]]:
-        """Get and serialize nodes for a file at requested level with optimization support.
+    ) -> dict:
+        """Get a file with a per-node detail level chosen to fit budget_tokens."""
+        return read_within_budget(
+            self, str(Path(file_path).resolve()), budget_tokens, target, format, fields
+        )
 
-        Separates import nodes from code nodes for token efficiency (imports = 43% of skeleton).
+    def _get_serialized_nodes(self, file_path: str, level: FetchLevel, format: str = "standard",
+                              fields: Optional[List[str]] = None) -> tuple[list[str], list[dict]]:
+        """Serialize a loaded file's nodes, timed as the serialization phase.
 
-        Args:
-            file_path: Path to file
-            level: Detail level
-            format: Serialization format ("standard" or "compact")
-            fields: Optional list of fields to include
+        Imports are returned as plain names (imports = 43% of skeleton);
+        code nodes are serialized at the requested level, each with an
+        impact badge when the impact index is on.
 
         Returns:
             Tuple of (import_names, serialized_nodes)
-            - import_names: Simple string list of imported modules
-            - serialized_nodes: Serialized non-import nodes (functions, classes, methods)
         """
-        from ...models import NodeType
-
-        node_ids = self.file_index.get(file_path, [])
-        all_nodes = [self.nodes[nid] for nid in node_ids]
+        with self.telemetry.phase("serialization"):
+            import_names, code_nodes = self.serializer.split_imports(self.file_nodes(file_path))
+            serialized = self.serializer.serialize(
+                code_nodes, level, format, fields, relative_to=str(self.project_root)
+            )
+            # Impact badge: how many nodes transitively depend on each node
+            key = "im" if format == "compact" else "impact"
+            if self.impact and (not fields or key in fields):
+                for node, data in zip(code_nodes, serialized):
+                    data[key] = self.impact.impact_count(node.id) or 0
+        return import_names, serialized
 
-        # Separate imports from code nodes
-        import_nodes = [n for n in all_nodes if n.node_type == NodeType.IMPORT]
-        code_nodes = [n for n in all_nodes if n.node_type != NodeType.IMPORT]
+    def file_nodes(self, file_path: str) -> list[CodeNode]:
+        """Consistent snapshot of a loaded file's nodes (empty if not loaded)."""
+        with self._lock:
+            return [self.nodes[nid] for nid in self.file_index.get(file_path, []) if nid in self.nodes]
 
-        # Extract import names (simple strings)
-        import_names = [n.name for n in import_nodes]
+    def on_file_created(self, file_path: str):
+        """File event hook: register a new file for import resolution."""
+        self.import_resolver.on_file_created(str(Path(file_path).resolve()))
 
-        # Serialize code nodes (not imports)
-        if format == "compact":
-            serialized = self.serializer.serialize_file_compact(
-                code_nodes,
-                level,
-                relative_to=str(self.project_root),
-                fields=fields
-            )
-        else:
-            serialized = self.serializer.serialize_file(code_nodes, level, fields=fields)
-
-        return import_names, serialized
+    def on_file_deleted(self, file_path: str):
+        """File event hook: forget a deleted file's module name and impact sets."""
+        file_path = str(Path(file_path).resolve())
+        self.import_resolver.on_file_deleted(file_path)
+        with self._lock:
+            self.loader.evict(file_path)
+            if self.impact:
+                self.impact.remove_file(file_path)
 
     def get_node(self, node_id: str, level: FetchLevel) -> dict:
         """Delegate to graph queries."""
         return self.queries.get_node(node_id, level)
 
+    def get_nodes(self, node_ids: list[str], level: FetchLevel, **kwargs) -> dict:
+        """Delegate to graph queries."""
+        return self.queries.get_nodes(node_ids, level, **kwargs)
+
     def get_children(self, node_id: str, level: FetchLevel) -> list[dict]:
         """Delegate to graph queries."""
         return self.queries.get_children(node_id, level)
@@ -240,31 +178,52 @@ class LazyCodeGraph:
         """Delegate to graph queries."""
         return self.queries.get_dependencies(node_id, depth, **kwargs)
 
+    def get_dependencies_page(self, node_id: Optional[str] = None, **kwargs) -> dict:
+        """Delegate to graph queries."""
+        return self.queries.get_dependencies_page(node_id, **kwargs)
+
+    def get_impact(self, node_id: str, limit: Optional[int] = None) -> Optional[dict]:
+        """Delegate to graph queries."""
+        return self.queries.get_impact(node_id, limit)
+
     def find_by_name(self, name_pattern: str) -> list[dict]:
         """Delegate to graph queries."""
         return self.queries.find_by_name(name_pattern)
 
+    def get_import_graph(self) -> ImportGraph:
+        """Build a module import graph from the stored index (no parsing)."""
+        return ImportGraph(self.index, self.project_root)
+
+    def get_class_hierarchy(self) -> ClassHierarchy:
+        """Build the class hierarchy (INHERITS edges) from the stored index (no parsing)."""
+        return ClassHierarchy(self.index)
+
     def get_discovered_files(self) -> list[dict]:
         """List files discovered via imports but not yet indexed."""
         return [
             {"path": path, "discovered_at": entry["discovered_at"]}
-            for path, entry in self.index.items()
+            for path, entry in list(self.index.items())
             if not entry.get("indexed")
         ]
 
     def get_stats(self) -> dict:
         """Return cache performance stats."""
-        total = self.stats["cache_hits"] + self.stats["cache_misses"]
-        hit_rate = self.stats["cache_hits"] / total if total > 0 else 0
+        with self._lock:
+            stats = dict(self.stats)
+            entries = list(self.index.values())
+            node_count = len(self.nodes)
+        total = stats["cache_hits"] + stats["cache_misses"]
+        hit_rate = stats["cache_hits"] / total if total > 0 else 0
 
         return {
-            "cache_hits": self.stats["cache_hits"],
-            "cache_misses": self.stats["cache_misses"],
+            "cache_hits": stats["cache_hits"],
+            "cache_misses": stats["cache_misses"],
             "hit_rate": f"{hit_rate:.1%}",
-            "files_parsed": self.stats["parses"],
-            "files_indexed": len([e for e in self.index.values() if e.get("indexed")]),
-            "files_discovered": len([e for e in self.index.values() if not e.get("indexed")]),
-            "nodes_in_memory": len(self.nodes)
+            "files_parsed": stats["parses"],
+            "files_indexed": len([e for e in entries if e.get("indexed")]),
+            "files_discovered": len([e for e in entries if not e.get("indexed")]),
+            "nodes_in_memory": node_count,
+            "warm": self.access_log.stats()
         }
 
     def discover_entry_points(self) -> list[str]:
@@ -282,3 +241,4 @@ class LazyCodeGraph:
     def preload_discovered(self, limit: int = 10):
         """Delegate to cache warmer."""
         return self.cache_warmer.preload_discovered(limit)
+
@@ -0,0 +1,60 @@
+"""Dense integer handles for node IDs used by graph traversal."""
+
+import threading
+
+
+class HandleBitset:
+    """Growable bitset over integer node handles (1 bit per node)."""
+
+    __slots__ = ("_bits",)
+
+    def __init__(self, size: int = 0):
+        self._bits = bytearray((size >> 3) + 1)
+
+    def add(self, handle: int):
+        """Mark a handle as present, growing the backing buffer if needed."""
+        byte = handle >> 3
+        if byte >= len(self._bits):
+            self._bits.extend(bytes(byte - len(self._bits) + 1))
+        self._bits[byte] |= 1 << (handle & 7)
+
+    def __contains__(self, handle: int) -> bool:
+        byte = handle >> 3
+        return byte < len(self._bits) and bool(self._bits[byte] & (1 << (handle & 7)))
+
+
+class NodeHandleTable:
+    """Intern node IDs as small integers so traversal state stays compact.
+
+    Handles are assigned on first use and never reused, so a handle stays
+    valid for the lifetime of the graph even if the node is re-parsed.
+    """
+
+    def __init__(self):
+        self._handles: dict[str, int] = {}
+        self._node_ids: list[str] = []
+        self._lock = threading.Lock()
+
+    def handle(self, node_id: str) -> int:
+        """Return the integer handle for a node ID, interning it if new."""
+        handle = self._handles.get(node_id)
+        if handle is not None:
+            return handle
+        with self._lock:
+            handle = self._handles.get(node_id)
+            if handle is None:
+                handle = len(self._node_ids)
+                self._node_ids.append(node_id)
+                self._handles[node_id] = handle
+            return handle
+
+    def node_id(self, handle: int) -> str:
+        """Return the node ID for a previously interned handle."""
+        return self._node_ids[handle]
+
+    def new_bitset(self) -> HandleBitset:
+        """Create an empty visited-set sized for the current handle count."""
+        return HandleBitset(len(self._node_ids))
+
+    def __len__(self) -> int:
+        return len(self._node_ids)
@@ -0,0 +1,135 @@
+"""Resumable, token-budgeted pages over lazy graph traversals."""
+
+import json
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterator, Optional
+from ...models import estimate_tokens
+
+
+class TraversalCursorStore:
+    """Hold suspended traversal generators behind opaque continuation cursors.
+
+    Each page consumes the generator only as far as it needs, then parks it
+    (plus the one result it had to peek at) under a fresh random cursor.
+    Cursors are single-use: resuming removes the entry and the next page
+    gets a new cursor, so two clients can never advance the same generator.
+
+    Args:
+        max_cursors: Maximum suspended traversals kept (oldest evicted first)
+        ttl_seconds: Idle time after which a cursor expires
+    """
+
+    def __init__(self, max_cursors: int = 64, ttl_seconds: float = 600.0):
+        self.max_cursors = max_cursors
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def first_page(
+        self,
+        items: Iterator[dict],
+        context: dict,
+        page_size: Optional[int] = None,
+        max_tokens: Optional[int] = None
+    ) -> dict:
+        """Take the first page of a fresh traversal.
+
+        Args:
+            items: Lazy traversal generator
+            context: Request details echoed on every page (node_id, strategy, ...)
+            page_size: Maximum results per page (None = unlimited)
+            max_tokens: Maximum token estimate per page (None = unlimited)
+
+        Returns:
+            Page dict with items, context and next_cursor (None when exhausted)
+        """
+        return self._take_page(items, None, context, page_size, max_tokens)
+
+    def next_page(
+        self,
+        cursor: str,
+        page_size: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        node_id: Optional[str] = None
+    ) -> dict:
+        """Resume a suspended traversal from its continuation cursor.
+
+        When node_id is given it must be the one the cursor was issued for;
+        a mismatched cursor is left in place rather than consumed.
+
+        Raises:
+            KeyError: If the cursor is unknown, already used or expired
+            ValueError: If the cursor belongs to another node's traversal
+        """
+        with self._lock:
+            self._expire()
+            entry = self._entries.get(cursor)
+            issued_for = entry["context"].get("node_id") if entry else None
+            if node_id is not None and issued_for is not None and issued_for != node_id:
+                raise ValueError(f"Cursor {cursor} was issued for {issued_for}, not {node_id}")
+            self._entries.pop(cursor, None)
+        if entry is None:
+            raise KeyError(f"Unknown or expired cursor: {cursor}")
+        return self._take_page(
+            entry["items"], entry["pending"], entry["context"], page_size, max_tokens
+        )
+
+    def _take_page(
+        self,
+        items: Iterator[dict],
+        pending: Optional[dict],
+        context: dict,
+        page_size: Optional[int],
+        max_tokens: Optional[int]
+    ) -> dict:
+        """Consume one page, parking the generator if results remain."""
+        page = []
+        tokens = 0
+        while True:
+            item = pending if pending is not None else next(items, None)
+            pending = None
+            if item is None:
+                return {"items": page, "context": context, "next_cursor": None}
+
+            # Always emit at least one item so tiny budgets still make progress
+            if page and page_size is not None and len(page) >= page_size:
+                break
+            if max_tokens is not None:
+                cost = estimate_tokens(json.dumps(item))
+                if page and tokens + cost > max_tokens:
+                    break
+                tokens += cost
+            page.append(item)
+
+        cursor = self._park(items, item, context)
+        return {"items": page, "context": context, "next_cursor": cursor}
+
+    def _park(self, items: Iterator[dict], pending: dict, context: dict) -> str:
+        """Store a suspended generator and return its new cursor."""
+        cursor = secrets.token_urlsafe(12)
+        with self._lock:
+            self._expire()
+            self._entries[cursor] = {
+                "items": items,
+                "pending": pending,
+                "context": context,
+                "parked_at": time.monotonic()
+            }
+            while len(self._entries) > self.max_cursors:
+                self._entries.popitem(last=False)
+        return cursor
+
+    def _expire(self):
+        """Drop cursors idle longer than the TTL (caller holds the lock)."""
+        cutoff = time.monotonic() - self.ttl_seconds
+        while self._entries:
+            oldest = next(iter(self._entries.values()))
+            if oldest["parked_at"] >= cutoff:
+                break
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
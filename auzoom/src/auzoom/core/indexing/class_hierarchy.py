@@ -0,0 +1,174 @@
+"""Class hierarchy (INHERITS edges) served from the stored file index."""
+
+from collections import deque
+from typing import Optional
+from ...models import CodeNode, NodeType
+
+
+class ClassHierarchy:
+    """Answer subclass, superclass and override queries without parsing.
+
+    ``summarize_file`` runs once per parse and stores each class's resolved
+    bases and method names in the file's cache index entry. This class only
+    reads those records, so coverage is limited to indexed files.
+    Bases that resolve into the project are node IDs (``file::Class``);
+    anything else (``Exception``, ``abc.ABC``) stays a dotted name.
+
+    Args:
+        index: The graph's file index (file_path -> entry with "classes")
+    """
+
+    def __init__(self, index: dict):
+        self.parents: dict[str, list[str]] = {}
+        self.methods: dict[str, set[str]] = {}
+        self.children: dict[str, list[str]] = {}
+        self.by_name: dict[str, list[str]] = {}
+        for entry in list(index.values()):
+            for class_id, record in entry.get("classes", {}).items():
+                self.parents[class_id] = record["bases"]
+                self.methods[class_id] = set(record["methods"])
+                self.by_name.setdefault(class_id.rsplit("::", 1)[-1], []).append(class_id)
+                for base in record["bases"]:
+                    self.children.setdefault(base, []).append(class_id)
+        self._mro_cache: dict[str, list[str]] = {}
+
+    @staticmethod
+    def summarize_file(nodes: list[CodeNode], resolver) -> dict:
+        """Build the per-file class record stored in the cache index.
+
+        Args:
+            nodes: Parsed nodes of one file
+            resolver: ImportResolver used to map qualified bases to files
+
+        Returns:
+            Dict of class_id -> {"bases": [...], "methods": [...]}
+        """
+        classes = [n for n in nodes if n.node_type == NodeType.CLASS]
+        local = {n.name: n.id for n in classes}
+        return {
+            n.id: {
+                "bases": [_resolve_base(b, n.file_path, local, resolver) for b in n.bases],
+                "methods": [child.rsplit(".", 1)[-1] for child in n.children]
+            }
+            for n in classes
+        }
+
+    def find(self, target: str) -> list[str]:
+        """Class IDs matching a node ID or a bare class name."""
+        if target in self.parents:
+            return [target]
+        return sorted(self.by_name.get(target, []))
+
+    def subclasses(self, class_id: str, transitive: bool = True) -> list[str]:
+        """Classes deriving from class_id (directly, or at any depth)."""
+        if not transitive:
+            return sorted(self.children.get(class_id, []))
+        seen = {class_id}
+        queue = deque([class_id])
+        while queue:
+            for child in self.children.get(queue.popleft(), []):
+                if child not in seen:
+                    seen.add(child)
+                    queue.append(child)
+        seen.discard(class_id)
+        return sorted(seen)
+
+    def mro(self, class_id: str) -> list[str]:
+        """C3 method resolution order, starting with class_id itself.
+
+        Falls back to left-to-right depth-first order when the hierarchy has
+        no consistent C3 linearization (or a cycle from stale cache data).
+        """
+        return self._linearize(class_id, set())
+
+    def resolve_method(self, class_id: str, method: str) -> Optional[str]:
+        """Class in class_id's MRO whose definition of method is used."""
+        for candidate in self.mro(class_id):
+            if method in self.methods.get(candidate, ()):
+                return candidate
+        return None
+
+    def overrides(self, method_id: str) -> dict:
+        """MRO-aware override lookup for a method node ID (file::Class.method).
+
+        Returns:
+            Dict with "overrides" (the ancestor method this one replaces, or
+            None) and "overridden_by" (subclass methods that replace it)
+
+        Raises:
+            KeyError: If the method's class is not indexed
+        """
+        class_id, _, method = method_id.rpartition(".")
+        if class_id not in self.parents:
+            raise KeyError(f"Class {class_id} not indexed")
+
+        overridden = None
+        for ancestor in self.mro(class_id)[1:]:
+            if method in self.methods.get(ancestor, ()):
+                overridden = f"{ancestor}.{method}"
+                break
+
+        overridden_by = [
+            f"{sub}.{method}" for sub in self.subclasses(class_id)
+            if method in self.methods.get(sub, ())
+        ]
+        return {"overrides": overridden, "overridden_by": overridden_by}
+
+    def _linearize(self, class_id: str, active: set[str]) -> list[str]:
+        """Compute (and memoize) the C3 linearization of one class."""
+        if class_id in self._mro_cache:
+            return self._mro_cache[class_id]
+        if class_id in active:
+            return [class_id]
+
+        active.add(class_id)
+        bases = self.parents.get(class_id, [])
+        sequences = [list(self._linearize(b, active)) for b in bases] + [list(bases)]
+        result = [class_id] + _c3_merge(sequences)
+        active.discard(class_id)
+        self._mro_cache[class_id] = result
+        return result
+
+
+def _c3_merge(sequences: list[list[str]]) -> list[str]:
+    """Merge base linearizations per C3, degrading to first-seen order."""
+    result = []
+    sequences = [s for s in sequences if s]
+    while sequences:
+        for seq in sequences:
+            head = seq[0]
+            if not any(head in other[1:] for other in sequences):
+                break
+        else:
+            # Inconsistent hierarchy: keep remaining classes in first-seen order
+            for seq in sequences:
+                for cls in seq:
+                    if cls not in result:
+                        result.append(cls)
+            return result
+        result.append(head)
+        sequences = [[c for c in s if c != head] for s in sequences]
+        sequences = [s for s in sequences if s]
+    return result
+
+
+def _resolve_base(base: str, file_path: str, local: dict[str, str], resolver) -> str:
+    """Turn a qualified base reference into a class node ID when possible.
+
+    Args:
+        base: Reference from CodeNode.bases ("Base", "..pkg.mod.Base", "abc.ABC")
+        file_path: File declaring the subclass
+        local: Class name -> node ID for classes defined in the same file
+        resolver: ImportResolver for module lookups
+    """
+    if "." not in base:
+        return local.get(base, base)
+
+    dots = len(base) - len(base.lstrip("."))
+    module_body, _, symbol = base[dots:].rpartition(".")
+    module = "." * dots + module_body
+    if not module or not symbol:
+        return base
+
+    target_file = resolver.resolve_import(module, file_path)
+    return f"{target_file}::{symbol}" if target_file else base
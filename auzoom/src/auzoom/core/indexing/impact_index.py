@@ -0,0 +1,110 @@
+"""Precomputed transitive impact (reverse reachability) for loaded files."""
+
+import threading
+from typing import Optional
+from ...models import CodeNode
+from .scc import strongly_connected_components
+
+
+class ImpactIndex:
+    """Answer "what breaks if I change X" without walking the graph.
+
+    Reverse-dependency edges produced by the parser never leave the file
+    they were found in, so reachability is computed per file: the
+    dependents graph is condensed into strongly connected components and
+    each component gets a bitset of everything that transitively depends
+    on it. Re-parsing a file only rebuilds that file's entry, which keeps
+    the index incremental; lookups are a dict access plus a popcount.
+    """
+
+    def __init__(self):
+        self._files: dict[str, list[str]] = {}  # file_path -> local node order
+        self._impact: dict[str, tuple[int, int]] = {}  # node_id -> (mask, count)
+        self._lock = threading.Lock()
+
+    def update_file(self, file_path: str, nodes: list[CodeNode]):
+        """Rebuild impact sets for one file after it is parsed or loaded."""
+        node_ids = [n.id for n in nodes]
+        position = {nid: i for i, nid in enumerate(node_ids)}
+        adjacency = [
+            [position[d] for d in n.dependents if d in position]
+            for n in nodes
+        ]
+        masks = _transitive_masks(adjacency)
+        impact = {nid: (mask, mask.bit_count()) for nid, mask in zip(node_ids, masks)}
+
+        with self._lock:
+            for old_id in self._files.get(file_path, []):
+                self._impact.pop(old_id, None)
+            self._files[file_path] = node_ids
+            self._impact.update(impact)
+
+    def remove_file(self, file_path: str):
+        """Forget a file's impact sets (e.g. when it is deleted)."""
+        with self._lock:
+            for old_id in self._files.pop(file_path, []):
+                self._impact.pop(old_id, None)
+
+    def impact_count(self, node_id: str) -> Optional[int]:
+        """Number of other nodes that transitively depend on node_id (None if unindexed)."""
+        entry = self._impact.get(node_id)
+        return entry[1] if entry else None
+
+    def impact_members(self, node_id: str, limit: Optional[int] = None) -> Optional[list[str]]:
+        """Node IDs that transitively depend on node_id (None if unindexed).
+
+        Args:
+            node_id: Node to analyze
+            limit: Optional cap on returned members
+        """
+        with self._lock:  # Mask and node order must come from the same file version
+            entry = self._impact.get(node_id)
+            if not entry:
+                return None
+            mask = entry[0]
+            file_nodes = self._files.get(node_id.split("::")[0], [])
+        members = []
+        while mask and (limit is None or len(members) < limit):
+            low_bit = mask & -mask
+            members.append(file_nodes[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return members
+
+
+def _transitive_masks(adjacency: list[list[int]]) -> list[int]:
+    """Compute per-node transitive successor bitsets via SCC condensation.
+
+    Components arrive sinks-first, so every successor component's reach is
+    final before it is merged into its predecessors.
+
+    Args:
+        adjacency: Successor lists over local node indexes
+
+    Returns:
+        Bitset per node of all other nodes reachable from it (a node on a
+        cycle reaches its cycle peers but never counts itself)
+    """
+    component = [0] * len(adjacency)
+    members_mask: list[int] = []
+    reach: list[int] = []
+
+    for comp_id, scc in enumerate(strongly_connected_components(adjacency)):
+        members = 0
+        for v in scc:
+            component[v] = comp_id
+            members |= 1 << v
+        comp_reach = 0
+        for u in scc:
+            for w in adjacency[u]:
+                other = component[w]
+                if other != comp_id:
+                    comp_reach |= members_mask[other] | reach[other]
+        members_mask.append(members)
+        reach.append(comp_reach)
+
+    masks = []
+    for v in range(len(adjacency)):
+        comp_id = component[v]
+        cycle_peers = members_mask[comp_id] & ~(1 << v)
+        masks.append(reach[comp_id] | cycle_peers)
+    return masks
@@ -0,0 +1,117 @@
+"""Module-level import graph served from the stored file index."""
+
+from collections import deque
+from pathlib import Path
+from typing import Optional
+from .scc import strongly_connected_components
+
+
+class ImportGraph:
+    """Answer module import queries from the adjacency already in the index.
+
+    ``FileLoader`` records the resolved imports of every indexed file;
+    this class only reads those lists, so no query ever parses a file.
+    Coverage is therefore limited to indexed files.
+
+    Args:
+        index: The graph's file index (file_path -> entry with "imports")
+        project_root: Root used to shorten paths and group packages
+    """
+
+    def __init__(self, index: dict, project_root: Path):
+        self.project_root = project_root
+        self.imports: dict[str, list[str]] = {}
+        self.importers: dict[str, list[str]] = {}
+        for file_path, entry in list(index.items()):
+            if not entry.get("indexed"):
+                continue
+            targets = list(dict.fromkeys(entry.get("imports", [])))
+            self.imports[file_path] = targets
+            for target in targets:
+                self.importers.setdefault(target, []).append(file_path)
+
+    def get_importers(self, file_path: str, transitive: bool = False) -> list[str]:
+        """Files that import file_path (directly, or through any chain)."""
+        if not transitive:
+            return sorted(self.importers.get(file_path, []))
+        return self._closure(file_path, self.importers)
+
+    def get_closure(self, file_path: str) -> list[str]:
+        """Every file reachable from file_path by following imports."""
+        return self._closure(file_path, self.imports)
+
+    def get_layers(self) -> dict:
+        """Topologically layer packages by their import dependencies.
+
+        Layer 0 holds packages that import no other indexed package; every
+        other package sits one layer above the highest package it imports.
+        Import cycles between packages are collapsed into a single group
+        and reported separately.
+
+        Returns:
+            Dict with "layers" (list of package lists) and "cycles"
+        """
+        packages = sorted({self.package_of(f) for f in self.imports} |
+                          {self.package_of(f) for f in self.importers})
+        position = {pkg: i for i, pkg in enumerate(packages)}
+        adjacency: list[set[int]] = [set() for _ in packages]
+        for source, targets in self.imports.items():
+            src = position[self.package_of(source)]
+            for target in targets:
+                dst = position[self.package_of(target)]
+                if dst != src:
+                    adjacency[src].add(dst)
+
+        components = strongly_connected_components([sorted(a) for a in adjacency])
+        component_of = {}
+        layer_of: list[int] = []
+        cycles = []
+        for comp_id, scc in enumerate(components):
+            for v in scc:
+                component_of[v] = comp_id
+            deps = {component_of[w] for v in scc for w in adjacency[v]} - {comp_id}
+            layer_of.append(1 + max((layer_of[d] for d in deps), default=-1))
+            if len(scc) > 1:
+                cycles.append(sorted(packages[v] for v in scc))
+
+        layers: list[list[str]] = [[] for _ in range(max(layer_of, default=-1) + 1)]
+        for v, pkg in enumerate(packages):
+            layers[layer_of[component_of[v]]].append(pkg)
+        return {"layers": layers, "cycles": cycles}
+
+    def package_of(self, file_path: str) -> str:
+        """Dotted package name (relative to project root) containing a file."""
+        parent = Path(file_path).parent
+        try:
+            parent = parent.relative_to(self.project_root)
+        except ValueError:
+            return str(parent)
+        return ".".join(parent.parts) or "."
+
+    def relative(self, file_path: str) -> str:
+        """Shorten an absolute path to be project-relative when possible."""
+        try:
+            return str(Path(file_path).relative_to(self.project_root))
+        except ValueError:
+            return file_path
+
+    def resolve(self, module: str, resolver) -> Optional[str]:
+        """Map a user-supplied path or dotted module name to an indexed path."""
+        candidate = Path(module)
+        if not candidate.is_absolute():
+            candidate = self.project_root / module
+        if candidate.is_file():
+            return str(candidate.resolve())
+        return resolver.resolve_import(module, str(self.project_root / "__init__.py"))
+
+    def _closure(self, start: str, adjacency: dict[str, list[str]]) -> list[str]:
+        """Breadth-first reachable set over an adjacency map (start excluded)."""
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            for neighbor in adjacency.get(queue.popleft(), []):
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    queue.append(neighbor)
+        seen.discard(start)
+        return sorted(seen)
@@ -0,0 +1,145 @@
+"""Module-name-to-file map built from a single project walk."""
+
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+IGNORED_DIRS = {"__pycache__", "venv", "node_modules", "build", "dist", "site-packages"}
+PROJECT_MARKERS = ("pyproject.toml", "setup.py", "setup.cfg")
+
+
+class ModuleMap:
+    """Map dotted module names to files so import resolution is a dict lookup.
+
+    Built lazily with one pruned ``os.walk`` of the project. Every
+    directory that looks like a source root (the project root, any
+    ``src`` directory, and any directory holding a pyproject.toml,
+    setup.py or setup.cfg plus its ``src`` child) contributes names, so
+    nested src layouts such as ``tool/src/tool/...`` resolve. Packages map
+    to their ``__init__.py``; modules inside namespace packages (no
+    ``__init__.py``) still map by path.
+
+    The map is updated by ``add_file`` / ``remove_file`` events (files
+    parsed or deleted through the graph) rather than by re-walking, and a
+    lookup miss checks the candidate paths on disk, so a module created
+    after the walk resolves as soon as it is imported.
+
+    Args:
+        project_root: Directory to walk
+    """
+
+    def __init__(self, project_root: Path):
+        self.project_root = Path(project_root).resolve()
+        self.modules: dict[str, str] = {}  # dotted name -> file path
+        self.files: set[str] = set()  # every known .py path
+        self.roots: list[str] = []  # source roots, shallowest first
+        self._built = False
+        self._lock = threading.Lock()
+
+    def resolve(self, module_name: str) -> Optional[str]:
+        """Return the file for an absolute dotted module name, if in the project."""
+        self._ensure_built()
+        found = self.modules.get(module_name)
+        if found or not all(part.isidentifier() for part in module_name.split(".")):
+            return found
+        # Deepest root first: deeper roots win name collisions in the walk too
+        return self._probe([os.path.join(root, *module_name.split(".")) for root in reversed(self.roots)])
+
+    def resolve_relative(self, package_dir: str, module_name: str) -> Optional[str]:
+        """Return the file for a relative import anchored at package_dir.
+
+        Args:
+            package_dir: Directory the leading dots resolve to
+            module_name: Remainder after the dots ("" for ``from . import x``)
+        """
+        self._ensure_built()
+        base = os.path.join(package_dir, *module_name.split(".")) if module_name else package_dir
+        for candidate in (base + ".py", os.path.join(base, "__init__.py")):
+            if candidate in self.files:
+                return candidate
+        return self._probe([base])
+
+    def _probe(self, bases: list[str]) -> Optional[str]:
+        """Find and register a module file created since the walk (lookup miss path)."""
+        prefix = str(self.project_root) + os.sep
+        for base in bases:
+            for candidate in (base + ".py", os.path.join(base, "__init__.py")):
+                if not candidate.startswith(prefix) or not os.path.isfile(candidate):
+                    continue
+                parts = candidate[len(prefix):].split(os.sep)[:-1]
+                if any(p.startswith(".") or p in IGNORED_DIRS for p in parts):
+                    continue
+                self.add_file(candidate)
+                return candidate
+        return None
+
+    def add_file(self, file_path: str):
+        """Register a new or moved .py file (file-created event)."""
+        if not self._built or not file_path.endswith(".py"):
+            return
+        with self._lock:
+            self.files.add(file_path)
+            for root in self.roots:
+                name = self._module_name(file_path, root)
+                if name:
+                    self.modules[name] = file_path
+
+    def remove_file(self, file_path: str):
+        """Forget a deleted .py file (file-deleted event)."""
+        if not self._built:
+            return
+        with self._lock:
+            self.files.discard(file_path)
+            for name in [n for n, p in self.modules.items() if p == file_path]:
+                del self.modules[name]
+
+    def _ensure_built(self):
+        """Walk the project once on first use."""
+        if self._built:
+            return
+        with self._lock:
+            if not self._built:
+                self._build()
+                self._built = True
+
+    def _build(self):
+        """Collect .py files and source roots in one pruned walk, then name them."""
+        roots = {str(self.project_root)}
+        for dirpath, dirnames, filenames in os.walk(self.project_root):
+            dirnames[:] = [
+                d for d in dirnames
+                if not d.startswith(".") and d not in IGNORED_DIRS
+            ]
+            if os.path.basename(dirpath) == "src":
+                roots.add(dirpath)
+            if any(marker in filenames for marker in PROJECT_MARKERS):
+                roots.add(dirpath)
+                roots.add(os.path.join(dirpath, "src"))
+            for name in filenames:
+                if name.endswith(".py"):
+                    self.files.add(os.path.join(dirpath, name))
+
+        # Deeper roots win name collisions: they match how the code is installed
+        self.roots = sorted(roots, key=lambda r: r.count(os.sep))
+        for root in self.roots:
+            for file_path in self.files:
+                name = self._module_name(file_path, root)
+                if name:
+                    self.modules[name] = file_path
+
+    def _module_name(self, file_path: str, root: str) -> Optional[str]:
+        """Dotted module name of file_path relative to a source root."""
+        prefix = root.rstrip(os.sep) + os.sep
+        if not file_path.startswith(prefix):
+            return None
+        parts = file_path[len(prefix):-len(".py")].split(os.sep)
+        if parts[-1] == "__init__":
+            parts = parts[:-1]
+        if not parts or not all(p.isidentifier() for p in parts):
+            return None
+        return ".".join(parts)
+
+    def __len__(self) -> int:
+        self._ensure_built()
+        return len(self.modules)
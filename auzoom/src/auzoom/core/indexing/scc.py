@@ -0,0 +1,61 @@
+"""Strongly connected components for the precomputed graph indexes."""
+
+
+def strongly_connected_components(adjacency: list[list[int]]) -> list[list[int]]:
+    """Find strongly connected components with an iterative Tarjan walk.
+
+    Components are emitted sinks-first: every component reachable from a
+    component is returned before it, so callers can fold successor results
+    into predecessors in a single pass over the returned list.
+
+    Args:
+        adjacency: Successor lists over dense integer node indexes
+
+    Returns:
+        List of components, each a list of node indexes
+    """
+    n = len(adjacency)
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    stack: list[int] = []
+    components: list[list[int]] = []
+    counter = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        work = [(root, 0)]
+        while work:
+            v, i = work[-1]
+            if i == 0:
+                index[v] = low[v] = counter
+                counter += 1
+                stack.append(v)
+                on_stack[v] = True
+            if i < len(adjacency[v]):
+                work[-1] = (v, i + 1)
+                w = adjacency[v][i]
+                if index[w] == -1:
+                    work.append((w, 0))
+                elif on_stack[w]:
+                    low[v] = min(low[v], index[w])
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[v])
+            if low[v] != index[v]:
+                continue
+
+            component = []
+            while True:
+                w = stack.pop()
+                on_stack[w] = False
+                component.append(w)
+                if w == v:
+                    break
+            components.append(component)
+
+    return components
@@ -1,7 +1,7 @@
 """Node serialization for lazy code graph."""
 
 from typing import Optional, List
-from ..models import CodeNode, FetchLevel
+from ..models import CodeNode, FetchLevel, NodeType
 
 
 class NodeSerializer:
@@ -26,7 +26,8 @@ class NodeSerializer:
             "children": node.children,
             "docstring": node.docstring,
             "signature": node.signature,
-            "source": node.source
+            "source": node.source,
+            "bases": node.bases
         }
 
     @staticmethod
@@ -52,7 +53,8 @@ class NodeSerializer:
                 children=node_data.get("children", []),
                 docstring=node_data.get("docstring"),
                 signature=node_data.get("signature"),
-                source=node_data.get("source")
+                source=node_data.get("source"),
+                bases=node_data.get("bases", [])
             )
             nodes.append(node)
         return nodes
@@ -127,3 +129,22 @@ class NodeSerializer:
             ]
 
         return serialized
+
+    @staticmethod
+    def split_imports(nodes: List[CodeNode]) -> tuple[List[str], List[CodeNode]]:
+        """Import names and the remaining code nodes (imports are sent as plain names)."""
+        import_names = [n.name for n in nodes if n.node_type == NodeType.IMPORT]
+        return import_names, [n for n in nodes if n.node_type != NodeType.IMPORT]
+
+    def serialize(
+        self,
+        nodes: List[CodeNode],
+        level: FetchLevel,
+        format: str = "standard",
+        fields: Optional[List[str]] = None,
+        relative_to: Optional[str] = None
+    ) -> List[dict]:
+        """Serialize nodes in the standard or compact ("compact") format."""
+        if format == "compact":
+            return self.serialize_file_compact(nodes, level, relative_to=relative_to, fields=fields)
+        return self.serialize_file(nodes, level, fields=fields)
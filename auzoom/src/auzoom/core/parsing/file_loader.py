@@ -0,0 +1,232 @@
+"""Disk-cache and parse paths that bring a file's nodes into a lazy code graph."""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+from ...models import FetchLevel
+from ..budget_planner import estimate_node_tokens
+from ..indexing.class_hierarchy import ClassHierarchy
+from .parser import PythonParser
+
+
+class FileLoader:
+    """Bring files into a graph's memory (metadata cache, else parse) and keep them fresh.
+
+    A loaded file is remembered with its (mtime, size), so edits are caught
+    by a stat call. Parsing and disk I/O run without the graph lock; the
+    nodes are then published and the cache index updated under it.
+
+    Args:
+        graph: LazyCodeGraph the nodes are loaded into
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.parser = PythonParser()
+        self._local = threading.local()  # Per-thread parsers for parallel loads
+        self._local.parser = self.parser
+        self.loaded_stat = {}  # file_path -> (mtime_ns, size) when loaded into memory
+
+    def is_loaded(self, file_path: str) -> bool:
+        """Check if file's nodes are in memory and the file is unchanged since.
+
+        A stat (mtime, size) comparison catches edits without hashing; an
+        edited file is evicted so the caller falls through to re-validation.
+        Callers hold the graph lock.
+        """
+        if file_path not in self.graph.file_index:
+            return False
+        try:
+            current = _stat_key(file_path)
+        except OSError:
+            current = None
+        if current is not None and current == self.loaded_stat.get(file_path):
+            return True
+        self.evict(file_path)
+        return False
+
+    def evict(self, file_path: str):
+        """Drop a file's nodes from memory (callers hold the graph lock)."""
+        graph = self.graph
+        for nid in graph.file_index.pop(file_path, []):
+            graph.nodes.pop(nid, None)
+            graph.token_estimates.pop(nid, None)
+        self.loaded_stat.pop(file_path, None)
+
+    def _publish(self, file_path: str, nodes: list, estimates: dict):
+        """Replace a file's in-memory nodes with a freshly loaded version."""
+        graph = self.graph
+        node_ids = [node.id for node in nodes]
+        with graph._lock:
+            self.evict(file_path)  # Drop nodes of a previous version
+            graph.nodes.update(zip(node_ids, nodes))
+            try:
+                self.loaded_stat[file_path] = _stat_key(file_path)
+            except OSError:
+                self.loaded_stat.pop(file_path, None)
+            graph.file_index[file_path] = node_ids
+            graph.token_estimates.update(estimates)
+            if graph.impact:
+                graph.impact.update_file(file_path, nodes)
+
+    def load(self, file_path: str):
+        """Bring a file's nodes into memory from the disk cache, or parse it.
+
+        Args:
+            file_path: Resolved path of a file that is not in memory
+        """
+        graph = self.graph
+        cached = self._load_from_cache(file_path)
+        with graph._lock:
+            graph.stats["cache_hits" if cached else "cache_misses"] += 1
+        if cached:
+            self._load_nodes_into_memory(cached)
+        else:
+            self._parse_and_cache(file_path)
+
+    def _load_from_cache(self, file_path: str) -> Optional[dict]:
+        """Try to load from disk cache if hash matches."""
+        graph = self.graph
+        if file_path not in graph.index:
+            return None
+
+        entry = graph.index[file_path]
+        if not entry.get("indexed"):
+            return None
+
+        # Validate content hasn't changed
+        try:
+            current_hash = self.hash_file(file_path)
+        except FileNotFoundError:
+            graph.on_file_deleted(file_path)
+            return None
+
+        if current_hash != entry["hash"]:
+            # File content changed: always re-parse (parse is cheap, correctness is critical)
+            return None
+
+        # Load metadata
+        cache_file = graph.metadata_dir / f"{file_path.replace('/', '_')}_{entry['hash']}.json"
+        if cache_file.exists():
+            with graph.telemetry.phase("disk_load"):
+                raw = cache_file.read_bytes()
+                graph.telemetry.add_bytes_read(len(raw))
+                return json.loads(raw)
+
+        return None
+
+    def _parse_and_cache(self, file_path: str):
+        """Parse file and cache metadata to disk."""
+        graph = self.graph
+        graph.telemetry.count_parse()
+        with graph.telemetry.phase("parse"):
+            nodes = self.get_parser().parse_file(file_path)
+        graph.telemetry.add_bytes_read(os.path.getsize(file_path))
+        graph.import_resolver.on_file_created(file_path)
+        estimates = {node.id: estimate_node_tokens(node) for node in nodes}
+        with graph._lock:
+            graph.stats["parses"] += 1
+        self._publish(file_path, nodes, estimates)
+        # Extract imports and cache to disk
+        with graph.telemetry.phase("import_resolution"):
+            imports = graph.import_resolver.extract_imports(nodes)
+        content_hash = self.hash_file(file_path)
+        cache_data = {
+            "file_path": file_path,
+            "hash": content_hash,
+            "indexed_at": graph.cache.timestamp(),
+            "nodes": [graph.serializer.serialize_node_for_cache(n) for n in nodes],
+            "imports": imports,
+            "token_estimates": estimates
+        }
+        cache_file = graph.metadata_dir / f"{file_path.replace('/', '_')}_{content_hash}.json"
+        cache_file.write_text(json.dumps(cache_data, indent=2))
+        self._index_file(file_path, content_hash, imports, nodes)
+
+    def _index_file(self, file_path: str, content_hash: str, imports: list[str], nodes: list):
+        """Record a parsed file, and the files it imports, in the cache index."""
+        graph = self.graph
+        classes = ClassHierarchy.summarize_file(nodes, graph.import_resolver)
+        with graph._lock:
+            graph.index[file_path] = {
+                "hash": content_hash,
+                "indexed": True,
+                "indexed_at": graph.cache.timestamp(),
+                "imports": imports,
+                "classes": classes,
+                "node_count": len(nodes)
+            }
+            # Discover imports (but don't parse them)
+            for imp in imports:
+                if imp not in graph.index:
+                    graph.index[imp] = {
+                        "hash": None,
+                        "indexed": False,
+                        "discovered_at": graph.cache.timestamp()
+                    }
+        graph.cache.save_index()
+
+    def _load_nodes_into_memory(self, cache_data: dict):
+        """Hydrate nodes from cache and load into memory."""
+        nodes = self.graph.serializer.hydrate_nodes(cache_data)
+        # Older cache files lack estimates: missing ones are recomputed lazily
+        self._publish(cache_data["file_path"], nodes, cache_data.get("token_estimates", {}))
+
+    def hash_file(self, file_path: str) -> str:
+        """Content hash of a file, timed and counted as bytes read."""
+        with self.graph.telemetry.phase("hash"):
+            content_hash = self.graph.cache.compute_hash(file_path)
+        self.graph.telemetry.add_bytes_read(os.path.getsize(file_path))
+        return content_hash
+
+    def get_parser(self) -> PythonParser:
+        """Return this thread's parser (tree-sitter parse state is per instance)."""
+        parser = getattr(self._local, "parser", None)
+        if parser is None:
+            parser = self._local.parser = PythonParser()
+        return parser
+
+    def load_files(self, file_paths: list[str], max_workers: int = 4) -> dict[str, str]:
+        """Ensure files are loaded into memory, parsing cache misses in parallel.
+
+        Files already in memory are skipped; the rest go through the normal
+        memory -> disk cache -> parse flow on a thread pool, one file per task.
+
+        Args:
+            file_paths: Files to load
+            max_workers: Maximum concurrent loads
+
+        Returns:
+            Dict of file_path -> error message for files that failed to load
+        """
+        graph = self.graph
+        pending = list(dict.fromkeys(
+            str(Path(p).resolve()) for p in file_paths
+        ))
+        with graph._lock:
+            pending = [p for p in pending if not self.is_loaded(p)]
+        if not pending:
+            return {}
+
+        def load(path: str) -> Optional[str]:
+            try:
+                graph.get_file(path, FetchLevel.SKELETON)
+                return None
+            except Exception as e:
+                return f"{type(e).__name__}: {e}"
+
+        if len(pending) == 1:
+            results = [load(pending[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+                results = list(pool.map(load, pending))
+        return {path: err for path, err in zip(pending, results) if err}
+
+
+def _stat_key(file_path: str) -> tuple[int, int]:
+    """(mtime_ns, size) used to detect edits to in-memory files."""
+    st = os.stat(file_path)
+    return st.st_mtime_ns, st.st_size
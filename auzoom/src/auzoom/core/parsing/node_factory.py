@@ -49,8 +49,20 @@ class NodeFactory:
             source=source
         )
 
-    def create_class_node(self, node: TSNode, file_path: str) -> Optional[CodeNode]:
-        """Create CodeNode from class definition."""
+    def create_class_node(
+        self,
+        node: TSNode,
+        file_path: str,
+        import_bindings: Optional[dict[str, str]] = None
+    ) -> Optional[CodeNode]:
+        """Create CodeNode from class definition.
+
+        Args:
+            node: Tree-sitter class_definition node
+            file_path: Path to the source file
+            import_bindings: Local name -> qualified reference, used to
+                qualify imported base classes (see extract_import_bindings)
+        """
         name, _, body = self._extract_node_parts(node)
         if not name:
             return None
@@ -61,6 +73,7 @@ class NodeFactory:
         line_start, line_end = self._get_line_range(node)
         source = self.get_text(node)
         children = self._collect_method_children(body, file_path, name)
+        bases = self._extract_bases(node, import_bindings or {})
 
         return CodeNode(
             id=node_id,
@@ -73,23 +86,27 @@ class NodeFactory:
             children=children,
             docstring=docstring,
             signature=None,
-            source=source
+            source=source,
+            bases=bases
         )
 
     def create_import_node(self, node: TSNode, file_path: str) -> Optional[CodeNode]:
         """Create CodeNode from import statement."""
-        # Extract import details
+        # Extract the imported module (not the imported names)
         module_name = None
-        import_items = []
 
         if node.type == 'import_statement':
-            for child in node.children:
-                if child.type == 'dotted_name':
-                    module_name = self.get_text(child)
+            # "import a.b as c, d": first imported module
+            name_node = node.child_by_field_name('name')
+            if name_node and name_node.type == 'aliased_import':
+                name_node = name_node.child_by_field_name('name')
+            if name_node:
+                module_name = self.get_text(name_node)
         elif node.type == 'import_from_statement':
-            for child in node.children:
-                if child.type == 'dotted_name':
-                    module_name = self.get_text(child)
+            # "from ..pkg.mod import x": module incl. relative dots
+            module_node = node.child_by_field_name('module_name')
+            if module_node:
+                module_name = self.get_text(module_node)
 
         if not module_name:
             return None
@@ -112,6 +129,66 @@ class NodeFactory:
             source=source
         )
 
+    def extract_import_bindings(self, node: TSNode) -> dict[str, str]:
+        """Map names bound by an import statement to qualified references.
+
+        Examples:
+            from ..h import Base as B  -> {"B": "..h.Base"}
+            from . import mod          -> {"mod": ".mod"}
+            import pkg.m as pm         -> {"pm": "pkg.m"}
+            import pkg.m               -> {"pkg": "pkg"}
+        """
+        bindings = {}
+        module = None
+        if node.type == 'import_from_statement':
+            module_node = node.child_by_field_name('module_name')
+            if not module_node:
+                return bindings
+            module = self.get_text(module_node)
+
+        for name_node in node.children_by_field_name('name'):
+            alias = None
+            if name_node.type == 'aliased_import':
+                alias_node = name_node.child_by_field_name('alias')
+                alias = self.get_text(alias_node) if alias_node else None
+                name_node = name_node.child_by_field_name('name')
+            if not name_node:
+                continue
+            imported = self.get_text(name_node)
+
+            if module is not None:
+                separator = "" if module.endswith(".") else "."
+                bindings[alias or imported] = f"{module}{separator}{imported}"
+            elif alias:
+                bindings[alias] = imported
+            else:
+                top_level = imported.split(".")[0]
+                bindings[top_level] = top_level
+        return bindings
+
+    def _extract_bases(self, node: TSNode, import_bindings: dict[str, str]) -> list[str]:
+        """Extract base classes, qualified through the file's import bindings.
+
+        Keyword arguments (metaclass=...) are skipped and subscripted bases
+        (Generic[T]) reduce to their value. Local names stay unqualified.
+        """
+        bases = []
+        superclasses = node.child_by_field_name('superclasses')
+        if not superclasses:
+            return bases
+
+        for arg in superclasses.named_children:
+            if arg.type == 'subscript':
+                arg = arg.child_by_field_name('value')
+            if not arg or arg.type not in ('identifier', 'attribute'):
+                continue
+            text = self.get_text(arg)
+            head, _, rest = text.partition(".")
+            if head in import_bindings:
+                text = import_bindings[head] + (f".{rest}" if rest else "")
+            bases.append(text)
+        return bases
+
     def _extract_node_parts(self, node: TSNode):
         """Extract name, params, and body from node children."""
         name = None
@@ -32,6 +32,7 @@ class PythonParser:
 
         tree = self.parser.parse(source_code)
         self.source_code = source_code
+        self.import_bindings = {}
         self.source_lines = source_code.decode('utf-8').split('\n')
 
         nodes = []
@@ -83,7 +84,7 @@ class PythonParser:
 
         for node in self._walk_tree(root):
             if node.type == 'class_definition':
-                class_node = self.factory.create_class_node(node, file_path)
+                class_node = self.factory.create_class_node(node, file_path, self.import_bindings)
                 if class_node:
                     classes.append(class_node)
 
@@ -138,14 +139,21 @@ class PythonParser:
 
         Returns:
             List of CodeNode objects for imports
+
+        Side effect: records names bound by imports in self.import_bindings
+        so class bases can be qualified.
         """
         imports = []
+        seen_ids = set()
         root = tree.root_node
 
         for node in self._walk_tree(root):
             if node.type in ('import_statement', 'import_from_statement'):
+                self.import_bindings.update(self.factory.extract_import_bindings(node))
                 import_node = self.factory.create_import_node(node, file_path)
-                if import_node:
+                # One node per module: repeated "from x import ..." share an ID
+                if import_node and import_node.id not in seen_ids:
+                    seen_ids.add(import_node.id)
                     imports.append(import_node)
 
         return imports
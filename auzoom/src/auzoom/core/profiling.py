@@ -0,0 +1,144 @@
+"""Opt-in per-tool-call CPU and memory profiling (AUZOOM_PROFILE)."""
+
+import cProfile
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Optional
+
+MODES = ("cpu", "mem")
+TRACEMALLOC_FRAMES = 10
+MEM_LINES_PER_CALL = 50  # Allocation sites kept per memory profile
+_SKIP_TRACEMALLOC = (tracemalloc.Filter(False, tracemalloc.__file__),)  # Snapshot bookkeeping
+
+
+class ToolProfiler:
+    """Profile each tool call and aggregate hotspots across calls.
+
+    cpu mode runs the call under cProfile and dumps a ``.prof`` file;
+    mem mode diffs tracemalloc snapshots taken around the call and stores
+    the top allocation sites as ``.json``. Files are named
+    ``<timestamp>-<seq>-<tool>`` under profile_dir. Profiled calls are
+    serialized by a lock: profilers hook the interpreter globally, and a
+    slow but attributable session is the point of this mode.
+
+    Args:
+        mode: "cpu", "mem", or None/"" to disable
+        profile_dir: Directory for per-call profile files
+
+    Raises:
+        ValueError: If mode is not one of MODES
+    """
+
+    def __init__(self, mode: Optional[str], profile_dir: Path):
+        if mode and mode not in MODES:
+            raise ValueError(f"Unknown profile mode {mode!r} (expected one of {MODES})")
+        self.mode = mode or None
+        self.profile_dir = Path(profile_dir)
+        self._lock = threading.Lock()
+        self._seq = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether tool calls are being profiled."""
+        return self.mode is not None
+
+    def profile(self, tool: str):
+        """Context manager profiling one call (no-op when disabled)."""
+        if not self.enabled:
+            return nullcontext()
+        return self._profile_cpu(tool) if self.mode == "cpu" else self._profile_mem(tool)
+
+    @contextmanager
+    def _profile_cpu(self, tool: str):
+        with self._lock:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+                profiler.dump_stats(str(self._next_path(tool, ".prof")))
+
+    @contextmanager
+    def _profile_mem(self, tool: str):
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(TRACEMALLOC_FRAMES)
+            before = tracemalloc.take_snapshot()
+            try:
+                yield
+            finally:
+                after = tracemalloc.take_snapshot().filter_traces(_SKIP_TRACEMALLOC)
+                diff = after.compare_to(before.filter_traces(_SKIP_TRACEMALLOC), "lineno")
+                sites = [
+                    {"site": str(stat.traceback[0]), "size_diff": stat.size_diff, "count_diff": stat.count_diff}
+                    for stat in diff[:MEM_LINES_PER_CALL]
+                ]
+                peak = tracemalloc.get_traced_memory()[1]
+                self._next_path(tool, ".json").write_text(
+                    json.dumps({"tool": tool, "peak_bytes": peak, "sites": sites})
+                )
+
+    def _next_path(self, tool: str, suffix: str) -> Path:
+        """Unique profile file path for one call (caller holds the lock)."""
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        self._seq += 1
+        return self.profile_dir / f"{int(time.time() * 1000)}-{self._seq:05d}-{tool}{suffix}"
+
+    def hotspots(self, top_n: int = 20, tool: Optional[str] = None, sort: str = "cumulative") -> dict:
+        """Aggregate all stored profiles into the top-N hotspots.
+
+        Args:
+            top_n: Number of entries to return
+            tool: Only include profiles of this tool
+            sort: cpu mode: "cumulative" or "tottime"
+
+        Returns:
+            Dict with mode, number of profiles aggregated and hotspot list
+        """
+        suffix = ".prof" if self.mode == "cpu" else ".json"
+        pattern = f"*-{tool}{suffix}" if tool else f"*{suffix}"
+        files = sorted(self.profile_dir.glob(pattern)) if self.profile_dir.exists() else []
+        if not files:
+            return {"mode": self.mode, "profiles": 0, "hotspots": []}
+
+        if self.mode == "cpu":
+            hotspots = _cpu_hotspots(files, top_n, sort)
+        else:
+            hotspots = _mem_hotspots(files, top_n)
+        return {"mode": self.mode, "profiles": len(files), "hotspots": hotspots}
+
+
+def _cpu_hotspots(files: list[Path], top_n: int, sort: str) -> list[dict]:
+    """Merge cProfile dumps and list the most expensive functions."""
+    stats = pstats.Stats(str(files[0]))
+    for extra in files[1:]:
+        stats.add(str(extra))
+    key = 3 if sort == "cumulative" else 2  # Index into (cc, nc, tottime, cumtime, callers)
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][key], reverse=True)[:top_n]
+    return [
+        {
+            "function": f"{file}:{line}({name})",
+            "calls": nc,
+            "tottime_ms": round(tt * 1000, 3),
+            "cumtime_ms": round(ct * 1000, 3),
+        }
+        for (file, line, name), (cc, nc, tt, ct, callers) in rows
+    ]
+
+
+def _mem_hotspots(files: list[Path], top_n: int) -> list[dict]:
+    """Sum allocation growth per site across memory profiles."""
+    totals: dict[str, list[int]] = {}
+    for path in files:
+        for site in json.loads(path.read_text())["sites"]:
+            entry = totals.setdefault(site["site"], [0, 0])
+            entry[0] += site["size_diff"]
+            entry[1] += site["count_diff"]
+    rows = sorted(totals.items(), key=lambda item: item[1][0], reverse=True)[:top_n]
+    return [{"site": site, "size_diff": size, "count_diff": count} for site, (size, count) in rows]
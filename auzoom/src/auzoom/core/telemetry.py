@@ -0,0 +1,158 @@
+"""Request latency histograms and per-phase timing for auzoom_stats."""
+
+import contextvars
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+PHASES = ("hash", "disk_load", "parse", "import_resolution", "serialization", "json_encode")
+
+# Log-spaced latency buckets: 0.05ms * 1.2^i, up to ~10 minutes
+_BUCKET_BASE_MS = 0.05
+_BUCKET_GROWTH = 1.2
+_BUCKET_COUNT = 90
+
+
+class LatencyHistogram:
+    """Fixed log-bucket histogram; percentiles are bucket upper bounds (<=20% error)."""
+
+    def __init__(self):
+        self.counts = [0] * (_BUCKET_COUNT + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: float):
+        """Record one latency sample."""
+        if ms <= _BUCKET_BASE_MS:
+            bucket = 0
+        else:
+            bucket = min(_BUCKET_COUNT, 1 + int(math.log(ms / _BUCKET_BASE_MS, _BUCKET_GROWTH)))
+        self.counts[bucket] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, p: float) -> float:
+        """Upper bound (ms) of the bucket holding the p-th percentile sample."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * p / 100))
+        seen = 0
+        for bucket, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(self.max_ms, _BUCKET_BASE_MS * _BUCKET_GROWTH ** bucket)
+        return self.max_ms
+
+    def snapshot(self) -> dict:
+        """Count, percentiles, max and mean in milliseconds."""
+        return {
+            "count": self.count,
+            "p50_ms": round(self.percentile(50), 2),
+            "p95_ms": round(self.percentile(95), 2),
+            "p99_ms": round(self.percentile(99), 2),
+            "max_ms": round(self.max_ms, 2),
+            "mean_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+        }
+
+
+class Telemetry:
+    """Collect per-tool latency, per-phase time, bytes read and parse origin.
+
+    Phases are timed with ``phase(name)``; time is attributed both to the
+    global totals and to the request running on the current thread, so a
+    JSONL trace line (``AUZOOM_TRACE``) shows where each request spent its
+    time. The request is tracked in a context variable, so worker threads
+    started with a copy of the caller's context (``contextvars.copy_context``)
+    count toward it. Threads doing background work call ``set_origin("warmer")``
+    so their parses are counted separately from foreground (tool call) parses.
+
+    Args:
+        trace_path: Optional JSONL file receiving one line per request
+    """
+
+    def __init__(self, trace_path: Optional[str] = None):
+        self.tools: dict[str, LatencyHistogram] = {}
+        self.phases = {name: [0, 0.0] for name in PHASES}  # name -> [count, seconds]
+        self.bytes_read = 0
+        self.parses = {"foreground": 0, "warmer": 0}
+        self.trace_path = trace_path
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._request_phases = contextvars.ContextVar(f"auzoom_request_phases_{id(self)}", default=None)
+
+    def set_origin(self, origin: str):
+        """Tag work on the current thread as "foreground" or "warmer"."""
+        self._local.origin = origin
+
+    @contextmanager
+    def request(self, tool: str):
+        """Time one tool call, collecting its phase breakdown."""
+        phases = {}
+        token = self._request_phases.set(phases)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            ms = (time.perf_counter() - start) * 1000
+            self._request_phases.reset(token)
+            with self._lock:
+                self.tools.setdefault(tool, LatencyHistogram()).add(ms)
+            if self.trace_path:
+                self._trace({"ts": time.time(), "tool": tool, "ms": round(ms, 3),
+                             "phases_ms": {k: round(v * 1000, 3) for k, v in phases.items()}})
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time one phase of work (see PHASES)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, time.perf_counter() - start)
+
+    def add_phase(self, name: str, seconds: float):
+        """Record phase time measured elsewhere."""
+        with self._lock:
+            entry = self.phases.setdefault(name, [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+            request_phases = self._request_phases.get()
+            if request_phases is not None:  # Shared with the request's worker threads
+                request_phases[name] = request_phases.get(name, 0.0) + seconds
+
+    def add_bytes_read(self, n: int):
+        """Count bytes read from disk (source files and cache metadata)."""
+        with self._lock:
+            self.bytes_read += n
+
+    def count_parse(self):
+        """Attribute one parse to the current thread's origin."""
+        origin = getattr(self._local, "origin", "foreground")
+        with self._lock:
+            self.parses[origin] = self.parses.get(origin, 0) + 1
+
+    def snapshot(self) -> dict:
+        """Stats for auzoom_stats."""
+        with self._lock:
+            return {
+                "tools": {name: h.snapshot() for name, h in sorted(self.tools.items())},
+                "phases": {
+                    name: {"count": count, "total_ms": round(seconds * 1000, 2)}
+                    for name, (count, seconds) in self.phases.items()
+                },
+                "bytes_read": self.bytes_read,
+                "parses_by_origin": dict(self.parses),
+            }
+
+    def _trace(self, record: dict):
+        """Append one JSONL trace record (errors never fail the request)."""
+        try:
+            with self._lock, open(self.trace_path, "a") as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError:
+            pass
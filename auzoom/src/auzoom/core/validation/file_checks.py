@@ -0,0 +1,30 @@
+"""Per-file rule evaluation, usable in-process or in a worker process."""
+
+import hashlib
+
+from .rules import ModuleFacts, Rule, evaluate
+
+
+def check_file(file_path: str, data: bytes, nodes: list, rules: list[Rule]) -> dict[str, list[dict]]:
+    """Violations (as dicts) per rule key for one file's content and parsed nodes."""
+    line_count = data.count(b"\n") + (1 if data and not data.endswith(b"\n") else 0)
+    lines = data.decode("utf-8", errors="replace").splitlines()
+    return evaluate(rules, ModuleFacts(file_path, line_count, lines), nodes)
+
+
+def check_file_in_worker(file_path: str, resolved: str, rules: list[Rule]) -> tuple[str, dict, str]:
+    """Read, hash, parse and check one file (process pool entry point).
+
+    Returns:
+        (content hash, violations per rule key, parse error or "")
+    """
+    from ..parsing.parser import PythonParser
+
+    with open(resolved, "rb") as f:
+        data = f.read()
+    try:
+        nodes, error = PythonParser().parse_file(resolved), ""
+    except Exception as e:
+        nodes, error = [], str(e)
+    content_hash = hashlib.sha256(data).hexdigest()[:8]
+    return content_hash, check_file(file_path, data, nodes, rules), error
@@ -0,0 +1,84 @@
+"""Persisted per-file validation results, keyed by stat and content hash."""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+
+class ValidationResultCache:
+    """Remember each file's violations, per rule, for the file version they were computed on.
+
+    A lookup first compares (mtime_ns, size): unchanged files cost one stat
+    call. A file whose stat changed but whose content hash did not (touch,
+    checkout) reuses its entry after hashing. Results are stored per rule
+    key (rule name and limit), so enabling another rule computes only that
+    rule, and changing a limit invalidates only its own results.
+
+    Args:
+        cache_file: JSON file holding all entries (None: memory only)
+    """
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.entries = self._load()  # path -> {"stat", "hash", "rules": {rule key: violations}}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        """Load persisted entries (empty on first run, corruption or an older layout)."""
+        if not self.cache_file:
+            return {}
+        try:
+            entries = json.loads(self.cache_file.read_text())
+        except (OSError, ValueError):
+            return {}
+        return {path: entry for path, entry in entries.items() if "rules" in entry}
+
+    def lookup(self, path: str, stat: tuple[int, int], content_hash: Optional[str] = None) -> tuple[Optional[str], dict]:
+        """(content hash, results per rule key) stored for this file version.
+
+        Without content_hash the version is matched by stat; with it, by
+        hash (refreshing the stored stat). No match gives (content_hash, {}).
+        """
+        entry = self.entries.get(path)
+        if entry and content_hash is None and tuple(entry["stat"]) == stat:
+            return entry["hash"], entry["rules"]
+        if entry and content_hash is not None and entry["hash"] == content_hash:
+            with self._lock:
+                entry["stat"] = list(stat)
+                self._dirty = True
+            return content_hash, entry["rules"]
+        return content_hash, {}
+
+    def record(self, hit: bool):
+        """Count one file served wholly from cache (hit) or not."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def put(self, path: str, stat: tuple[int, int], content_hash: str, results: dict[str, list[dict]]):
+        """Record rule results for one file version (merged with that version's others)."""
+        with self._lock:
+            entry = self.entries.get(path)
+            if not entry or entry["hash"] != content_hash:
+                entry = self.entries[path] = {"stat": list(stat), "hash": content_hash, "rules": {}}
+            entry["stat"] = list(stat)
+            entry["rules"].update(results)
+            self._dirty = True
+
+    def save(self):
+        """Write entries atomically if anything changed."""
+        if not self.cache_file or not self._dirty:
+            return
+        with self._lock:
+            snapshot = json.dumps(self.entries)
+            self._dirty = False
+        tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{threading.get_ident()}.tmp")
+        tmp_file.write_text(snapshot)
+        os.replace(tmp_file, self.cache_file)
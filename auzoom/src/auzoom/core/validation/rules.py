@@ -0,0 +1,131 @@
+"""Pluggable per-file validation rules, evaluated together in one pass over parsed nodes."""
+
+import ast
+import textwrap
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+FUNCTION_TYPES = ("function", "method")
+DOCUMENTED_TYPES = ("function", "method", "class")
+_BLOCKS = (ast.If, ast.For, ast.AsyncFor, ast.While, ast.With, ast.AsyncWith, ast.Try, ast.Match)
+_SCOPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)
+
+
+@dataclass(frozen=True)
+class ModuleFacts:
+    """What module-level rules and node measures may look at."""
+    file_path: str
+    line_count: int
+    lines: list[str]  # Decoded source lines (node.line_start is 1-based into these)
+
+
+@dataclass(frozen=True)
+class Rule:
+    """One check: a violation wherever measure(...) exceeds limit.
+
+    Module rules (node_types empty) are measured once per file as
+    measure(None, module); node rules once per node of a listed type as
+    measure(node, module). Rules are frozen and reference module-level
+    measures, so they pickle to worker processes.
+    """
+    name: str
+    violation: str  # Violation.type
+    limit: int
+    measure: Callable[[Optional[object], ModuleFacts], int]
+    message: str  # Formatted with name, limit and current
+    node_types: tuple[str, ...] = ()
+    severity: str = "error"
+
+    @property
+    def key(self) -> str:
+        """Identifies results computed by this rule at this limit."""
+        return f"{self.name}:{self.limit}"
+
+
+def evaluate(rules: list[Rule], module: ModuleFacts, nodes: list) -> dict[str, list[dict]]:
+    """Run rules over one file in a single pass: rule key -> violations (as dicts)."""
+    results = {rule.key: [] for rule in rules}
+    for rule in rules:
+        if not rule.node_types:
+            _apply(rule, None, module, results[rule.key])
+    node_rules = [rule for rule in rules if rule.node_types]
+    for node in nodes if node_rules else ():
+        for rule in node_rules:
+            if node.node_type.value in rule.node_types:
+                _apply(rule, node, module, results[rule.key])
+    return results
+
+
+def _apply(rule: Rule, node, module: ModuleFacts, found: list[dict]):
+    """Append rule's violation for one node (or the module) if over the limit."""
+    current = rule.measure(node, module)
+    if current > rule.limit:
+        found.append({
+            "file": module.file_path,
+            "line": node.line_start if node else 1,
+            "type": rule.violation,
+            "severity": rule.severity,
+            "message": rule.message.format(name=node.name if node else "", limit=rule.limit, current=current),
+            "current": current,
+            "limit": rule.limit,
+        })
+
+
+def _module_length(node, module: ModuleFacts) -> int:
+    """Lines in the module."""
+    return module.line_count
+
+
+def _function_length(node, module: ModuleFacts) -> int:
+    """Lines spanned by a function, decorators included."""
+    return node.line_end - node.line_start + 1
+
+
+def _nesting_depth(node, module: ModuleFacts) -> int:
+    """Deepest nesting of control-flow blocks in a function's own body."""
+    source = textwrap.dedent("\n".join(module.lines[node.line_start - 1:node.line_end]))
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return 0
+    function = next((n for n in tree.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))), None)
+    return max((_block_depth(stmt) for stmt in function.body), default=0) if function else 0
+
+
+def _block_depth(tree: ast.AST) -> int:
+    """Nesting depth of blocks at and under tree, not entering nested scopes."""
+    if isinstance(tree, _SCOPES):
+        return 0
+    inner = max((_block_depth(child) for child in ast.iter_child_nodes(tree)), default=0)
+    return inner + 1 if isinstance(tree, _BLOCKS) else inner
+
+
+def _parameter_count(node, module: ModuleFacts) -> int:
+    """Declared parameters, not counting self/cls."""
+    signature = node.signature or ""
+    parameters = signature[signature.find("("):] if "(" in signature else "()"
+    try:
+        args = ast.parse(f"def f{parameters}: pass").body[0].args
+    except SyntaxError:
+        return 0
+    names = [a.arg for a in (*args.posonlyargs, *args.args, *args.kwonlyargs)]
+    names += [a.arg for a in (args.vararg, args.kwarg) if a]
+    return len(names) - (1 if names[:1] in (["self"], ["cls"]) else 0)
+
+
+def _missing_docstring(node, module: ModuleFacts) -> int:
+    """1 for a public function, method or class without a docstring."""
+    return int(not node.docstring and not node.name.startswith("_"))
+
+
+RULES: dict[str, Rule] = {rule.name: rule for rule in (
+    Rule("module_length", "module_too_long", 250, _module_length, "Module exceeds {limit} lines"),
+    Rule("function_length", "function_too_long", 50, _function_length,
+         "Function '{name}' exceeds {limit} lines", FUNCTION_TYPES),
+    Rule("nesting_depth", "nesting_too_deep", 4, _nesting_depth,
+         "Function '{name}' nests blocks {current} deep (limit: {limit})", FUNCTION_TYPES, "warning"),
+    Rule("parameter_count", "too_many_parameters", 5, _parameter_count,
+         "Function '{name}' takes {current} parameters (limit: {limit})", FUNCTION_TYPES, "warning"),
+    Rule("docstring", "missing_docstring", 0, _missing_docstring,
+         "'{name}' has no docstring", DOCUMENTED_TYPES, "warning"),
+)}
@@ -0,0 +1,35 @@
+"""Single pruned directory walk for project validation."""
+
+import os
+from typing import Iterator
+
+IGNORED_DIRS = frozenset({
+    '.git', '__pycache__', '.venv', 'node_modules', '.pytest_cache', 'build', 'dist', '.auzoom'
+})
+
+
+def walk_python_tree(root: str) -> Iterator[tuple[str, list[str]]]:
+    """Yield (directory, Python files directly in it) for every directory under root.
+
+    One os.scandir per directory provides both the file list and the
+    subdirectories to descend into; ignored directories are pruned before
+    they are entered, and symlinked directories are not followed.
+    Unreadable directories are skipped.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        files, subdirs = [], []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in IGNORED_DIRS:
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        files.append(entry.path)
+        except OSError:
+            continue
+        files.sort()
+        yield directory, files
+        stack.extend(sorted(subdirs, reverse=True))  # Visit in name order
@@ -1,8 +1,18 @@
 """Code structure validation for AuZoom compatibility."""
 
-from dataclasses import dataclass
-from typing import List
+import hashlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Iterator, List, Optional
 from pathlib import Path
+from .validation.file_checks import check_file, check_file_in_worker
+from .validation.result_cache import ValidationResultCache
+from .validation.rules import RULES, Rule
+from .validation.walk import walk_python_tree
+
+DIRECTORY_RULE = "directory_size"  # Checked during the walk rather than per file
 
 
 @dataclass
@@ -10,7 +20,7 @@ class Violation:
     """A structural code violation."""
     file: str
     line: int
-    type: str  # "function_too_long", "module_too_long", "dir_too_many_files"
+    type: str  # Rule.violation of the rule that found it, or "dir_too_many_files"
     severity: str  # "error", "warning"
     message: str
     current: int
@@ -18,105 +28,174 @@ class Violation:
 
 
 class CodeValidator:
-    """Validate code structure for AuZoom compatibility."""
+    """Validate code structure for AuZoom compatibility.
+
+    Checks are rules (see validation.rules): every enabled rule runs in one
+    pass over a file's parsed nodes, plus the directory_size check made
+    during the project walk. Nodes come from the shared LazyCodeGraph when
+    one is given (its in-memory or on-disk node cache, parsing only cache
+    misses), otherwise from a local parser. Results are kept per rule and
+    file version (cache_file persists them), so re-validating an unchanged
+    tree costs one stat per file and enabling a rule computes only that rule.
+
+    Args:
+        graph: Optional LazyCodeGraph to take parsed nodes from
+        cache_file: Optional JSON file persisting per-file results
+    """
 
     FUNCTION_MAX_LINES = 50
     MODULE_MAX_LINES = 250
     DIR_MAX_FILES = 7
+    PARALLEL_MIN_FILES = 64  # Fewer uncached files are not worth starting worker processes
+    DEFAULT_RULES = ("module_length", "function_length", DIRECTORY_RULE)
 
-    def __init__(self):
+    def __init__(self, graph=None, cache_file: Optional[Path] = None):
         self.violations: List[Violation] = []
-
-    def validate_file(self, file_path: str) -> List[Violation]:
+        self.graph = graph
+        self.results = ValidationResultCache(cache_file)
+        self._parser = None
+
+    def select_rules(self, names: Optional[list[str]] = None) -> tuple[list[Rule], bool]:
+        """File rules for a rule name subset (None: DEFAULT_RULES), and whether directory_size is on.
+
+        Raises:
+            ValueError: If a name is not a known rule
+        """
+        names = self.DEFAULT_RULES if names is None else names
+        unknown = sorted(set(names) - set(RULES) - {DIRECTORY_RULE})
+        if unknown:
+            raise ValueError(f"Unknown rules: {', '.join(unknown)} (available: {', '.join([*RULES, DIRECTORY_RULE])})")
+        limits = {"function_length": self.FUNCTION_MAX_LINES, "module_length": self.MODULE_MAX_LINES}
+        rules = [replace(rule, limit=limits.get(name, rule.limit)) for name, rule in RULES.items() if name in names]
+        return rules, DIRECTORY_RULE in names
+
+    def validate_file(self, file_path: str, rules: Optional[list[str]] = None) -> List[Violation]:
         """Check a single Python file for violations."""
-        violations = []
-
-        with open(file_path) as f:
-            lines = f.readlines()
-
-        # Check module length
-        module_lines = len(lines)
-        if module_lines > self.MODULE_MAX_LINES:
-            violations.append(Violation(
-                file=file_path,
-                line=1,
-                type="module_too_long",
-                severity="error",
-                message=f"Module exceeds {self.MODULE_MAX_LINES} lines",
-                current=module_lines,
-                limit=self.MODULE_MAX_LINES
-            ))
-
-        # Parse with tree-sitter to check function lengths
-        try:
-            from .parser import PythonParser
-            parser = PythonParser()
-            nodes = parser.parse_file(file_path)
-
-            for node in nodes:
-                if node.node_type.value in ['function', 'method']:
-                    func_lines = node.line_end - node.line_start + 1
-                    if func_lines > self.FUNCTION_MAX_LINES:
-                        violations.append(Violation(
-                            file=file_path,
-                            line=node.line_start,
-                            type="function_too_long",
-                            severity="error",
-                            message=f"Function '{node.name}' exceeds {self.FUNCTION_MAX_LINES} lines",
-                            current=func_lines,
-                            limit=self.FUNCTION_MAX_LINES
-                        ))
-        except Exception as e:
-            # If parsing fails, skip function-level validation
-            pass
-
+        violations = list(self._validate_one(file_path, self.select_rules(rules)[0]))
+        self.results.save()
         return violations
 
-    def validate_directory(self, dir_path: str) -> List[Violation]:
+    def _lookup(self, file_path: str, rules: list[Rule]) -> tuple[str, tuple[int, int], Optional[str], dict, list[Rule]]:
+        """(resolved path, stat key, content hash, cached results per rule key, rules still to run)."""
+        path = str(Path(file_path).resolve())
+        stat = os.stat(path)
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        content_hash, results = self.results.lookup(path, stat_key)
+        if any(rule.key not in results for rule in rules):
+            with open(path, "rb") as f:
+                digest = hashlib.file_digest(f, "sha256").hexdigest()[:8]
+            content_hash, results = self.results.lookup(path, stat_key, digest)
+        missing = [rule for rule in rules if rule.key not in results]
+        self.results.record(not missing)
+        return path, stat_key, content_hash, results, missing
+
+    def _validate_one(self, file_path: str, rules: list[Rule]) -> Iterator[Violation]:
+        """Violations of one file: cached rules reused, the rest run in-process and stored."""
+        return self._complete(file_path, self._lookup(file_path, rules), rules)
+
+    def _complete(self, file_path: str, lookup: tuple, rules: list[Rule]) -> Iterator[Violation]:
+        """Violations of one looked-up file, running its missing rules in-process."""
+        path, stat_key, content_hash, results, missing = lookup
+        if missing:
+            try:
+                nodes = self._file_nodes(path)
+            except Exception as e:
+                # If parsing fails, skip node-level rules
+                print(f"Warning: Could not parse {file_path}: {e}", file=sys.stderr)
+                nodes = []
+            computed = check_file(file_path, Path(path).read_bytes(), nodes, missing)
+            self.results.put(path, stat_key, content_hash, computed)
+            results = {**results, **computed}
+        return _violations(results, rules)
+
+    def _file_nodes(self, resolved: str) -> list:
+        """Parsed nodes of a file: from the graph's cache, else a local parser."""
+        if self.graph is not None:
+            errors = self.graph.load_files([resolved])
+            if errors:
+                raise RuntimeError(errors[resolved])
+            return self.graph.file_nodes(resolved)
+        if self._parser is None:
+            from .parsing.parser import PythonParser
+            self._parser = PythonParser()
+        return self._parser.parse_file(resolved)
+
+    def validate_directory(self, dir_path: str, rules: Optional[list[str]] = None) -> List[Violation]:
         """Check directory for too many files."""
-        violations = []
         path = Path(dir_path)
-
-        if not path.is_dir():
-            return violations
-
-        # Count Python files (not subdirectories)
-        py_files = list(path.glob("*.py"))
-        file_count = len(py_files)
-
-        if file_count > self.DIR_MAX_FILES:
-            violations.append(Violation(
-                file=str(path),
-                line=0,
-                type="dir_too_many_files",
-                severity="warning",
-                message=f"Directory has {file_count} files (limit: {self.DIR_MAX_FILES})",
-                current=file_count,
-                limit=self.DIR_MAX_FILES
-            ))
-
-        return violations
-
-    def validate_project(self, project_root: str) -> List[Violation]:
+        if not path.is_dir() or not self.select_rules(rules)[1]:
+            return []
+        with os.scandir(path) as entries:
+            file_count = sum(1 for e in entries if e.name.endswith(".py") and e.is_file())
+        return self._directory_violations(str(path), file_count)
+
+    def _directory_violations(self, dir_path: str, file_count: int) -> List[Violation]:
+        """dir_too_many_files warning if file_count is over the limit."""
+        if file_count <= self.DIR_MAX_FILES:
+            return []
+        return [Violation(
+            file=dir_path,
+            line=0,
+            type="dir_too_many_files",
+            severity="warning",
+            message=f"Directory has {file_count} files (limit: {self.DIR_MAX_FILES})",
+            current=file_count,
+            limit=self.DIR_MAX_FILES
+        )]
+
+    def validate_project(self, project_root: str, rules: Optional[list[str]] = None) -> List[Violation]:
         """Validate entire project."""
-        violations = []
-        root = Path(project_root)
-
-        for py_file in root.rglob("*.py"):
-            # Skip common ignore patterns
-            if any(part in py_file.parts for part in ['.git', '__pycache__', '.venv', 'node_modules', '.pytest_cache', 'build', 'dist']):
-                continue
-
-            violations.extend(self.validate_file(str(py_file)))
-
-        # Check directories
-        for dir_path in root.rglob("*"):
-            if dir_path.is_dir():
-                if any(part in dir_path.parts for part in ['.git', '__pycache__', '.venv', 'node_modules', '.pytest_cache', 'build', 'dist']):
-                    continue
-                violations.extend(self.validate_directory(str(dir_path)))
-
-        return violations
+        return list(self.iter_project(project_root, rules))
+
+    def iter_project(self, project_root: str, rules: Optional[list[str]] = None) -> Iterator[Violation]:
+        """Yield a project's violations as they are found.
+
+        One pruned scandir walk yields each directory with its Python files,
+        whatever rules are enabled. Directory limits and cached file results
+        are reported during the walk; files with rules left to run are
+        checked afterwards, on a process pool (AUZOOM_VALIDATE_WORKERS,
+        default CPU count) when there are at least PARALLEL_MIN_FILES of
+        them, otherwise in-process via the graph.
+        """
+        file_rules, check_dirs = self.select_rules(rules)
+        pending = []
+        try:
+            for directory, files in walk_python_tree(str(project_root)):
+                if check_dirs:
+                    yield from self._directory_violations(directory, len(files))
+                for file_path in files:
+                    lookup = self._lookup(file_path, file_rules)
+                    if lookup[-1]:  # Rules still to run
+                        pending.append((file_path, lookup))
+                    else:
+                        yield from _violations(lookup[3], file_rules)
+            yield from self._check_pending(pending, file_rules)
+        finally:
+            self.results.save()
+
+    def _check_pending(self, pending: list[tuple], rules: list[Rule]) -> Iterator[Violation]:
+        """Run outstanding rules on (file path, lookup) pairs, in parallel when there are many.
+
+        The walk's lookups are reused, so no file is hashed or counted twice.
+        """
+        workers = int(os.environ.get("AUZOOM_VALIDATE_WORKERS", os.cpu_count() or 1))
+        if workers < 2 or len(pending) < self.PARALLEL_MIN_FILES:
+            for file_path, lookup in pending:
+                yield from self._complete(file_path, lookup, rules)
+            return
+        file_paths = [file_path for file_path, _ in pending]
+        paths = [lookup[0] for _, lookup in pending]
+        missing = [lookup[4] for _, lookup in pending]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            checked = pool.map(
+                check_file_in_worker, file_paths, paths, missing,
+                chunksize=max(1, len(pending) // (workers * 8))
+            )
+            for (file_path, (path, stat_key, _, results, _)), (content_hash, computed, error) in zip(pending, checked):
+                if error:
+                    print(f"Warning: Could not parse {file_path}: {error}", file=sys.stderr)
+                self.results.put(path, stat_key, content_hash, computed)
+                yield from _violations({**results, **computed}, rules)
 
     def format_report(self, violations: List[Violation]) -> str:
         """Format violations as readable report."""
@@ -142,8 +221,13 @@ class CodeValidator:
         if warnings:
             report.append(f"⚠️  Warnings ({len(warnings)}):\n")
             for v in warnings:
-                report.append(f"  {v.file}")
+                report.append(f"  {v.file}:{v.line}" if v.line else f"  {v.file}")
                 report.append(f"    {v.message}")
                 report.append("")
 
         return "\n".join(report)
+
+
+def _violations(results: dict[str, list[dict]], rules: list[Rule]) -> Iterator[Violation]:
+    """Violation objects for the enabled rules' results, in rule order."""
+    return (Violation(**v) for rule in rules for v in results[rule.key])
@@ -0,0 +1,115 @@
+"""Minified encoding of tool results, split into chunks at item boundaries."""
+
+import json
+import os
+from functools import lru_cache
+from typing import Iterator, Optional
+from ..core.graph.traversal_cursors import TraversalCursorStore
+
+DEFAULT_CHUNK_BYTES = 256 * 1024  # Tool results above this are split into chunks
+CHUNKED_KEYS = ("nodes", "files")  # List fields that can be split at item boundaries
+IDENTIFYING_KEYS = ("type", "file_path", "level")  # Repeated on every chunk after the first
+
+
+class ResultChunker:
+    """Encode tool results once, chunking those larger than chunk_bytes.
+
+    A chunked response carries the first chunk plus a "chunk" record whose
+    next_cursor is passed back as ``{"chunk_cursor": ...}`` to the same
+    tool (one whose schema documents chunk_cursor) to fetch the next chunk.
+
+    Args:
+        server: AuZoomMCPServer (telemetry and instrumentation of continuations)
+        chunk_bytes: Chunking threshold (default: AUZOOM_CHUNK_BYTES or 256 KiB)
+    """
+
+    def __init__(self, server, chunk_bytes: Optional[int] = None):
+        self.server = server
+        self.chunk_bytes = chunk_bytes or int(os.environ.get("AUZOOM_CHUNK_BYTES", DEFAULT_CHUNK_BYTES))
+        self.cursors = TraversalCursorStore()  # Remaining chunks of large results
+
+    def encode(self, result: dict) -> str:
+        """Minified JSON for a tool result, split into chunks when oversized.
+
+        Each item of the result's list field is encoded exactly once. Those
+        encodings decide whether to chunk (from their summed size, before
+        any full encode) and are spliced into the response text; items of
+        later chunks are parked already encoded.
+        """
+        with self.server.telemetry.phase("json_encode"):
+            key = next((k for k in CHUNKED_KEYS if isinstance(result.get(k), list)), None)
+            if key is None or len(result[key]) < 2:
+                return _dumps(result)
+            head = {k: v for k, v in result.items() if k != key}
+            head_text = _dumps(head)
+            items = [_dumps(item) for item in result[key]]
+            if len(head_text) + sum(map(len, items)) + len(items) <= self.chunk_bytes:
+                return _append_fields(head_text, [(key, _array(items))])
+
+            context = {
+                "key": key,
+                "index": 0,
+                "total": len(items),
+                "head": {k: head[k] for k in IDENTIFYING_KEYS if k in head}
+            }
+            page = self.cursors.first_page(_group(items, self.chunk_bytes), context, page_size=1)
+            return self._chunk_text(head_text, page)
+
+    def next_chunk(self, tool_name: str, cursor: str) -> str:
+        """Encoded next chunk of a chunked result (recorded as a call of tool_name)."""
+        if tool_name not in _chunked_tools():
+            return _dumps({"error": f"{tool_name} does not accept chunk_cursor"})
+        with self.server.instrument(tool_name):
+            try:
+                page = self.cursors.next_page(cursor, page_size=1)
+            except KeyError as e:
+                return _dumps({"error": str(e.args[0]), "chunk_cursor": cursor})
+            page["context"]["index"] += 1
+            with self.server.telemetry.phase("json_encode"):
+                return self._chunk_text(_dumps(page["context"]["head"]), page)
+
+    def _chunk_text(self, head_text: str, page: dict) -> str:
+        """One chunk: head fields, the chunk's pre-encoded items and a chunk record."""
+        context = page["context"]
+        chunk = {"index": context["index"], "total_items": context["total"], "next_cursor": page["next_cursor"]}
+        return _append_fields(head_text, [(context["key"], _array(page["items"][0])), ("chunk", _dumps(chunk))])
+
+
+def _dumps(value) -> str:
+    """Minified JSON."""
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _array(encoded_items: list[str]) -> str:
+    """JSON array text from already-encoded items."""
+    return "[" + ",".join(encoded_items) + "]"
+
+
+def _append_fields(object_text: str, fields: list[tuple[str, str]]) -> str:
+    """Add already-encoded fields to the end of an encoded JSON object."""
+    extra = ",".join(f"{_dumps(name)}:{value}" for name, value in fields)
+    separator = "" if object_text == "{}" else ","
+    return object_text[:-1] + separator + extra + "}"
+
+
+def _group(encoded_items: list[str], max_bytes: int) -> Iterator[list[str]]:
+    """Consecutive runs of encoded items up to max_bytes each (at least one item per run)."""
+    group, size = [], 0
+    for text in encoded_items:
+        if group and size + len(text) + 1 > max_bytes:
+            yield group
+            group, size = [], 0
+        group.append(text)
+        size += len(text) + 1
+    if group:
+        yield group
+
+
+@lru_cache(maxsize=1)
+def _chunked_tools() -> frozenset[str]:
+    """Tools whose schema documents chunk_cursor."""
+    from .tools_schema import get_tools_manifest
+    return frozenset(
+        tool["name"] for tool in get_tools_manifest()["tools"]
+        if "chunk_cursor" in tool["inputSchema"].get("properties", {})
+    )
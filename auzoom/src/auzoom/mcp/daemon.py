@@ -0,0 +1,242 @@
+"""Shared per-project daemon and the thin stdio shim that talks to it."""
+
+import asyncio
+import fcntl
+import hashlib
+import os
+import socket
+import stat
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+from .jsonrpc_handler import JSONRPCHandler
+
+DEFAULT_IDLE_TIMEOUT = 600.0  # Seconds without clients before the daemon exits
+CONNECT_TIMEOUT = 30.0  # Seconds a shim waits for a freshly spawned daemon
+MAX_LINE_BYTES = 16 * 1024 * 1024  # Largest JSON-RPC request line accepted
+
+
+def socket_path(project_root: str) -> str:
+    """Unix socket path for a project's daemon.
+
+    Lives in runtime_dir() rather than .auzoom/ because socket paths are
+    limited to ~100 bytes; the name hashes the resolved project root.
+    """
+    root = str(Path(project_root).resolve())
+    digest = hashlib.sha1(root.encode()).hexdigest()[:16]
+    return os.path.join(runtime_dir(), f"{digest}.sock")
+
+
+def runtime_dir() -> str:
+    """Private per-user directory for daemon sockets and lock files.
+
+    $XDG_RUNTIME_DIR/auzoom when set, else auzoom-<uid> in the temp dir.
+    An existing directory must be a real directory owned by this user and
+    closed to everyone else, so no other user can plant a socket there.
+
+    Raises:
+        PermissionError: If the directory is a symlink, foreign-owned or shared
+    """
+    base = os.environ.get("XDG_RUNTIME_DIR")
+    path = os.path.join(base, "auzoom") if base else os.path.join(tempfile.gettempdir(), f"auzoom-{os.getuid()}")
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise PermissionError(f"Refusing to use {path}: not a private directory of uid {os.getuid()}")
+    return path
+
+
+class AuZoomDaemon:
+    """Long-lived server that owns one graph and serves many sessions.
+
+    Every client connection gets its own JSONRPCHandler (request ids are
+    per connection) on top of the single shared AuZoomMCPServer, so all
+    sessions hit the same warm node cache. The daemon exits once no
+    client has been connected for idle_timeout seconds.
+
+    Args:
+        project_root: Project directory to serve
+        sock_path: Unix socket to listen on (default: socket_path(project_root))
+        idle_timeout: Seconds with no clients before shutdown
+        auto_warm: Passed through to AuZoomMCPServer
+    """
+
+    def __init__(self, project_root: str, sock_path: Optional[str] = None,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT, auto_warm: bool = True):
+        from .server import AuZoomMCPServer
+        self.server = AuZoomMCPServer(project_root, auto_warm=auto_warm, background_init=True)
+        self.sock_path = sock_path or socket_path(project_root)
+        self.idle_timeout = idle_timeout
+        self.clients = 0
+        self.sessions_served = 0
+        self._idle_handle = None
+        self._stopped: Optional[asyncio.Event] = None
+
+    def run(self):
+        """Serve until idle, then remove the socket."""
+        try:
+            asyncio.run(self.serve())
+        finally:
+            self.server.shutdown()
+
+    async def serve(self):
+        """Listen on the Unix socket until the idle timeout fires."""
+        self._stopped = asyncio.Event()
+        if os.path.exists(self.sock_path):
+            os.unlink(self.sock_path)  # Stale: callers only spawn us when connect failed
+        old_umask = os.umask(0o077)  # Created owner-only: no window before a chmod
+        try:
+            listener = await asyncio.start_unix_server(
+                self._handle_client, path=self.sock_path, limit=MAX_LINE_BYTES
+            )
+        finally:
+            os.umask(old_umask)
+        self._arm_idle_timer()
+        try:
+            await self._stopped.wait()
+        finally:
+            listener.close()
+            await listener.wait_closed()
+            if os.path.exists(self.sock_path):
+                os.unlink(self.sock_path)
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve one shim connection with its own JSON-RPC handler."""
+        if _peer_uid(writer.get_extra_info("socket"), self.sock_path) != os.getuid():
+            writer.close()  # Only this user's shims may share the graph
+            return
+        self.clients += 1
+        self.sessions_served += 1
+        self._disarm_idle_timer()
+
+        write_lock = asyncio.Lock()
+
+        async def write(line: str):
+            # Drain after every response so a slow client applies backpressure
+            # (the handler stops reading requests) instead of growing the buffer
+            async with write_lock:
+                writer.write(line.encode() + b"\n")
+                await writer.drain()
+
+        try:
+            await JSONRPCHandler(self.server).serve(reader.readline, write)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            self.clients -= 1
+            if self.clients == 0:
+                self._arm_idle_timer()
+
+    def _arm_idle_timer(self):
+        """(Re)start the countdown to shutdown; called when no clients remain."""
+        loop = asyncio.get_running_loop()
+        self._disarm_idle_timer()
+        self._idle_handle = loop.call_later(self.idle_timeout, self._stopped.set)
+
+    def _disarm_idle_timer(self):
+        """Cancel a pending shutdown because a client connected."""
+        if self._idle_handle:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+
+
+def connect(project_root: str, sock_path: Optional[str] = None) -> socket.socket:
+    """Connect to the project's daemon, spawning it if none is running.
+
+    A lock file serializes concurrent shims so only one daemon is spawned.
+
+    Raises:
+        PermissionError: If the socket is served by another user
+        TimeoutError: If a spawned daemon never opens its socket
+    """
+    sock_path = sock_path or socket_path(project_root)
+    sock = _try_connect(sock_path)
+    if sock:
+        return sock
+
+    lock_fd = os.open(sock_path + ".lock", os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+    with os.fdopen(lock_fd, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        sock = _try_connect(sock_path)
+        if sock:
+            return sock
+        subprocess.Popen(
+            [sys.executable, "-m", "auzoom.mcp.daemon", str(project_root), sock_path],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+        deadline = time.monotonic() + CONNECT_TIMEOUT
+        while time.monotonic() < deadline:
+            sock = _try_connect(sock_path)
+            if sock:
+                return sock
+            time.sleep(0.05)
+    raise TimeoutError(f"AuZoom daemon did not start on {sock_path}")
+
+
+def run_shim(project_root: str):
+    """Relay stdin/stdout to the shared daemon (the per-session process)."""
+    sock = connect(project_root)
+    responses = sock.makefile("rb")
+
+    def pump_responses():
+        for line in responses:
+            sys.stdout.buffer.write(line)
+            sys.stdout.buffer.flush()
+
+    relay = threading.Thread(target=pump_responses, daemon=True)
+    relay.start()
+    for line in sys.stdin.buffer:
+        sock.sendall(line)
+    sock.shutdown(socket.SHUT_WR)  # EOF lets the daemon flush pending responses
+    relay.join()
+
+
+def _try_connect(sock_path: str) -> Optional[socket.socket]:
+    """Connected socket, or None when no daemon is listening.
+
+    Raises:
+        PermissionError: If the listening process belongs to another user
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(sock_path)
+    except OSError:
+        sock.close()
+        return None
+    if _peer_uid(sock, sock_path) != os.getuid():
+        sock.close()
+        raise PermissionError(f"{sock_path} is served by another user; refusing to relay to it")
+    return sock
+
+
+def _peer_uid(sock, sock_path: str) -> int:
+    """User id of the process at the other end of a Unix socket.
+
+    SO_PEERCRED where the platform has it (Linux), else the socket file's owner.
+    """
+    if hasattr(socket, "SO_PEERCRED"):
+        creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+        return struct.unpack("3i", creds)[1]  # pid, uid, gid
+    return os.stat(sock_path).st_uid
+
+
+def main():
+    """Daemon entry point: python -m auzoom.mcp.daemon PROJECT_ROOT [SOCKET]."""
+    project_root = sys.argv[1] if len(sys.argv) > 1 else os.getcwd()
+    sock_path = sys.argv[2] if len(sys.argv) > 2 else None
+    idle = float(os.environ.get("AUZOOM_DAEMON_IDLE", DEFAULT_IDLE_TIMEOUT))
+    AuZoomDaemon(project_root, sock_path, idle_timeout=idle).run()
+
+
+if __name__ == "__main__":
+    main()
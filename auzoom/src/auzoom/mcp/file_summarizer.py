@@ -1,26 +1,41 @@
 """Non-Python file summarization for AuZoom."""
 
 import json
+import os
 import sys
 import threading
 import hashlib
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
+from ..core.caching.work_pool import FOREGROUND, PriorityWorkPool
+from ..core.documents.summaries import summarize_file
+
+DEFAULT_WORKERS = 2
 
 
 class FileSummarizer:
-    """Handle summarization and caching of non-Python files."""
+    """Handle summarization and caching of non-Python files.
+
+    Summaries are streamed from disk (core.documents.summaries), so memory
+    stays bounded for very large files, and generated on a small worker
+    pool (AUZOOM_SUMMARY_WORKERS, default 2). A file is summarized once per
+    content hash however many times it is read before the summary lands.
+    Summaries a reader asked for but did not get yet (FOREGROUND) run ahead
+    of speculative ones queued after full or line-range reads (BACKGROUND).
+    """
 
-    def __init__(self, cache_dir: Path):
+    def __init__(self, cache_dir: Path, max_workers: Optional[int] = None):
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        workers = max_workers or int(os.environ.get("AUZOOM_SUMMARY_WORKERS", DEFAULT_WORKERS))
+        self.pool = PriorityWorkPool(self._summarize_in_background, workers, name="auzoom-summary")
 
-    def load_cached_summary(self, file_path: Path) -> Optional[dict]:
-        """Load cached summary for a file."""
+    def load_cached_summary(self, file_path: Path, content_hash: Optional[str] = None) -> Optional[dict]:
+        """Load cached summary for a file (content_hash skips rehashing it)."""
         try:
-            content_hash = self._compute_hash(file_path)
-            cache_file = self.cache_dir / f"{file_path.name}_{content_hash}.json"
+            content_hash = content_hash or self._compute_hash(file_path)
+            cache_file = self._cache_file(file_path, content_hash)
 
             if cache_file.exists():
                 return json.loads(cache_file.read_text())
@@ -29,178 +44,61 @@ class FileSummarizer:
 
         return None
 
-    def schedule_summarization(self, file_path: Path, content: str):
-        """Schedule background summarization for a file."""
-        thread = threading.Thread(
-            target=self._summarize_in_background,
-            args=(file_path, content),
-            daemon=True
-        )
-        thread.start()
-
-    def _summarize_in_background(self, file_path: Path, content: str):
-        """Background thread to generate and cache summary."""
+    def schedule_summarization(
+        self,
+        file_path: Path,
+        content_hash: Optional[str] = None,
+        priority: int = FOREGROUND
+    ) -> bool:
+        """Queue summarization of a file unless it is already queued or running.
+
+        Args:
+            file_path: File to summarize
+            content_hash: Its content hash if known (else computed here)
+            priority: FOREGROUND (a reader asked for the summary) or
+                BACKGROUND (speculative, for later reads)
+
+        Returns:
+            True if a new job was queued
+        """
+        try:
+            content_hash = content_hash or self._compute_hash(file_path)
+        except OSError:
+            return False
+        if self._cache_file(file_path, content_hash).exists():
+            return False  # Finished since the caller's cache lookup
+        key = (str(file_path), content_hash)
+        return self.pool.submit(key, file_path, content_hash, priority=priority)
+
+    def shutdown(self, timeout: float = 5.0):
+        """Finish queued summaries (up to timeout) and stop the workers."""
+        self.pool.shutdown(timeout)
+
+    def _summarize_in_background(self, file_path: Path, content_hash: str):
+        """Pool job: stream one file version into a cached summary."""
+        cache_file = self._cache_file(file_path, content_hash)
+        if cache_file.exists():
+            return
         try:
-            lines = content.splitlines()
-
             summary = {
-                "summary": self._generate_summary_text(file_path, lines, content),
+                **summarize_file(file_path),
                 "file_type": file_path.suffix,
-                "line_count": len(lines),
-                "size_bytes": len(content.encode('utf-8')),
                 "generated_at": datetime.utcnow().isoformat() + "Z",
                 "version": "metadata_v1"
             }
 
-            content_hash = self._compute_hash(file_path)
-            cache_file = self.cache_dir / f"{file_path.name}_{content_hash}.json"
-            cache_file.write_text(json.dumps(summary, indent=2))
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{threading.get_ident()}.tmp")
+            tmp_file.write_text(json.dumps(summary, indent=2))
+            os.replace(tmp_file, cache_file)
 
         except Exception as e:
             print(f"Warning: Failed to generate summary for {file_path}: {e}", file=sys.stderr)
 
-    def _generate_summary_text(self, file_path: Path, lines: list, content: str) -> str:
-        """Generate basic metadata summary."""
-        file_type = file_path.suffix
-
-        if file_type in ['.md', '.txt', '.rst']:
-            return self._summarize_text_file(file_path, lines)
-        elif file_type in ['.json', '.yaml', '.yml', '.toml']:
-            return self._summarize_config_file(file_path, lines, content)
-        elif file_type in ['.js', '.ts', '.jsx', '.tsx', '.go', '.rs', '.java']:
-            return self._summarize_code_file(file_path, lines)
-        else:
-            return self._summarize_generic_file(file_path, lines, content)
-
-    def _summarize_text_file(self, file_path: Path, lines: list) -> str:
-        """Summarize text/markdown files."""
-        # Extract ALL headers (not just first 3 from first 20 lines)
-        headers = []
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith('#'):
-                # Preserve indentation level (# vs ## vs ###)
-                headers.append(stripped)
-
-        if headers:
-            header_summary = "\n".join(headers)
-        else:
-            header_summary = "No headers"
-
-        return f"""Document: {file_path.name}
-Type: {file_path.suffix}
-Lines: {len(lines)}
-Headers:
-{header_summary}"""
-
-    def _summarize_config_file(self, file_path: Path, lines: list, content: str) -> str:
-        """Summarize configuration files."""
-        basic_info = f"Configuration: {file_path.name}\nType: {file_path.suffix}\nLines: {len(lines)}\nSize: {len(content)} bytes"
-
-        # Try to parse and extract structure
-        structure = self._extract_config_structure(file_path, content)
-        if structure:
-            basic_info += f"\n\nStructure:\n{structure}"
-
-        return basic_info
-
-    def _extract_config_structure(self, file_path: Path, content: str) -> str:
-        """Extract structural info from config files."""
-        import re
-
-        try:
-            if file_path.suffix == '.json':
-                data = json.loads(content)
-                if isinstance(data, dict):
-                    keys = list(data.keys())[:10]  # Limit to first 10 keys
-                    return "Top-level keys: " + ", ".join(keys)
-
-            elif file_path.suffix in ['.yaml', '.yml']:
-                # Basic regex extraction (no pyyaml dependency needed)
-                keys = re.findall(r'^(\w+):', content, re.MULTILINE)[:10]
-                if keys:
-                    return "Top-level keys: " + ", ".join(keys)
-
-            elif file_path.suffix == '.toml':
-                # Extract section headers
-                sections = re.findall(r'^\[([^\]]+)\]', content, re.MULTILINE)
-                if sections:
-                    return "Sections: " + ", ".join(sections)
-
-        except Exception:
-            pass  # Fallback to basic info if parsing fails
-
-        return ""
-
-    def _summarize_code_file(self, file_path: Path, lines: list) -> str:
-        """Summarize non-Python code files."""
-        lang_map = {
-            '.js': 'JavaScript',
-            '.jsx': 'JavaScript',
-            '.ts': 'TypeScript',
-            '.tsx': 'TypeScript',
-            '.go': 'Go',
-            '.rs': 'Rust',
-            '.java': 'Java'
-        }
-        lang = lang_map.get(file_path.suffix, file_path.suffix)
-
-        basic_info = f"Code file: {file_path.name}\nLanguage: {lang}\nLines: {len(lines)}"
-
-        # Extract imports/exports
-        structure = self._extract_code_structure(file_path, lines, lang)
-        if structure:
-            basic_info += f"\n\n{structure}"
-
-        return basic_info
-
-    def _extract_code_structure(self, file_path: Path, lines: list, lang: str) -> str:
-        """Extract imports/exports from code files."""
-        import re
-        content = "\n".join(lines)
-
-        imports = []
-        exports = []
-
-        if lang in ['JavaScript', 'TypeScript']:
-            # ES6 imports: import X from 'Y'
-            imports = re.findall(r'import\s+.*?\s+from\s+[\'"]([^\'"]+)[\'"]', content)
-            # ES6 exports: export function/class/const
-            exports = re.findall(r'export\s+(?:function|class|const|interface|type|enum)\s+(\w+)', content)
-            # Also: export default
-            if re.search(r'export\s+default', content):
-                exports.append('default')
-
-        elif lang == 'Go':
-            # Go imports: import "package"
-            imports = re.findall(r'import\s+[\'"]([^\'"]+)[\'"]', content)
-            # Go exports: func NameStartsWithCapital
-            exports = re.findall(r'func\s+([A-Z]\w+)', content)
-
-        elif lang == 'Rust':
-            # Rust imports: use crate::module
-            imports = re.findall(r'use\s+([^;]+);', content)
-            # Rust public items: pub fn/struct/enum
-            exports = re.findall(r'pub\s+(?:fn|struct|enum|trait)\s+(\w+)', content)
-
-        elif lang == 'Java':
-            # Java imports: import package.Class
-            imports = re.findall(r'import\s+([^;]+);', content)
-            # Java public classes/interfaces
-            exports = re.findall(r'public\s+(?:class|interface|enum)\s+(\w+)', content)
-
-        result = []
-        if imports:
-            result.append(f"Imports: {', '.join(imports[:10])}")  # Limit to 10
-        if exports:
-            result.append(f"Exports: {', '.join(exports[:10])}")
-
-        return "\n".join(result) if result else ""
-
-    def _summarize_generic_file(self, file_path: Path, lines: list, content: str) -> str:
-        """Summarize generic files."""
-        return f"File: {file_path.name}\nType: {file_path.suffix}\nLines: {len(lines)}\nSize: {len(content)} bytes"
+    def _cache_file(self, file_path: Path, content_hash: str) -> Path:
+        """Summary cache file for one version of a file."""
+        return self.cache_dir / f"{file_path.name}_{content_hash}.json"
 
     def _compute_hash(self, file_path: Path) -> str:
         """Compute content hash for cache key."""
-        return hashlib.sha256(file_path.read_bytes()).hexdigest()[:8]
+        with open(file_path, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()[:8]
@@ -1,27 +1,147 @@
 """JSON-RPC 2.0 protocol handler for MCP server."""
 
+import asyncio
+import inspect
 import json
+import os
 import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from .chunking import ResultChunker
 
+DEFAULT_WORKERS = 4
 
-class JSONRPCHandler:
-    """Handle JSON-RPC 2.0 protocol for MCP communication."""
 
-    def __init__(self, server):
+class JSONRPCHandler:
+    """Handle JSON-RPC 2.0 protocol for MCP communication.
+
+    Requests are read by an asyncio loop and tool calls run on a worker
+    pool, so a cold parse of a large file does not block cheap requests
+    queued behind it. Responses are written as each request completes
+    (out of order, matched by id). ``notifications/cancelled`` drops a
+    pending request: queued work is never started, and running work has
+    its response suppressed.
+
+    Tool results are encoded once, minified, and results larger than
+    chunk_bytes are split at node boundaries (see ResultChunker).
+
+    Args:
+        server: AuZoomMCPServer instance
+        max_workers: Tool-call worker threads (default: AUZOOM_WORKERS or 4)
+        chunk_bytes: Chunking threshold (default: AUZOOM_CHUNK_BYTES or 256 KiB)
+    """
+
+    def __init__(
+        self,
+        server,
+        max_workers: Optional[int] = None,
+        chunk_bytes: Optional[int] = None
+    ):
         self.server = server
+        self.max_workers = max_workers or int(os.environ.get("AUZOOM_WORKERS", DEFAULT_WORKERS))
+        self.chunker = ResultChunker(server, chunk_bytes)  # Minified, chunked tool results
+        self._pending: dict = {}  # request id -> asyncio.Task
+        self.session_id = uuid.uuid4().hex  # One client session per handler
 
     def run(self):
-        """Process JSON-RPC requests from stdin."""
-        for line in sys.stdin:
-            try:
-                request = json.loads(line.strip())
-                response = self._handle_request(request)
-                self._send_response(response)
-
-            except json.JSONDecodeError as e:
-                self._send_parse_error(e)
-            except Exception as e:
-                self._send_internal_error(e, locals().get('request'))
+        """Process JSON-RPC requests from stdin until EOF."""
+        asyncio.run(self.serve(self._stdin_reader(), self._send_line))
+
+    async def serve(self, readline, write):
+        """Serve one JSON-RPC stream.
+
+        Args:
+            readline: Coroutine function returning the next line ("" at EOF)
+            write: Callable taking one serialized response line; if it returns
+                an awaitable (e.g. a socket write that drains), it is awaited,
+                so a slow reader pauses request intake instead of buffering
+        """
+        async def emit(line: str):
+            pending_write = write(line)
+            if inspect.isawaitable(pending_write):
+                await pending_write
+
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="auzoom-rpc")
+        try:
+            while True:
+                line = await readline()
+                if not line:
+                    break
+                if isinstance(line, bytes):
+                    line = line.decode()
+                if not line.strip():
+                    continue
+                try:
+                    await self._dispatch(line, loop, executor, emit)
+                except Exception as e:  # One bad line must never stop the stream
+                    await emit(json.dumps(self._create_error_response(None, -32603, f"Internal error: {e}")))
+
+            if self._pending:
+                await asyncio.gather(*self._pending.values(), return_exceptions=True)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self.server.end_session(self.session_id)
+
+    async def _dispatch(self, line: str, loop, executor, write):
+        """Answer a request inline, or schedule it on the worker pool."""
+        try:
+            request = json.loads(line.strip())
+        except json.JSONDecodeError as e:
+            await write(json.dumps(self._create_error_response(None, -32700, f"Parse error: {e}")))
+            return
+
+        invalid = _invalid_reason(request)
+        if invalid:
+            if isinstance(request, dict) and "id" not in request:
+                return  # Malformed notifications are dropped: notifications never get a response
+            request_id = request.get("id") if isinstance(request, dict) else None
+            await write(json.dumps(self._create_error_response(request_id, -32600, f"Invalid Request: {invalid}")))
+            return
+
+        method = request.get("method")
+        if method == "notifications/cancelled":
+            self._cancel(request.get("params", {}).get("requestId"))
+            return
+        if "id" not in request:
+            return  # Notifications (e.g. notifications/initialized) get no response
+
+        if method != "tools/call":
+            await write(self._safe_handle(request))
+            return
+
+        key = _key(request["id"])
+        if key in self._pending:
+            await write(json.dumps(self._create_error_response(
+                request["id"], -32600, "Invalid Request: id is already in use by a pending request"
+            )))
+            return
+        task = loop.create_task(self._run_in_pool(request, loop, executor, write))
+        self._pending[key] = task
+        task.add_done_callback(lambda done: self._pending.pop(key) if self._pending.get(key) is done else None)
+
+    async def _run_in_pool(self, request: dict, loop, executor, write):
+        """Run one request on the pool and write its response."""
+        try:
+            line = await loop.run_in_executor(executor, self._safe_handle, request)
+        except asyncio.CancelledError:
+            return  # Cancelled by the client: no response is sent
+        await write(line)
+
+    def _cancel(self, request_id):
+        """Abandon a pending request (notifications/cancelled)."""
+        task = self._pending.pop(_key(request_id), None)
+        if task:
+            task.cancel()
+
+    def _safe_handle(self, request: dict) -> str:
+        """Handle and encode one request, turning exceptions into JSON-RPC errors."""
+        try:
+            response = self._handle_request(request)
+        except Exception as e:
+            response = self._create_error_response(request.get("id"), -32603, f"Internal error: {e}")
+        return json.dumps(response, separators=(",", ":"))
 
     def _handle_request(self, request: dict) -> dict:
         """Route request to appropriate handler."""
@@ -66,8 +186,14 @@ class JSONRPCHandler:
         params = request.get("params", {})
         tool_name = params.get("name")
         arguments = params.get("arguments", {})
+        if not isinstance(arguments, dict):
+            return self._create_error_response(request.get("id"), -32602, "Invalid params: arguments must be an object")
 
-        result = self.server.handle_tool_call(tool_name, arguments)
+        if arguments.get("chunk_cursor"):
+            text = self.chunker.next_chunk(tool_name, arguments["chunk_cursor"])
+        else:
+            result = self.server.handle_tool_call(tool_name, arguments, session_id=self.session_id)
+            text = self.chunker.encode(result)
 
         return {
             "jsonrpc": "2.0",
@@ -76,26 +202,21 @@ class JSONRPCHandler:
                 "content": [
                     {
                         "type": "text",
-                        "text": json.dumps(result, indent=2)
+                        "text": text
                     }
                 ]
             }
         }
 
-    def _send_response(self, response: dict):
-        """Send JSON-RPC response to stdout."""
-        print(json.dumps(response), flush=True)
-
-    def _send_parse_error(self, error: Exception):
-        """Send parse error response."""
-        response = self._create_error_response(None, -32700, f"Parse error: {error}")
-        self._send_response(response)
+    def _stdin_reader(self):
+        """Async readline over stdin (blocking reads run off the event loop)."""
+        async def readline():
+            return await asyncio.get_running_loop().run_in_executor(None, sys.stdin.readline)
+        return readline
 
-    def _send_internal_error(self, error: Exception, request: dict = None):
-        """Send internal error response."""
-        request_id = request.get("id") if request else None
-        response = self._create_error_response(request_id, -32603, f"Internal error: {error}")
-        self._send_response(response)
+    def _send_line(self, line: str):
+        """Send one JSON-RPC message to stdout."""
+        print(line, flush=True)
 
     def _create_error_response(self, request_id, code: int, message: str) -> dict:
         """Create error response."""
@@ -107,3 +228,18 @@ class JSONRPCHandler:
                 "message": message
             }
         }
+
+
+def _key(request_id):
+    """Normalize a JSON-RPC id for lookups (ids may be numbers or strings)."""
+    return json.dumps(request_id)
+
+
+def _invalid_reason(request) -> str:
+    """Why a decoded message is not a valid request ("" if it is)."""
+    if not isinstance(request, dict):
+        return "request must be an object"
+    if not isinstance(request.get("params", {}), dict):
+        return "params must be an object"
+    return ""
+
@@ -0,0 +1,76 @@
+"""Per-session record of node content already sent to the client."""
+
+import contextvars
+import hashlib
+import json
+import threading
+
+DEFAULT_SESSION = "default"
+
+# Session of the tool call running in this context (set by handle_tool_call)
+current_session: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "auzoom_session", default=DEFAULT_SESSION
+)
+
+
+class SessionDeltaTracker:
+    """Remember which node contents each session has seen, for delta reads.
+
+    A node's content hash covers its serialized form, so a node re-read at
+    a different level, format or field set counts as changed. The state is
+    per session: a daemon serving several clients keeps one entry each.
+    """
+
+    def __init__(self):
+        self._sent: dict[str, dict[str, dict[str, str]]] = {}  # session -> file -> {node_id: hash}
+        self._lock = threading.Lock()
+
+    def diff(self, session_id: str, file_path: str, nodes: list[dict], record: bool = True) -> dict:
+        """Split a file's serialized nodes into changed and unchanged.
+
+        Args:
+            session_id: Session the response goes to
+            file_path: File the nodes belong to
+            nodes: Serialized nodes (standard "id" or compact "i" keys)
+            record: Remember these hashes as sent
+
+        Returns:
+            Dict with "nodes" (new or changed), "unchanged" (node IDs the
+            session already holds) and "removed" (IDs sent earlier that no
+            longer exist in the file)
+        """
+        current = {}
+        changed = []
+        unchanged = []
+        with self._lock:
+            previous = self._sent.get(session_id, {}).get(file_path, {})
+            for node in nodes:
+                node_id = node.get("id") or node.get("i")
+                if node_id is None:
+                    changed.append(node)  # Field filter dropped the ID: cannot delta
+                    continue
+                digest = _content_hash(node)
+                current[node_id] = digest
+                if previous.get(node_id) == digest:
+                    unchanged.append(node_id)
+                else:
+                    changed.append(node)
+            removed = [nid for nid in previous if nid not in current]
+            if record:
+                self._sent.setdefault(session_id, {})[file_path] = current
+        return {"nodes": changed, "unchanged": unchanged, "removed": removed}
+
+    def end_session(self, session_id: str):
+        """Forget everything sent to a session (client disconnected)."""
+        with self._lock:
+            self._sent.pop(session_id, None)
+
+    def session_count(self) -> int:
+        """Number of sessions with delta state."""
+        return len(self._sent)
+
+
+def _content_hash(node: dict) -> str:
+    """Stable short hash of one serialized node."""
+    encoded = json.dumps(node, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.blake2b(encoded, digest_size=8).hexdigest()
@@ -0,0 +1,21 @@
+"""Tool handlers of the AuZoom MCP server, grouped by area.
+
+Each class wraps the server and exposes one method per tool; the server
+builds its dispatch table from them.
+"""
+
+from .batch import BatchReadTools
+from .diagnostics import DiagnosticTools
+from .documents import DocumentTools
+from .reading import ReadTools
+from .structure import StructureTools
+from .traversal import TraversalTools
+
+__all__ = [
+    "BatchReadTools",
+    "DiagnosticTools",
+    "DocumentTools",
+    "ReadTools",
+    "StructureTools",
+    "TraversalTools",
+]
@@ -0,0 +1,149 @@
+"""auzoom_read_nodes and auzoom_read_many: many nodes or files in one call."""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from ...models import FetchLevel
+
+READ_MANY_MAX_FILES = 50
+READ_MANY_WORKERS = 4
+
+
+class BatchReadTools:
+    """Serve reads that cover many nodes or files, loading each file once.
+
+    Args:
+        server: AuZoomMCPServer whose graph and single-file reads are used
+    """
+
+    def __init__(self, server):
+        self.server = server
+
+    def read_nodes(self, args: dict) -> dict:
+        """Read many nodes in one call, loading each file once.
+
+        Typical use: fetch every node from a traversal or search result at
+        summary/full level without one auzoom_read per file. Node IDs are
+        grouped by file and cache misses are parsed in parallel.
+
+        Args:
+            node_ids: List of node IDs (absolute, or relative to project root)
+            level: "skeleton", "summary" or "full" (default: summary)
+            format: "standard" or "compact"
+            fields: Optional list of fields to include
+
+        Returns:
+            Dict with nodes (request order), count, missing IDs, files touched
+            and per-file load errors
+        """
+        node_ids = args.get("node_ids")
+        if not node_ids or not isinstance(node_ids, list):
+            return {"error": "node_ids parameter required (list of node IDs)"}
+
+        level_str = args.get("level", "summary")
+        format = args.get("format", "standard")
+        graph = self.server.graph
+        node_ids = [self._absolute_node_id(nid) for nid in node_ids]
+        warm = {f: graph.is_loaded(f) for f in dict.fromkeys(nid.split("::")[0] for nid in node_ids)}
+        result = graph.get_nodes(
+            node_ids,
+            FetchLevel[level_str.upper()],
+            format=format,
+            fields=args.get("fields")
+        )
+        missing = set(result["missing"])
+        for file_path in dict.fromkeys(nid.split("::")[0] for nid in node_ids if nid not in missing):
+            graph.access_log.record(file_path, warm[file_path])
+        return {
+            "type": "nodes",
+            "level": level_str,
+            "format": format,
+            "nodes": result["nodes"],
+            "count": len(result["nodes"]),
+            "missing": result["missing"],
+            "files": result["files"],
+            "errors": result["errors"]
+        }
+
+    def read_many(self, args: dict) -> dict:
+        """Read many files (paths or glob patterns) in one call.
+
+        Each file goes through the same path as auzoom_read (small-file
+        bypass, graph parse, non-Python summaries); files are read on a
+        thread pool so cache misses parse in parallel, each worker thread
+        using its own parser.
+
+        Args:
+            paths: List of file paths and/or globs relative to project root
+                (e.g. "src/pkg/*.py", "docs/**/*.md")
+            level: Detail level applied to every file (default: skeleton)
+            format: "standard" or "compact" (Python files)
+            fields: Optional list of fields to include (Python files)
+            max_files: Cap on files read (default: 50)
+
+        Returns:
+            Dict with per-file results (sorted by path), patterns that
+            matched nothing, and a truncated flag
+        """
+        patterns = args.get("paths")
+        if not patterns or not isinstance(patterns, list):
+            return {"error": "paths parameter required (list of paths or globs)"}
+
+        max_files = args.get("max_files", READ_MANY_MAX_FILES)
+        files, unmatched = self._expand_paths(patterns)
+        truncated = len(files) > max_files
+        files = files[:max_files]
+
+        read_args = {k: args[k] for k in ("level", "format", "fields", "delta") if k in args}
+        read_resolved = self.server.reads.read_resolved
+        context = contextvars.copy_context()  # Carry the session into worker threads
+        workers = min(READ_MANY_WORKERS, len(files)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(
+                lambda f: context.copy().run(read_resolved, f, read_args), files
+            ))
+
+        return {
+            "type": "many",
+            "level": args.get("level", "skeleton"),
+            "files": results,
+            "count": len(results),
+            "unmatched": unmatched,
+            "truncated": truncated
+        }
+
+    def _expand_paths(self, patterns: list[str]) -> tuple[list[Path], list[str]]:
+        """Resolve paths and glob patterns to existing files (deduplicated, sorted)."""
+        project_root = self.server.project_root
+        files: set[Path] = set()
+        unmatched = []
+        for pattern in patterns:
+            if any(ch in pattern for ch in "*?["):
+                if Path(pattern).is_absolute():
+                    pattern = str(Path(pattern).relative_to(project_root))
+                matches = [
+                    p.resolve() for p in project_root.glob(pattern)
+                    if p.is_file() and not _is_hidden(p.relative_to(project_root))
+                ]
+            else:
+                candidate = Path(pattern)
+                if not candidate.is_absolute():
+                    candidate = project_root / candidate
+                matches = [candidate.resolve()] if candidate.is_file() else []
+            if not matches:
+                unmatched.append(pattern)
+            files.update(matches)
+        return sorted(files), unmatched
+
+    def _absolute_node_id(self, node_id: str) -> str:
+        """Anchor a node ID's file part at the project root if it is relative."""
+        file_part, sep, qualified = node_id.partition("::")
+        file_path = Path(file_part)
+        if not file_path.is_absolute():
+            file_path = self.server.project_root / file_path
+        return f"{file_path.resolve()}{sep}{qualified}"
+
+
+def _is_hidden(relative_path: Path) -> bool:
+    """True for paths inside dot-directories (.git, .auzoom, ...)."""
+    return any(part.startswith(".") for part in relative_path.parts)
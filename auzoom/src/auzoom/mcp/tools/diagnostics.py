@@ -0,0 +1,98 @@
+"""Server diagnostics: cache stats, profiling hotspots and structure validation."""
+
+import threading
+
+
+class DiagnosticTools:
+    """Serve auzoom_stats, auzoom_profile and auzoom_validate.
+
+    Args:
+        server: AuZoomMCPServer being reported on
+    """
+
+    def __init__(self, server):
+        self.server = server
+        self._validator = None  # Created on first auzoom_validate
+        self._validator_lock = threading.Lock()
+
+    def stats(self, args: dict) -> dict:
+        """Get cache performance statistics."""
+        server = self.server
+        stats = server.graph.get_stats()
+        summary_files = list(server.summarizer.cache_dir.glob("*.json"))
+        stats["non_python_summaries_cached"] = len(summary_files)
+        stats["summary_pool"] = {**server.summarizer.pool.stats, "pending": server.summarizer.pool.pending()}
+        stats["graph_init_ms"] = round(server.init_seconds * 1000, 1)
+        stats["telemetry"] = server.telemetry.snapshot()
+        return stats
+
+    def profile(self, args: dict) -> dict:
+        """Aggregate per-call profiles into top-N hotspots.
+
+        Profiles are only recorded when the server runs with
+        AUZOOM_PROFILE=cpu (cProfile) or AUZOOM_PROFILE=mem (tracemalloc).
+
+        Args:
+            top_n: Number of hotspots (default: 20)
+            tool: Only aggregate profiles of this tool
+            sort: "cumulative" or "tottime" (cpu mode)
+
+        Returns:
+            Dict with mode, profile count, profile directory and hotspots
+        """
+        profiler = self.server.profiler
+        if not profiler.enabled:
+            return {"error": "Profiling disabled: restart the server with AUZOOM_PROFILE=cpu or AUZOOM_PROFILE=mem"}
+        result = profiler.hotspots(
+            top_n=args.get("top_n", 20),
+            tool=args.get("tool"),
+            sort=args.get("sort", "cumulative")
+        )
+        result["profile_dir"] = str(profiler.profile_dir)
+        return result
+
+    @property
+    def validator(self):
+        """Shared CodeValidator: graph-backed nodes, results cached by content hash."""
+        with self._validator_lock:
+            if self._validator is None:
+                from ...core.validator import CodeValidator
+                self._validator = CodeValidator(
+                    graph=self.server.graph,
+                    cache_file=self.server.project_root / ".auzoom" / "validation.json"
+                )
+        return self._validator
+
+    def validate(self, args: dict) -> dict:
+        """Validate code structure compliance."""
+        scope = args.get("scope", "file")
+        path = args.get("path", str(self.server.project_root))
+
+        validator = self.validator
+        hits_before = validator.results.hits
+
+        rules = args.get("rules")
+        if scope == "file":
+            violations = validator.validate_file(path, rules)
+        elif scope == "directory":
+            violations = validator.validate_directory(path, rules)
+        else:
+            violations = validator.validate_project(path, rules)
+
+        return {
+            "violations": [
+                {
+                    "file": v.file,
+                    "line": v.line,
+                    "type": v.type,
+                    "severity": v.severity,
+                    "message": v.message,
+                    "current": v.current,
+                    "limit": v.limit
+                }
+                for v in violations
+            ],
+            "compliant": len(violations) == 0,
+            "report": validator.format_report(violations),
+            "cached_files": validator.results.hits - hits_before
+        }
@@ -0,0 +1,173 @@
+"""auzoom_read for non-Python files: summaries, line ranges, key paths and sections."""
+
+import tomllib
+from pathlib import Path
+from typing import Optional
+from ...core.caching.work_pool import BACKGROUND
+from ...core.documents.sections import SECTION_SUFFIXES, find_section
+from ...core.documents.structure_index import STRUCTURED_SUFFIXES
+
+
+class DocumentTools:
+    """Serve reads of non-Python files from the summary, line, structure and section indexes.
+
+    Args:
+        server: AuZoomMCPServer owning the indexes and telemetry
+    """
+
+    def __init__(self, server):
+        self.server = server
+
+    def read_non_python_file(
+        self,
+        file_path: Path,
+        level_str: str,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> dict:
+        """Read non-Python file with lazy summary generation.
+
+        A summary requested before it exists is queued at foreground
+        priority; full reads only queue one speculatively (background).
+        """
+        if level_str == "full" and (offset is not None or limit is not None):
+            return self.read_line_range(file_path, offset or 0, limit)
+
+        summarizer = self.server.summarizer
+        cached_summary = summarizer.load_cached_summary(file_path)
+
+        # Return full content if requested
+        if level_str == "full":
+            content = file_path.read_text()
+            lines = content.splitlines()
+            if not cached_summary:
+                summarizer.schedule_summarization(file_path, priority=BACKGROUND)
+            return {
+                "type": "full_content",
+                "file_path": str(file_path),
+                "content": content,
+                "line_count": len(lines),
+                "level": "full"
+            }
+
+        # Return cached summary if available
+        if cached_summary:
+            return {
+                "type": "cached_summary",
+                "file_path": str(file_path),
+                "level": level_str,
+                "summary": cached_summary["summary"],
+                "file_type": cached_summary.get("file_type", file_path.suffix),
+                "line_count": cached_summary.get("line_count", 0),
+                "size_bytes": cached_summary.get("size_bytes", 0),
+                "cached": True,
+                "note": "Use level='full' for complete content"
+            }
+
+        # First access - return full and schedule summarization
+        content = file_path.read_text()
+        lines = content.splitlines()
+        summarizer.schedule_summarization(file_path)
+        return {
+            "type": "full_content_first_access",
+            "file_path": str(file_path),
+            "content": content,
+            "line_count": len(lines),
+            "level": "full",
+            "cached": False,
+            "note": "First access - summary will be cached for future reads"
+        }
+
+    def read_structured(self, file_path: Path, args: dict) -> dict:
+        """Read one subtree of a JSON/YAML/TOML file by key path.
+
+        skeleton lists the node's child keys with kinds and sizes;
+        summary/full return the node's own text.
+        """
+        key_path = str(args["key_path"])
+        level = args.get("level", "skeleton")
+        if file_path.suffix not in STRUCTURED_SUFFIXES:
+            return {
+                "error": f"key_path is supported for {', '.join(STRUCTURED_SUFFIXES)} files",
+                "file_path": str(file_path)
+            }
+        try:
+            with self.server.telemetry.phase("disk_load"):
+                content_hash = self.server.line_index.content_hash(file_path)
+                node = self.server.structure.read(file_path, content_hash, key_path, level)
+        except KeyError as e:
+            message, available = e.args
+            return {"error": message, "file_path": str(file_path), "key_path": key_path,
+                    "available_keys": available}
+        except (ValueError, IndexError, tomllib.TOMLDecodeError) as e:
+            return {"error": f"Could not walk {file_path.name}: {e}", "file_path": str(file_path)}
+        return {
+            "type": "structure" if level == "skeleton" else "structure_subtree",
+            "file_path": str(file_path),
+            "key_path": key_path,
+            "level": level,
+            **node
+        }
+
+    def read_section(self, file_path: Path, args: dict) -> dict:
+        """Read one Markdown/RST section by heading path or index.
+
+        skeleton returns the headings nested in the section (section ""
+        outlines the whole document); summary/full return its text.
+        """
+        selector = args["section"]
+        level = args.get("level", "skeleton")
+        if file_path.suffix not in SECTION_SUFFIXES:
+            return {
+                "error": f"section is supported for {', '.join(SECTION_SUFFIXES)} files",
+                "file_path": str(file_path)
+            }
+        sections = self.server.sections
+        with self.server.telemetry.phase("disk_load"):
+            rows = sections.headings(file_path, self.server.line_index.content_hash(file_path))
+        if selector == "" and level == "skeleton":
+            return {"type": "section_outline", "file_path": str(file_path), "section": "",
+                    "level": level, "headings": sections.outline(rows)}
+        try:
+            row = find_section(rows, selector)
+        except KeyError as e:
+            message, top_level = e.args
+            return {"error": message, "file_path": str(file_path), "section": selector,
+                    "top_level_sections": top_level}
+
+        result = {
+            "type": "section_outline" if level == "skeleton" else "section",
+            "file_path": str(file_path),
+            "section": selector,
+            "level": level,
+            **sections.describe(rows, row)
+        }
+        if level == "skeleton":
+            result["headings"] = sections.outline(rows, row)
+        else:
+            result.update(sections.read(file_path, rows[row]))
+        return result
+
+    def read_line_range(self, file_path: Path, offset: int, limit: Optional[int]) -> dict:
+        """Return lines [offset, offset + limit) via the newline-offset index.
+
+        Only the requested lines are read (mmap slice), so the cost does not
+        grow with file size once the file has been indexed.
+        """
+        with self.server.telemetry.phase("disk_load"):
+            result = self.server.line_index.read_lines(file_path, offset, limit)
+        self.server.telemetry.add_bytes_read(result["bytes_read"])
+        summarizer = self.server.summarizer
+        if not summarizer.load_cached_summary(file_path, result["content_hash"]):
+            summarizer.schedule_summarization(
+                file_path, content_hash=result["content_hash"], priority=BACKGROUND
+            )
+        return {
+            "type": "full_content",
+            "file_path": str(file_path),
+            "content": result["content"],
+            "line_count": result["line_count"],
+            "total_lines": result["total_lines"],
+            "offset": offset,
+            "level": "full"
+        }
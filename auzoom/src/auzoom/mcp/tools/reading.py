@@ -0,0 +1,190 @@
+"""auzoom_read: single-file reads, routed by file type and read mode."""
+
+import json
+import os
+from pathlib import Path
+from typing import Optional, List
+from ...models import FetchLevel
+from ..session_state import current_session
+
+
+class ReadTools:
+    """Serve auzoom_read for Python files (by level or token budget) and route other reads.
+
+    Args:
+        server: AuZoomMCPServer whose graph, deltas and document tools are used
+    """
+
+    def __init__(self, server):
+        self.server = server
+
+    def read(self, args: dict) -> dict:
+        """Handle auzoom_read - the main file reading tool."""
+        path = args.get("path")
+        if not path:
+            return {"error": "path parameter required"}
+
+        # Resolve path relative to project root
+        file_path = Path(path)
+        if not file_path.is_absolute():
+            file_path = self.server.project_root / path
+        file_path = file_path.resolve()
+
+        if not file_path.exists():
+            return {"error": f"File not found: {path}"}
+
+        return self.read_resolved(file_path, args)
+
+    def read_resolved(self, file_path: Path, args: dict) -> dict:
+        """Read one existing file through the Python or non-Python path."""
+        documents = self.server.documents
+        if args.get("key_path") is not None:
+            return documents.read_structured(file_path, args)
+        if args.get("section") is not None:
+            return documents.read_section(file_path, args)
+        if file_path.suffix == ".py" and args.get("budget_tokens") is not None:
+            return self.read_python_within_budget(file_path, args)
+        if file_path.suffix == ".py":
+            return self.read_python_file(
+                file_path,
+                args.get("level", "skeleton"),
+                format=args.get("format", "standard"),
+                fields=args.get("fields"),
+                delta=args.get("delta", False)
+            )
+        else:
+            return documents.read_non_python_file(
+                file_path,
+                args.get("level", "skeleton"),
+                args.get("offset"),
+                args.get("limit")
+            )
+
+    def read_python_file(
+        self,
+        file_path: Path,
+        level_str: str,
+        format: str = "standard",
+        fields: Optional[List[str]] = None,
+        delta: bool = False
+    ) -> dict:
+        """Read Python file using LazyCodeGraph with optimization support.
+
+        Every read records the content hash of each node sent to the
+        current session. With delta=True only new or changed nodes are
+        returned; nodes the session already holds are listed by qualified
+        name in "unchanged".
+
+        Args:
+            file_path: Path to Python file
+            level_str: Detail level ("skeleton", "summary", "full")
+            format: Serialization format ("standard" or "compact")
+            fields: Optional list of fields to include (field filtering)
+            delta: Return only nodes changed since this session last saw them
+
+        Returns:
+            Dict with file data and metadata
+        """
+        bypass = small_file_bypass(file_path)
+        if bypass:
+            return bypass
+
+        # Normal progressive disclosure path
+        level = FetchLevel[level_str.upper()]
+        graph = self.server.graph
+
+        try:
+            warm = graph.is_loaded(str(file_path))
+            imports, nodes = graph.get_file(str(file_path), level, format=format, fields=fields)
+            graph.access_log.record(str(file_path), warm)
+            diff = self.server.deltas.diff(current_session.get(), str(file_path), nodes)
+            result = {
+                "type": "python",
+                "file_path": str(file_path),
+                "level": level_str,
+                "format": format,
+                "imports": imports,  # Collapsed import nodes (simple string array)
+                "nodes": nodes,      # Non-import nodes (functions, classes, methods)
+                "node_count": len(nodes),
+                "import_count": len(imports),
+                "cached": str(file_path) in graph.file_index,
+            }
+            if delta:
+                result.update({
+                    "type": "python_delta",
+                    "nodes": diff["nodes"],
+                    "unchanged": [_qualified_name(nid) for nid in diff["unchanged"]],
+                    "removed": [_qualified_name(nid) for nid in diff["removed"]],
+                })
+            result["token_estimate"] = len(json.dumps({"imports": imports, "nodes": result["nodes"]})) // 4
+            return result
+        except Exception as e:
+            return {
+                "type": "python_fallback",
+                "file_path": str(file_path),
+                "error": f"Parse failed: {e}",
+                "content": file_path.read_text(),
+                "level": "full"
+            }
+
+    def read_python_within_budget(self, file_path: Path, args: dict) -> dict:
+        """Read a Python file with per-node levels chosen to fit budget_tokens.
+
+        Replaces skeleton -> summary -> full round trips: the target node
+        (if any) is shown in full, its neighbours at summary and the rest
+        at skeleton, as far as the budget allows.
+        """
+        budget_tokens = args["budget_tokens"]
+        if isinstance(budget_tokens, bool) or not isinstance(budget_tokens, int) or budget_tokens < 1:
+            return {"error": f"budget_tokens must be a positive integer, got {budget_tokens!r}"}
+
+        bypass = small_file_bypass(file_path)
+        if bypass:
+            return bypass
+
+        format = args.get("format", "standard")
+        graph = self.server.graph
+        warm = graph.is_loaded(str(file_path))
+        result = graph.get_file_within_budget(
+            str(file_path),
+            budget_tokens,
+            target=args.get("target"),
+            format=format,
+            fields=args.get("fields")
+        )
+        graph.access_log.record(str(file_path), warm)
+        return {
+            "type": "python",
+            "file_path": str(file_path),
+            "level": "auto",
+            "format": format,
+            "budget_tokens": budget_tokens,
+            "node_count": len(result["nodes"]),
+            "import_count": len(result["imports"]),
+            "token_estimate": result["planned_tokens"],
+            **result
+        }
+
+
+def small_file_bypass(file_path: Path) -> Optional[dict]:
+    """Full-content response for files under the small-file threshold, else None."""
+    # Check file size threshold bypass (default: 300 tokens)
+    threshold = int(os.environ.get("AUZOOM_SMALL_FILE_THRESHOLD", "300"))
+    line_count = sum(1 for _ in open(file_path))
+    estimated_tokens = line_count * 4  # ~4 tokens per line
+
+    if estimated_tokens < threshold:
+        # Small file bypass: return full content directly (no parsing)
+        return {
+            "type": "small_file_bypass",
+            "file_path": str(file_path),
+            "content": file_path.read_text(),
+            "note": f"File below {threshold} token threshold ({estimated_tokens} estimated)",
+            "level": "full"
+        }
+    return None
+
+
+def _qualified_name(node_id: str) -> str:
+    """Strip the file part of a node ID (the response already names the file)."""
+    return node_id.split("::", 1)[-1]
@@ -0,0 +1,109 @@
+"""Module import graph and class hierarchy queries, served from the cache index."""
+
+from ...models import EdgeType
+
+
+class StructureTools:
+    """Serve auzoom_imports and auzoom_hierarchy without parsing at request time.
+
+    Args:
+        server: AuZoomMCPServer whose graph holds the indexed imports and classes
+    """
+
+    def __init__(self, server):
+        self.server = server
+
+    def imports(self, args: dict) -> dict:
+        """Query the module import graph built from indexed files.
+
+        Served entirely from the import lists stored in the cache index, so
+        nothing is parsed at request time. Only indexed files are covered.
+
+        Args:
+            query: "importers" (who imports module), "closure" (everything
+                module imports, transitively) or "layers" (package layering)
+            module: File path or dotted module name (not needed for "layers")
+            transitive: For "importers", include indirect importers (default: False)
+
+        Returns:
+            Dict with the query, project-relative file/package lists and
+            files_indexed (coverage of the answer)
+        """
+        query = args.get("query", "importers")
+        graph = self.server.graph
+        imports = graph.get_import_graph()
+        result = {"query": query, "files_indexed": len(imports.imports)}
+
+        if query == "layers":
+            return {**result, **imports.get_layers()}
+        if query not in ("importers", "closure"):
+            return {"error": f"Unknown query: {query} (use importers, closure or layers)"}
+
+        module = args.get("module")
+        if not module:
+            return {"error": "module parameter required"}
+        file_path = imports.resolve(module, graph.import_resolver)
+        if not file_path:
+            return {"error": f"Module not found: {module}"}
+
+        if query == "importers":
+            files = imports.get_importers(file_path, args.get("transitive", False))
+        else:
+            files = imports.get_closure(file_path)
+        return {
+            **result,
+            "module": imports.relative(file_path),
+            "files": [imports.relative(f) for f in files],
+            "count": len(files)
+        }
+
+    def hierarchy(self, args: dict) -> dict:
+        """Query the class hierarchy (INHERITS edges) of indexed files.
+
+        Served from the per-class base and method records stored in the
+        cache index, so nothing is parsed at request time.
+
+        Args:
+            query: "subclasses", "superclasses" (C3 MRO), "overrides" (for a
+                method ID) or "resolve" (which class supplies a method)
+            target: Class node ID, bare class name, or method node ID (overrides)
+            method: Method name (resolve only)
+            transitive: For subclasses, include indirect subclasses (default: True)
+
+        Returns:
+            Dict with the query, target and the requested class/method IDs
+        """
+        query = args.get("query", "subclasses")
+        target = args.get("target")
+        if not target:
+            return {"error": "target parameter required"}
+
+        hierarchy = self.server.graph.get_class_hierarchy()
+        result = {"query": query, "target": target, "edge_type": EdgeType.INHERITS.value}
+
+        if query == "overrides":
+            try:
+                return {**result, **hierarchy.overrides(target)}
+            except KeyError as e:
+                return {"error": str(e.args[0])}
+
+        matches = hierarchy.find(target)
+        if not matches:
+            return {"error": f"Class not indexed: {target}"}
+        if len(matches) > 1:
+            return {"error": f"Ambiguous class name: {target}", "candidates": matches}
+        class_id = matches[0]
+        result["target"] = class_id
+
+        if query == "subclasses":
+            classes = hierarchy.subclasses(class_id, args.get("transitive", True))
+            return {**result, "classes": classes, "count": len(classes)}
+        if query == "superclasses":
+            return {**result, "mro": hierarchy.mro(class_id)}
+        if query == "resolve":
+            method = args.get("method")
+            if not method:
+                return {"error": "method parameter required for resolve"}
+            owner = hierarchy.resolve_method(class_id, method)
+            return {**result, "method": method, "resolved": f"{owner}.{method}" if owner else None}
+        return {"error": f"Unknown query: {query} (use subclasses, superclasses, overrides or resolve)"}
@@ -0,0 +1,208 @@
+"""Graph traversal tools: find, dependencies, impact and calls."""
+
+from ...models import NodeType, TraversalDirection, TraversalStrategy
+
+DIRECTIONS = {
+    "forward": TraversalDirection.FORWARD,
+    "reverse": TraversalDirection.REVERSE,
+    "both": TraversalDirection.BIDIRECTIONAL
+}
+NODE_TYPES = {
+    "function": NodeType.FUNCTION,
+    "method": NodeType.METHOD,
+    "class": NodeType.CLASS,
+    "module": NodeType.MODULE,
+    "import": NodeType.IMPORT
+}
+
+
+class TraversalTools:
+    """Serve name search and dependency/impact/call traversals over the code graph.
+
+    Args:
+        server: AuZoomMCPServer whose graph is traversed
+    """
+
+    def __init__(self, server):
+        self.server = server
+
+    def find(self, args: dict) -> dict:
+        """Search for code by name pattern."""
+        pattern = args.get("pattern", "")
+        matches = self.server.graph.find_by_name(pattern)
+        return {"matches": matches, "count": len(matches)}
+
+    def get_dependencies(self, args: dict) -> dict:
+        """Get dependency graph for a node with advanced traversal options.
+
+        Supports BFS vs DFS strategies, forward/reverse/bidirectional
+        directions, node type filtering and opt-in pagination.
+
+        Args:
+            node_id: Starting node ID (required)
+            depth: Maximum traversal depth (default: 1)
+            strategy: "bfs" (breadth-first) or "dfs" (depth-first), default: "bfs"
+            direction: "forward" (calls), "reverse" (callers), or "both", default: "reverse"
+            node_types: List of node types to include (e.g., ["function", "method"])
+            max_nodes: Stop after this many nodes (optional)
+            max_tokens: Stop before the result, or each page, exceeds this token estimate (optional)
+            page_size: Per-page node count; enables pagination (optional)
+            cursor: Continuation cursor from a previous page; enables pagination (optional)
+
+        Returns:
+            Dict with node_id, dependencies (with depth annotation), count,
+            truncated (a budget cut the traversal short), strategy and
+            direction; next_cursor when paginating
+
+        Examples:
+            # Impact analysis (default): Who depends on this?
+            {"node_id": "utils.py::validate_email", "depth": 2}
+
+            # Call chain analysis: What does this call?
+            {"node_id": "api.py::create_user", "depth": 5, "direction": "forward"}
+        """
+        node_id = args.get("node_id")
+        if not node_id:
+            return {"error": "node_id parameter required"}
+        page_size = args.get("page_size")
+        if page_size is not None and (not isinstance(page_size, int) or page_size < 1):
+            return {"error": "page_size must be a positive integer"}
+
+        options = _traversal_options(args)
+        # Paginated traversal (opt-in): only the requested page is computed
+        if page_size is not None or args.get("cursor"):
+            return self._dependencies_page(node_id, options, args)
+
+        deps = self.server.graph.get_dependencies(
+            node_id,
+            max_nodes=args.get("max_nodes"),
+            max_tokens=args.get("max_tokens"),
+            **options
+        )
+        return {
+            "node_id": node_id,
+            "dependencies": deps,
+            "count": len(deps),
+            "truncated": getattr(deps, "truncated", False),
+            "strategy": options["strategy"].value,
+            "direction": options["direction"].value,
+            "note": "Use strategy='bfs' for impact analysis (show all callers level-by-level). "
+                    "Use strategy='dfs' direction='forward' for call chain analysis (follow execution deep)."
+        }
+
+    def _dependencies_page(self, node_id: str, options: dict, args: dict) -> dict:
+        """One page of a dependency traversal (the first, or the one a cursor points at)."""
+        try:
+            page = self.server.graph.get_dependencies_page(
+                node_id,
+                page_size=args.get("page_size"),
+                max_tokens=args.get("max_tokens"),
+                cursor=args.get("cursor"),
+                **options
+            )
+        except (KeyError, ValueError) as e:  # Unknown/expired cursor, or another node's
+            return {"error": str(e.args[0]), "cursor": args.get("cursor")}
+        context = page["context"]
+        return {
+            "node_id": context["node_id"],
+            "dependencies": page["items"],
+            "count": len(page["items"]),
+            "truncated": page["next_cursor"] is not None,
+            "next_cursor": page["next_cursor"],
+            "strategy": context["strategy"],
+            "direction": context["direction"]
+        }
+
+    def get_impact(self, args: dict) -> dict:
+        """Get transitive impact ("what breaks if I change this?") from the impact index.
+
+        Answers from precomputed reverse reachability instead of running a
+        fresh traversal, so cost does not grow with the depth of the chain.
+
+        Args:
+            node_id: Node to analyze (required)
+            limit: Maximum member IDs to return (default: 50)
+
+        Returns:
+            Dict with node_id, impact_count (all transitive dependents),
+            members (up to limit IDs) and truncated flag
+        """
+        node_id = args.get("node_id")
+        if not node_id:
+            return {"error": "node_id parameter required"}
+
+        limit = args.get("limit", 50)
+        impact = self.server.graph.get_impact(node_id, limit)
+        if impact is None:
+            return {"error": "Impact index disabled (AUZOOM_IMPACT_INDEX=0)"}
+
+        return {
+            "node_id": node_id,
+            "impact_count": impact["impact_count"],
+            "members": impact["members"],
+            "truncated": impact["impact_count"] > len(impact["members"])
+        }
+
+    def get_calls(self, args: dict) -> dict:
+        """Get forward dependencies (what this node calls) on-demand.
+
+        This computes forward dependencies by parsing the node's source code,
+        since we only store reverse dependencies for token efficiency. Use
+        for call chain analysis, execution path tracing and circular
+        dependency detection.
+
+        Args:
+            node_id: Node ID to analyze
+
+        Returns:
+            Dict with node_id, calls (names called by this node), count,
+            a token cost estimate and a note that this is computed on-demand
+        """
+        node_id = args.get("node_id")
+        if not node_id:
+            return {"error": "node_id parameter required"}
+
+        # Get the node with full source code
+        try:
+            node = self.server.graph.get_node(node_id)
+            if not node:
+                return {"error": f"Node not found: {node_id}"}
+
+            calls = []
+            if node.get("source"):
+                # Parse the source and use the parser's call extraction directly
+                from ...core.parsing.parser import PythonParser
+                from tree_sitter import Language, Parser as TSParser
+                import tree_sitter_python as tspython
+
+                ts_parser = TSParser(Language(tspython.language()))
+                tree = ts_parser.parse(node["source"].encode())
+                calls = list(PythonParser()._extract_function_calls_from_node(tree.root_node))
+
+            return {
+                "node_id": node_id,
+                "calls": calls,
+                "count": len(calls),
+                "cost_estimate_tokens": 150,
+                "note": "Computed on-demand from source code (not cached). Use sparingly - most cases only need reverse deps from auzoom_get_dependencies."
+            }
+
+        except Exception as e:
+            return {
+                "error": f"Failed to extract calls: {str(e)}",
+                "node_id": node_id
+            }
+
+
+def _traversal_options(args: dict) -> dict:
+    """depth, strategy, direction and node_type_filter keyword arguments from tool args."""
+    strategy_str = args.get("strategy", "bfs").lower()
+    node_type_filter = None
+    if isinstance(args.get("node_types"), list):
+        node_type_filter = [NODE_TYPES[t] for t in args["node_types"] if t in NODE_TYPES]
+    return {
+        "depth": args.get("depth", 1),
+        "strategy": TraversalStrategy.BFS if strategy_str == "bfs" else TraversalStrategy.DFS,
+        "direction": DIRECTIONS.get(args.get("direction", "reverse").lower(), TraversalDirection.REVERSE),
+        "node_type_filter": node_type_filter
+    }
@@ -0,0 +1,10 @@
+"""MCP tool schema definitions for AuZoom."""
+
+from .diagnostics import diagnostic_schemas
+from .graph import graph_schemas
+from .reading import read_schemas
+
+
+def get_tools_manifest() -> dict:
+    """Return MCP tools manifest with all tool definitions."""
+    return {"tools": [*read_schemas(), *graph_schemas(), *diagnostic_schemas()]}
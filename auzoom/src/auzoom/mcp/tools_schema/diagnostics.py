@@ -0,0 +1,82 @@
+"""Schemas of the stats, profiling and validation tools."""
+
+
+def diagnostic_schemas() -> list[dict]:
+    """Schemas for auzoom_stats, auzoom_profile and auzoom_validate."""
+    return [
+        _auzoom_stats_schema(),
+        _auzoom_profile_schema(),
+        _auzoom_validate_schema()
+    ]
+
+
+def _auzoom_stats_schema() -> dict:
+    """Schema for auzoom_stats tool."""
+    return {
+        "name": "auzoom_stats",
+        "description": "Get cache performance statistics plus telemetry: per-tool latency percentiles (p50/p95/p99), per-phase time (hash, disk_load, parse, import_resolution, serialization, json_encode), bytes read and warmer vs foreground parses",
+        "inputSchema": {
+            "type": "object",
+            "properties": {}
+        }
+    }
+
+
+def _auzoom_profile_schema() -> dict:
+    """Schema for auzoom_profile tool."""
+    return {
+        "name": "auzoom_profile",
+        "description": "Top-N CPU or memory hotspots aggregated over profiled tool calls (server must run with AUZOOM_PROFILE=cpu or mem; per-call profiles are in .auzoom/profiles)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "top_n": {
+                    "type": "integer",
+                    "default": 20,
+                    "description": "Number of hotspots to return"
+                },
+                "tool": {
+                    "type": "string",
+                    "description": "Only aggregate profiles of this tool (e.g. auzoom_read)"
+                },
+                "sort": {
+                    "type": "string",
+                    "enum": ["cumulative", "tottime"],
+                    "default": "cumulative",
+                    "description": "CPU mode ordering"
+                }
+            }
+        }
+    }
+
+
+def _auzoom_validate_schema() -> dict:
+    """Schema for auzoom_validate tool."""
+    return {
+        "name": "auzoom_validate",
+        "description": "Validate code structure compliance with AuZoom guidelines (functions ≤50 lines, modules ≤250 lines, directories ≤7 files)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "scope": {
+                    "type": "string",
+                    "enum": ["file", "directory", "project"],
+                    "default": "file",
+                    "description": "Validation scope: single file, directory, or entire project"
+                },
+                "path": {
+                    "type": "string",
+                    "description": "Path to validate (defaults to project root)"
+                },
+                "rules": {
+                    "type": "array",
+                    "items": {
+                        "type": "string",
+                        "enum": ["module_length", "function_length", "directory_size",
+                                 "nesting_depth", "parameter_count", "docstring"]
+                    },
+                    "description": "Rules to check (default: module_length, function_length, directory_size)"
+                }
+            }
+        }
+    }
@@ -0,0 +1,179 @@
+"""Schemas of the graph search, traversal and structure tools."""
+
+
+def graph_schemas() -> list[dict]:
+    """Schemas for auzoom_find, traversal (dependencies, impact, calls) and structure queries."""
+    return [
+        _auzoom_find_schema(),
+        _auzoom_get_dependencies_schema(),
+        _auzoom_get_impact_schema(),
+        _auzoom_imports_schema(),
+        _auzoom_hierarchy_schema(),
+        _auzoom_get_calls_schema()
+    ]
+
+
+def _auzoom_find_schema() -> dict:
+    """Schema for auzoom_find tool."""
+    return {
+        "name": "auzoom_find",
+        "description": "Search for code by name pattern across indexed files",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "pattern": {
+                    "type": "string",
+                    "description": "Name pattern to search for"
+                }
+            },
+            "required": ["pattern"]
+        }
+    }
+
+
+def _auzoom_get_dependencies_schema() -> dict:
+    """Schema for auzoom_get_dependencies tool."""
+    return {
+        "name": "auzoom_get_dependencies",
+        "description": "Get dependency graph for a node. Pass page_size to paginate large results and resume with next_cursor.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "node_id": {
+                    "type": "string",
+                    "description": "Node ID to analyze"
+                },
+                "depth": {
+                    "type": "integer",
+                    "default": 1,
+                    "description": "Dependency depth to traverse"
+                },
+                "strategy": {
+                    "type": "string",
+                    "enum": ["bfs", "dfs"],
+                    "default": "bfs",
+                    "description": "Traversal strategy: bfs (impact, level by level) or dfs (call chains)"
+                },
+                "max_nodes": {
+                    "type": "integer",
+                    "description": "Stop after this many nodes (optional, for hub functions)"
+                },
+                "max_tokens": {
+                    "type": "integer",
+                    "description": "Stop before the result (or, when paginating, each page) exceeds this token estimate (optional)"
+                },
+                "page_size": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": "Nodes per page; enables pagination and returns next_cursor when more results remain"
+                },
+                "cursor": {
+                    "type": "string",
+                    "description": "Continuation cursor from a previous page of the same node_id"
+                }
+            },
+            "required": ["node_id"]
+        }
+    }
+
+
+def _auzoom_get_impact_schema() -> dict:
+    """Schema for auzoom_get_impact tool."""
+    return {
+        "name": "auzoom_get_impact",
+        "description": "Get the transitive impact of changing a node (all direct and indirect dependents) from a precomputed index",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "node_id": {
+                    "type": "string",
+                    "description": "Node ID to analyze"
+                },
+                "limit": {
+                    "type": "integer",
+                    "default": 50,
+                    "description": "Maximum dependent IDs to list (count is always exact)"
+                }
+            },
+            "required": ["node_id"]
+        }
+    }
+
+
+def _auzoom_imports_schema() -> dict:
+    """Schema for auzoom_imports tool."""
+    return {
+        "name": "auzoom_imports",
+        "description": "Query the module import graph of indexed files without parsing: importers of a module, its transitive import closure, or topological layering of packages",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "enum": ["importers", "closure", "layers"],
+                    "default": "importers",
+                    "description": "importers (who imports module), closure (all modules it imports transitively), layers (package dependency layers)"
+                },
+                "module": {
+                    "type": "string",
+                    "description": "File path or dotted module name (not needed for layers)"
+                },
+                "transitive": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "For importers: include indirect importers"
+                }
+            }
+        }
+    }
+
+
+def _auzoom_hierarchy_schema() -> dict:
+    """Schema for auzoom_hierarchy tool."""
+    return {
+        "name": "auzoom_hierarchy",
+        "description": "Query class inheritance across indexed files without parsing: subclasses, superclasses (MRO), where a method is overridden, or which class supplies a method",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "enum": ["subclasses", "superclasses", "overrides", "resolve"],
+                    "default": "subclasses",
+                    "description": "subclasses, superclasses (C3 MRO), overrides (target is a method ID), resolve (class + method)"
+                },
+                "target": {
+                    "type": "string",
+                    "description": "Class node ID or bare class name; method node ID for overrides"
+                },
+                "method": {
+                    "type": "string",
+                    "description": "Method name for resolve"
+                },
+                "transitive": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": "For subclasses: include indirect subclasses"
+                }
+            },
+            "required": ["target"]
+        }
+    }
+
+
+def _auzoom_get_calls_schema() -> dict:
+    """Schema for auzoom_get_calls tool."""
+    return {
+        "name": "auzoom_get_calls",
+        "description": "Get function/method calls made by a specific node in the code graph",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "node_id": {
+                    "type": "string",
+                    "description": "Fully qualified node ID (e.g., 'module.py::ClassName.method_name')"
+                }
+            },
+            "required": ["node_id"]
+        }
+    }
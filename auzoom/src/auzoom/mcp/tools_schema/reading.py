@@ -0,0 +1,143 @@
+"""Schemas of the file and node reading tools."""
+
+
+def read_schemas() -> list[dict]:
+    """Schemas for auzoom_read, auzoom_read_nodes and auzoom_read_many."""
+    return [
+        _auzoom_read_schema(),
+        _auzoom_read_nodes_schema(),
+        _auzoom_read_many_schema()
+    ]
+
+
+def _auzoom_read_schema() -> dict:
+    """Schema for auzoom_read tool."""
+    return {
+        "name": "auzoom_read",
+        "description": "Read file with hierarchical navigation. Python files return structure at requested level (skeleton/summary/full). Other files return cached summary or full content. All files indexed lazily on first access.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "chunk_cursor": {
+                    "type": "string",
+                    "description": "Fetch the next chunk of a large result (from chunk.next_cursor); other arguments are ignored"
+                },
+                "path": {
+                    "type": "string",
+                    "description": "File path to read"
+                },
+                "level": {
+                    "type": "string",
+                    "enum": ["skeleton", "summary", "full"],
+                    "default": "skeleton",
+                    "description": "Detail level: skeleton (minimal), summary (with metadata), or full (complete content)"
+                },
+                "delta": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Python files: return only nodes new or changed since this session last read them; the rest are listed by name in 'unchanged'"
+                },
+                "budget_tokens": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": "Python files: pick a level per node to fit this many tokens instead of one level for the whole file (overrides level)"
+                },
+                "target": {
+                    "type": "string",
+                    "description": "With budget_tokens: node to zoom into (name, Class.method or node ID) - shown full, neighbours at summary, the rest at skeleton"
+                },
+                "key_path": {
+                    "type": "string",
+                    "description": "JSON/YAML/TOML files: JSON pointer ('/paths/~1users/get') or dotted path ('servers.0.url') of one subtree; '' is the root. skeleton lists its child keys with sizes, summary/full return its text"
+                },
+                "section": {
+                    "type": ["string", "integer"],
+                    "description": "Markdown/RST files: one section by heading path ('Design/Storage', outer headings optional) or index in document order. skeleton lists its sub-headings ('' outlines the whole document), summary/full return its text"
+                },
+                "offset": {
+                    "type": "integer",
+                    "description": "Line offset for partial reads (optional)"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Line limit for partial reads (optional)"
+                }
+            },
+            "required": ["path"]
+        }
+    }
+
+
+def _auzoom_read_nodes_schema() -> dict:
+    """Schema for auzoom_read_nodes tool."""
+    return {
+        "name": "auzoom_read_nodes",
+        "description": "Read many nodes (e.g. from a dependency or search result) in one call. Nodes are grouped by file and each file is loaded once, in parallel across files.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "chunk_cursor": {
+                    "type": "string",
+                    "description": "Fetch the next chunk of a large result (from chunk.next_cursor); other arguments are ignored"
+                },
+                "node_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Node IDs to read (file_path::qualified_name)"
+                },
+                "level": {
+                    "type": "string",
+                    "enum": ["skeleton", "summary", "full"],
+                    "default": "summary",
+                    "description": "Detail level for every node"
+                },
+                "format": {
+                    "type": "string",
+                    "enum": ["standard", "compact"],
+                    "default": "standard",
+                    "description": "Serialization format"
+                }
+            },
+            "required": ["node_ids"]
+        }
+    }
+
+
+def _auzoom_read_many_schema() -> dict:
+    """Schema for auzoom_read_many tool."""
+    return {
+        "name": "auzoom_read_many",
+        "description": "Read several files in one call - use instead of sequential auzoom_read calls when orienting in a package. Accepts paths and globs; cache misses are parsed in parallel. Small files and non-Python files are handled exactly as in auzoom_read.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "chunk_cursor": {
+                    "type": "string",
+                    "description": "Fetch the next chunk of a large result (from chunk.next_cursor); other arguments are ignored"
+                },
+                "paths": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "File paths or glob patterns relative to project root (e.g. 'src/pkg/*.py')"
+                },
+                "level": {
+                    "type": "string",
+                    "enum": ["skeleton", "summary", "full"],
+                    "default": "skeleton",
+                    "description": "Detail level for every file"
+                },
+                "format": {
+                    "type": "string",
+                    "enum": ["standard", "compact"],
+                    "default": "standard",
+                    "description": "Serialization format for Python files"
+                },
+                "max_files": {
+                    "type": "integer",
+                    "default": 50,
+                    "description": "Maximum number of files to read"
+                }
+            },
+            "required": ["paths"]
+        }
+    }
@@ -159,6 +159,7 @@ class CodeNode:
     docstring: Optional[str] = None
     signature: Optional[str] = None  # for functions/methods
     source: Optional[str] = None  # full source code
+    bases: list[str] = field(default_factory=list)  # base classes (qualified via imports), classes only
 
     def to_skeleton(self) -> dict:
         """Return skeleton representation (~15 tokens): id, name, type, dependents.
@@ -188,6 +189,10 @@ class CodeNode:
                 truncated += "..."
             result["docstring"] = truncated
 
+        # Add base classes (INHERITS edges)
+        if self.bases:
+            result["bases"] = self.bases
+
         # Add line range for context
         result["line_start"] = self.line_start
         result["line_end"] = self.line_end
@@ -218,7 +223,7 @@ class CodeNode:
         """Return compact representation with short keys and minimal tokens.
 
         Optimizations:
-        - Short keys: "i" (id), "n" (name), "t" (type), "r" (dependents/reverse), "c" (children)
+        - Short keys: "i" (id), "n" (name), "t" (type), "r" (dependents/reverse), "c" (children), "b" (bases)
         - Type shortcodes: "f" (function), "m" (method), "c" (class), etc.
         - Relative paths if relative_to provided
         - Level-dependent fields (skeleton/summary/full)
@@ -253,6 +258,8 @@ class CodeNode:
                 if len(self.docstring) > 100:
                     truncated += "..."
                 result["doc"] = truncated
+            if self.bases:
+                result["b"] = self.bases
             result["ls"] = self.line_start
             result["le"] = self.line_end
 
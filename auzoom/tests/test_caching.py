@@ -0,0 +1,113 @@
+"""Tests for the line index, background work pool and access-log cache warming."""
+
+import json
+import threading
+import time
+from auzoom import AuZoomMCPServer
+from auzoom.core.caching.work_pool import BACKGROUND, FOREGROUND, PriorityWorkPool
+
+
+def test_read_line_range_uses_offset_index(tmp_path):
+    """offset/limit reads slice the file via a persisted newline-offset index."""
+    log = tmp_path / "app.log"
+    log.write_text("".join(f"line {i}\n" for i in range(1000)) + "tail without newline")
+    server = AuZoomMCPServer(str(tmp_path), auto_warm=False)
+
+    result = server.handle_tool_call("auzoom_read", {
+        "path": "app.log", "level": "full", "offset": 10, "limit": 3
+    })
+    assert result["content"] == "line 10\nline 11\nline 12"
+    assert result["line_count"] == 3
+    assert result["total_lines"] == 1001
+
+    tail = server.handle_tool_call("auzoom_read", {"path": "app.log", "level": "full", "offset": 999})
+    assert tail["content"] == "line 999\ntail without newline"
+
+    # A fresh server reuses the persisted index; an edit invalidates it
+    index_files = sorted(p.name for p in (tmp_path / ".auzoom" / "line_index").glob("*.idx"))
+    assert len(index_files) == 1
+    log.write_text("first\nsecond\n")
+    server = AuZoomMCPServer(str(tmp_path), auto_warm=False)
+    edited = server.handle_tool_call("auzoom_read", {"path": "app.log", "level": "full", "offset": 1, "limit": 5})
+    assert edited["content"] == "second"
+    assert edited["total_lines"] == 2
+
+
+def test_work_pool_runs_foreground_before_background():
+    """Foreground jobs jump queued background jobs; shutdown drains the queue."""
+    started, release, order = threading.Event(), threading.Event(), []
+
+    def work(name):
+        if name == "first":
+            started.set()
+            release.wait(5)
+        order.append(name)
+
+    pool = PriorityWorkPool(work, max_workers=1)
+    pool.submit("first", "first", priority=BACKGROUND)
+    started.wait(5)
+    pool.submit("bg", "bg", priority=BACKGROUND)
+    pool.submit("fg", "fg", priority=FOREGROUND)
+    assert not pool.submit("fg", "fg", priority=FOREGROUND)  # Already queued
+    assert pool.submit("bg", "bg", priority=FOREGROUND)  # Promoted ahead of its queued entry
+    release.set()
+    pool.shutdown()
+
+    assert order == ["first", "fg", "bg"]
+    assert pool.stats == {"submitted": 4, "deduplicated": 1, "completed": 3, "failed": 0}
+
+
+def test_startup_warms_most_read_files(tmp_path):
+    """Files read in earlier runs are warmed first, so the next run's first reads hit memory."""
+    for name in ("hot.py", "warm.py", "cold.py"):  # Above the small-file bypass threshold
+        (tmp_path / name).write_text("".join(f"def {name[:-3]}_{i}():\n    return {i}\n\n" for i in range(40)))
+    first = AuZoomMCPServer(str(tmp_path), auto_warm=False)
+    for name in ("hot.py", "hot.py", "hot.py", "warm.py"):
+        first.handle_tool_call("auzoom_read", {"path": name})
+    assert first.graph.access_log.top(2) == [str(tmp_path / "hot.py"), str(tmp_path / "warm.py")]
+    first.shutdown()
+
+    second = AuZoomMCPServer(str(tmp_path), auto_warm=True)
+    hot = str(tmp_path / "hot.py")
+    deadline = time.time() + 5
+    while hot not in second.graph.file_index and time.time() < deadline:
+        time.sleep(0.01)
+    second.handle_tool_call("auzoom_read", {"path": "hot.py"})
+    second.handle_tool_call("auzoom_read", {"path": "hot.py"})
+
+    warm = second.handle_tool_call("auzoom_stats", {})["warm"]
+    assert (warm["first_reads"], warm["warm_hits"], warm["warm_hit_rate"]) == (1, 1, "100.0%")
+    assert second.graph.telemetry.snapshot()["parses_by_origin"]["foreground"] == 0
+
+
+def test_read_many_records_accesses_and_saves_in_background(tmp_path):
+    """read_many's worker threads count toward the access log; saves go through its writer."""
+    for name in ("a.py", "b.py", "c.py"):  # Above the small-file bypass threshold
+        (tmp_path / name).write_text("".join(f"def {name[:-3]}_{i}():\n    return {i}\n\n" for i in range(40)))
+    server = AuZoomMCPServer(str(tmp_path), auto_warm=False)
+    for _ in range(9):  # 27 reads: past SAVE_EVERY
+        server.handle_tool_call("auzoom_read_many", {"paths": ["*.py"]})
+    log = server.graph.access_log
+    assert log.stats()["first_reads"] == 3
+    assert log._writer.stats["submitted"] >= 1
+    server.shutdown()
+    assert set(json.loads(log.log_file.read_text())) == {str(tmp_path / n) for n in ("a.py", "b.py", "c.py")}
+
+
+def test_access_log_counts_agent_reads_only(tmp_path):
+    """Validation loads leave the log alone; read_nodes records every file it returns."""
+    for name in ("a.py", "b.py", "c.py"):
+        (tmp_path / name).write_text("".join(f"def {name[:-3]}_{i}():\n    return {i}\n\n" for i in range(40)))
+    server = AuZoomMCPServer(str(tmp_path), auto_warm=False)
+    log = server.graph.access_log
+
+    server.handle_tool_call("auzoom_validate", {"scope": "project", "path": str(tmp_path)})
+    assert (log.stats()["first_reads"], log.entries) == (0, {})
+
+    read_nodes = lambda: server.handle_tool_call("auzoom_read_nodes", {"node_ids": ["a.py::a_0", "b.py::b_1"]})
+    read_nodes()
+    read_nodes()
+    assert set(log.entries) == {str(tmp_path / "a.py"), str(tmp_path / "b.py")}
+    assert [round(score) for score, _ in log.entries.values()] == [2, 2]
+    warm = log.stats()
+    assert (warm["first_reads"], warm["warm_hits"]) == (2, 2)  # Validation had loaded both files
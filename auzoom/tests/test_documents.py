@@ -0,0 +1,93 @@
+"""Tests for streaming summaries, structured key-path reads and document sections."""
+
+import json
+import tracemalloc
+from auzoom import AuZoomMCPServer
+from auzoom.core.documents.summaries import summarize_file
+
+
+def test_streaming_summaries_bound_memory(tmp_path):
+    """Summaries scan files in bounded pieces instead of loading them whole."""
+    data = {f"key_{i}": {"blob": "x" * 200_000, "nested": {"not_top": 1}} for i in range(15)}
+    path = tmp_path / "artifact.json"
+    path.write_text(json.dumps(data))  # One 3 MB line
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        result = summarize_file(path)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+    assert peak < path.stat().st_size / 4
+    assert result["line_count"] == 1
+    assert "Top-level keys: " + ", ".join(f"key_{i}" for i in range(10)) in result["summary"]
+
+    (tmp_path / "app.ts").write_text("import {\n  a,\n  b\n} from './lib'\nexport const Q = 1\n")
+    assert "Imports: ./lib\nExports: Q" in summarize_file(tmp_path / "app.ts")["summary"]
+
+
+def test_read_structured_subtree_by_key_path(tmp_path):
+    """key_path reads one JSON/YAML/TOML subtree; skeleton lists child keys with sizes."""
+    spec = {
+        "openapi": "3.0.0",
+        "paths": {f"/users/{i}": {"get": {"responses": {"200": {"description": f"ok {i}"}}}} for i in range(30)},
+    }
+    (tmp_path / "spec.json").write_text(json.dumps(spec, indent=2))
+    (tmp_path / "spec.yaml").write_text(
+        "openapi: 3.0.0\npaths:\n  /users:\n    get:\n      summary: List users\n"
+        "tags:\n- name: users\n  description: User ops\n"
+    )
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "demo"\n[tool.ruff]\nline-length = 100\n')
+    server = AuZoomMCPServer(str(tmp_path), auto_warm=False)
+    read = lambda **args: server.handle_tool_call("auzoom_read", args)
+
+    root = read(path="spec.json", key_path="")
+    assert root["type"] == "structure"
+    assert [(c["key"], c["kind"]) for c in root["children"]] == [("openapi", "string"), ("paths", "object")]
+    assert root["children"][1]["children"] == 30
+
+    node = read(path="spec.json", key_path="/paths/~1users~17/get/responses/200", level="full")
+    assert json.loads(node["content"]) == {"description": "ok 7"}
+    assert read(path="spec.json", key_path="paths./users/7.get")["child_count"] == 1
+    assert list((tmp_path / ".auzoom" / "structure").glob("*.json"))
+
+    missing = read(path="spec.json", key_path="/paths/nope")
+    assert "not found" in missing["error"] and "/users/0" in missing["available_keys"]
+
+    yaml_node = read(path="spec.yaml", key_path="/paths/~1users/get", level="full")
+    assert yaml_node["content"] == "summary: List users"
+    assert read(path="spec.yaml", key_path="tags.0", level="full")["content"] == "name: users\ndescription: User ops"
+
+    toml_node = read(path="pyproject.toml", key_path="tool.ruff", level="full")
+    assert json.loads(toml_node["content"]) == {"line-length": 100}
+
+
+def test_read_markdown_section(tmp_path):
+    """section reads one heading's range; skeleton outlines nested headings."""
+    (tmp_path / "adr.md").write_text(
+        "# Design\n\nIntro.\n\n## Storage\n\nUses SQLite.\n\n```\n# not a heading\n```\n\n"
+        "### Indexes\nB-tree.\n\n## API\n\nREST.\n"
+    )
+    (tmp_path / "guide.rst").write_text("Guide\n=====\n\nSetup\n-----\nRun it.\n\nUsage\n-----\nCall it.\n")
+    server = AuZoomMCPServer(str(tmp_path), auto_warm=False)
+    read = lambda **args: server.handle_tool_call("auzoom_read", args)
+
+    outline = read(path="adr.md", section="")
+    assert [(h["title"], h["depth"]) for h in outline["headings"]] == [
+        ("Design", 1), ("Storage", 2), ("Indexes", 3), ("API", 2)
+    ]
+
+    storage = read(path="adr.md", section="Design/Storage", level="full")
+    assert storage["content"].startswith("## Storage") and storage["content"].endswith("B-tree.")
+    assert "# not a heading" in storage["content"] and "REST" not in storage["content"]
+    assert storage["path"] == ["Design", "Storage"]
+    assert (storage["line_start"], storage["line_end"]) == (5, 15)
+
+    assert read(path="adr.md", section=3, level="full")["content"] == "## API\n\nREST."
+    assert [h["title"] for h in read(path="adr.md", section="storage")["headings"]] == ["Indexes"]
+    assert read(path="adr.md", section="Missing")["top_level_sections"] == ["Design"]
+
+    assert read(path="guide.rst", section="Usage", level="full")["content"] == "Usage\n-----\nCall it."
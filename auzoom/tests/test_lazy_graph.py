@@ -245,3 +245,137 @@ def test_background_warming():
 
     # Should have found and parsed some entry points
     # (or not, if no entry points exist)
+
+
+def test_dfs_deep_chain_iterative():
+    """DFS follows call chains deeper than the recursion limit."""
+    import sys
+    from auzoom.models import TraversalStrategy
+
+    chain_length = sys.getrecursionlimit() + 200
+    lines = ['def f0():\n    return 0\n']
+    for i in range(1, chain_length):
+        lines.append(f'def f{i}():\n    return f{i - 1}()\n')
+    with open('/tmp/test_deep_chain.py', 'w') as f:
+        f.write('\n'.join(lines))
+
+    g = LazyCodeGraph('/tmp', auto_warm=False)
+    g.get_file('/tmp/test_deep_chain.py', FetchLevel.SKELETON)
+
+    deps = g.get_dependencies(
+        '/tmp/test_deep_chain.py::f0',
+        depth=chain_length,
+        strategy=TraversalStrategy.DFS
+    )
+    assert len(deps) == chain_length  # start node + every caller
+    assert deps[-1]['depth'] == chain_length - 1
+    assert not deps.truncated
+
+
+def test_traversal_budgets():
+    """max_nodes and max_tokens stop hub traversals early."""
+    from auzoom.models import TraversalStrategy
+
+    callers = '\n'.join(f'def caller{i}():\n    return hub()\n' for i in range(50))
+    with open('/tmp/test_hub.py', 'w') as f:
+        f.write(f'def hub():\n    return 1\n\n{callers}')
+
+    g = LazyCodeGraph('/tmp', auto_warm=False)
+    g.get_file('/tmp/test_hub.py', FetchLevel.SKELETON)
+    hub_id = '/tmp/test_hub.py::hub'
+
+    for strategy in (TraversalStrategy.BFS, TraversalStrategy.DFS):
+        capped = g.get_dependencies(hub_id, depth=1, strategy=strategy, max_nodes=10)
+        assert len(capped) == 10
+        assert capped.truncated
+
+        small = g.get_dependencies(hub_id, depth=1, strategy=strategy, max_tokens=100)
+        assert 1 <= len(small) < 51
+        assert small.truncated
+
+        full = g.get_dependencies(hub_id, depth=1, strategy=strategy)
+        assert len(full) == 51
+        assert not full.truncated
+
+
+def test_impact_index_matches_traversal():
+    """Precomputed impact agrees with a full reverse traversal, cycles included.
+
+    Impact never counts the node itself, even when it sits on a cycle.
+    """
+    test_code = '''
+def leaf():
+    return 1
+
+def ping():
+    return leaf() + pong()
+
+def pong():
+    return ping()
+
+def top():
+    return pong()
+
+def unrelated():
+    return 0
+'''
+    with open('/tmp/test_impact.py', 'w') as f:
+        f.write(test_code)
+
+    g = LazyCodeGraph('/tmp', auto_warm=False)
+    imports, nodes = g.get_file('/tmp/test_impact.py', FetchLevel.SKELETON)
+    badges = {n['name']: n['impact'] for n in nodes}
+
+    for name in ('leaf', 'ping', 'pong', 'top', 'unrelated'):
+        node_id = f'/tmp/test_impact.py::{name}'
+        traversed = {d['id'] for d in g.get_dependencies(node_id, depth=10)} - {node_id}
+        impact = g.get_impact(node_id)
+        assert impact['impact_count'] == len(traversed) == badges[name]
+        assert set(impact['members']) == traversed
+
+    assert badges['leaf'] == 3
+    assert len(g.get_impact('/tmp/test_impact.py::leaf', limit=2)['members']) == 2
+
+
+def test_module_map_resolution(tmp_path):
+    """Imports resolve via the module map across layouts and stay fresh on events."""
+    pkg = tmp_path / "tool" / "src" / "tool"
+    (pkg / "sub").mkdir(parents=True)
+    (tmp_path / "tool" / "pyproject.toml").write_text("")
+    (pkg / "__init__.py").write_text("")
+    (pkg / "core.py").write_text("")
+    (pkg / "sub" / "__init__.py").write_text("")
+    (pkg / "sub" / "leaf.py").write_text("")
+    (tmp_path / "nspkg" / "inner").mkdir(parents=True)  # namespace package, no __init__
+    (tmp_path / "nspkg" / "inner" / "mod.py").write_text("")
+
+    g = LazyCodeGraph(str(tmp_path), auto_warm=False)
+    resolver = g.import_resolver
+    leaf = str(pkg / "sub" / "leaf.py")
+
+    assert resolver.resolve_import("import tool", leaf) == str(pkg / "__init__.py")
+    assert resolver.resolve_import("import tool.sub.leaf", leaf) == leaf
+    assert resolver.resolve_import("import nspkg.inner.mod", leaf) == str(tmp_path / "nspkg" / "inner" / "mod.py")
+    assert resolver.resolve_import("import ..core", leaf) == str(pkg / "core.py")
+    assert resolver.resolve_import("import .", leaf) == str(pkg / "sub" / "__init__.py")
+    assert resolver.resolve_import("import os.path", leaf) is None
+
+    new_file = pkg / "added.py"
+    new_file.write_text("")
+    g.on_file_created(str(new_file))
+    assert resolver.resolve_import("import tool.added", leaf) == str(new_file)
+
+    new_file.unlink()
+    g.on_file_deleted(str(new_file))
+    assert resolver.resolve_import("import tool.added", leaf) is None
+
+    # Files created without an event resolve on first lookup; ignored dirs stay out
+    unseen = pkg / "unseen.py"
+    unseen.write_text("")
+    assert resolver.resolve_import("import tool.unseen", leaf) == str(unseen)
+    assert resolver.resolve_import("import .unseen_sibling", leaf) is None
+    (pkg / "sub" / "later.py").write_text("")
+    assert resolver.resolve_import("import .later", leaf) == str(pkg / "sub" / "later.py")
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "gen.py").write_text("")
+    assert resolver.resolve_import("import build.gen", leaf) is None
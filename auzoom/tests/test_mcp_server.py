@@ -38,7 +38,7 @@ def test_tools_manifest(server):
     manifest = get_tools_manifest()
 
     assert "tools" in manifest
-    assert len(manifest["tools"]) == 6  # read, find, dependencies, get_calls, stats, validate
+    assert len(manifest["tools"]) == 12  # read, read_nodes, read_many, find, dependencies, impact, imports, hierarchy, get_calls, stats, profile, validate
 
     # Check auzoom_read tool
     read_tool = next(t for t in manifest["tools"] if t["name"] == "auzoom_read")
@@ -319,3 +319,577 @@ def test_cache_invalidation_non_python(server):
 
     finally:
         test_file.unlink()
+
+
+def test_get_dependencies_pagination(tmp_path):
+    """Paginated dependency results resume from continuation cursors."""
+    callers = '\n'.join(f'def caller{i}():\n    return hub()\n' for i in range(25))
+    hub_file = tmp_path / "paged_hub.py"
+    hub_file.write_text(f'def hub():\n    return 1\n\n{callers}')
+    server = AuZoomMCPServer(str(tmp_path), auto_warm=False)
+    hub = f"{hub_file.resolve()}::hub"
+    deps = lambda **args: server.handle_tool_call("auzoom_get_dependencies", {"node_id": hub, **args})
+
+    page = deps(page_size=10)
+    seen = [d["id"] for d in page["dependencies"]]
+    assert page["count"] == 10
+    assert page["next_cursor"]
+
+    # A cursor only resumes the node it was issued for, and survives a mismatch
+    other = server.handle_tool_call("auzoom_get_dependencies", {
+        "node_id": f"{hub_file.resolve()}::caller0", "cursor": page["next_cursor"]
+    })
+    assert "issued for" in other["error"]
+
+    while page["next_cursor"]:
+        cursor = page["next_cursor"]
+        page = deps(cursor=cursor, max_tokens=60)
+        assert page["node_id"] == hub
+        seen.extend(d["id"] for d in page["dependencies"])
+
+    assert len(seen) == 26  # hub + 25 callers
+    assert len(set(seen)) == 26
+
+    # Cursors are single-use
+    assert "error" in deps(cursor=cursor)
+
+    # A budget alone truncates without paginating; pagination needs page_size >= 1
+    budgeted = deps(max_tokens=60)
+    assert budgeted["truncated"] and "next_cursor" not in budgeted
+    assert "error" in deps(page_size=0)
+    assert "error" in server.handle_tool_call("auzoom_get_dependencies", {"cursor": cursor})
+
+
+def test_imports_tool(tmp_path):
+    """auzoom_imports answers from stored import adjacency."""
+    from auzoom.models import FetchLevel
+
+    for pkg in ("core", "api", "cli"):
+        (tmp_path / pkg).mkdir()
+        (tmp_path / pkg / "__init__.py").write_text("")
+    (tmp_path / "core" / "util.py").write_text("def helper():\n    return 1\n")
+    (tmp_path / "api" / "views.py").write_text("import core.util\n\ndef view():\n    return 1\n")
+    (tmp_path / "cli" / "main.py").write_text("import api.views\n\ndef run():\n    return 1\n")
+
+    server = AuZoomMCPServer(str(tmp_path), auto_warm=False)
+    for rel in ("core/util.py", "api/views.py", "cli/main.py"):
+        server.graph.get_file(str(tmp_path / rel), FetchLevel.SKELETON)
+    parses = server.graph.stats["parses"]
+
+    direct = server.handle_tool_call("auzoom_imports", {"query": "importers", "module": "core.util"})
+    assert direct["files"] == ["api/views.py"]
+
+    indirect = server.handle_tool_call("auzoom_imports", {
+        "query": "importers", "module": "core/util.py", "transitive": True
+    })
+    assert indirect["files"] == ["api/views.py", "cli/main.py"]
+
+    closure = server.handle_tool_call("auzoom_imports", {"query": "closure", "module": "cli/main.py"})
+    assert closure["files"] == ["api/views.py", "core/util.py"]
+
+    layers = server.handle_tool_call("auzoom_imports", {"query": "layers"})
+    assert layers["layers"] == [["core"], ["api"], ["cli"]]
+    assert layers["cycles"] == []
+
+    assert server.graph.stats["parses"] == parses  # Served without parsing
+
+
+def test_hierarchy_tool(tmp_path):
+    """auzoom_hierarchy resolves bases across files and answers from the index."""
+    from auzoom.models import FetchLevel
+
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "__init__.py").write_text("")
+    (tmp_path / "app" / "base.py").write_text(
+        "class BaseHandler:\n    def handle(self):\n        pass\n\n"
+        "    def close(self):\n        pass\n"
+    )
+    (tmp_path / "app" / "handlers.py").write_text(
+        "from .base import BaseHandler as Base\n\n"
+        "class Mixin:\n    def close(self):\n        pass\n\n"
+        "class JsonHandler(Base):\n    def handle(self):\n        pass\n\n"
+        "class StrictJson(Mixin, JsonHandler, metaclass=type):\n    pass\n"
+    )
+    server = AuZoomMCPServer(str(tmp_path), auto_warm=False)
+    for rel in ("app/base.py", "app/handlers.py"):
+        server.graph.get_file(str(tmp_path / rel), FetchLevel.SKELETON)
+    parses = server.graph.stats["parses"]
+
+    base_id = f"{tmp_path}/app/base.py::BaseHandler"
+    json_id = f"{tmp_path}/app/handlers.py::JsonHandler"
+    strict_id = f"{tmp_path}/app/handlers.py::StrictJson"
+    mixin_id = f"{tmp_path}/app/handlers.py::Mixin"
+
+    subs = server.handle_tool_call("auzoom_hierarchy", {"query": "subclasses", "target": "BaseHandler"})
+    assert subs["classes"] == [json_id, strict_id]
+
+    direct = server.handle_tool_call("auzoom_hierarchy", {
+        "query": "subclasses", "target": base_id, "transitive": False
+    })
+    assert direct["classes"] == [json_id]
+
+    mro = server.handle_tool_call("auzoom_hierarchy", {"query": "superclasses", "target": "StrictJson"})
+    assert mro["mro"] == [strict_id, mixin_id, json_id, base_id]
+
+    overrides = server.handle_tool_call("auzoom_hierarchy", {
+        "query": "overrides", "target": f"{base_id}.handle"
+    })
+    assert overrides["overrides"] is None
+    assert overrides["overridden_by"] == [f"{json_id}.handle"]
+
+    resolved = server.handle_tool_call("auzoom_hierarchy", {
+        "query": "resolve", "target": "StrictJson", "method": "close"
+    })
+    assert resolved["resolved"] == f"{mixin_id}.close"
+
+    assert server.graph.stats["parses"] == parses  # Served without parsing
+
+
+def test_read_nodes_tool(server):
+    """auzoom_read_nodes fetches nodes from several files in one call."""
+    node_ids = [
+        "src/auzoom/models.py::CodeNode",
+        "src/auzoom/core/validator.py::CodeValidator.validate_file",
+        "src/auzoom/models.py::estimate_tokens",
+        "src/auzoom/models.py::DoesNotExist",
+    ]
+    result = server.handle_tool_call("auzoom_read_nodes", {
+        "node_ids": node_ids,
+        "level": "full"
+    })
+
+    assert result["count"] == 3
+    assert result["files"] == 2
+    assert [n["name"] for n in result["nodes"]] == ["CodeNode", "validate_file", "estimate_tokens"]
+    assert all("source" in n for n in result["nodes"])
+    assert len(result["missing"]) == 1 and result["missing"][0].endswith("::DoesNotExist")
+    assert server.graph.stats["parses"] == 2  # One parse per distinct file
+
+
+class _GatedServer:
+    """Server stand-in whose "slow" tool blocks until released."""
+
+    def __init__(self, real):
+        import threading
+        self.real = real
+        self.telemetry = real.telemetry
+        self.release = threading.Event()
+
+    def handle_tool_call(self, name, args, session_id="default"):
+        if name == "slow":
+            self.release.wait(5)
+            return {"slow": True}
+        return self.real.handle_tool_call(name, args, session_id=session_id)
+
+    def end_session(self, session_id):
+        self.real.end_session(session_id)
+
+
+def _run_rpc(handler, messages, on_response=None):
+    """Drive JSONRPCHandler.serve with scripted input; return responses in send order."""
+    import asyncio
+    responses = []
+    lines = [json.dumps(m) + "\n" for m in messages]
+
+    async def readline():
+        await asyncio.sleep(0.05)
+        return lines.pop(0) if lines else ""
+
+    def write(line):
+        responses.append(json.loads(line))
+        if on_response:
+            on_response(responses[-1])
+
+    asyncio.run(handler.serve(readline, write))
+    return responses
+
+
+def _call(request_id, name, arguments=None):
+    return {"jsonrpc": "2.0", "id": request_id, "method": "tools/call",
+            "params": {"name": name, "arguments": arguments or {}}}
+
+
+def test_jsonrpc_responds_out_of_order(server):
+    """A cheap request queued behind a slow one is answered first."""
+    from auzoom.mcp.jsonrpc_handler import JSONRPCHandler
+    gated = _GatedServer(server)
+    handler = JSONRPCHandler(gated, max_workers=2)
+
+    responses = _run_rpc(
+        handler,
+        [_call(1, "slow"), _call(2, "auzoom_stats"),
+         {"jsonrpc": "2.0", "method": "notifications/initialized"}],
+        on_response=lambda r: gated.release.set() if r["id"] == 2 else None
+    )
+
+    assert [r["id"] for r in responses] == [2, 1]
+    assert "cache_hits" in responses[0]["result"]["content"][0]["text"]
+
+
+def test_jsonrpc_cancelled_request_gets_no_response(server):
+    """notifications/cancelled drops a pending request's response."""
+    from auzoom.mcp.jsonrpc_handler import JSONRPCHandler
+    gated = _GatedServer(server)
+    handler = JSONRPCHandler(gated, max_workers=1)
+
+    responses = _run_rpc(handler, [
+        _call("a", "slow"),
+        _call("b", "slow"),  # Queued behind "a" on the single worker
+        {"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": "a"}},
+        {"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": "b"}},
+        {"jsonrpc": "2.0", "id": 3, "method": "tools/list"},
+    ], on_response=lambda r: gated.release.set())
+
+    assert [r["id"] for r in responses] == [3]
+
+
+def test_jsonrpc_survives_malformed_requests(server):
+    """Non-object requests or params get -32600; the stream keeps being served."""
+    from auzoom.mcp.jsonrpc_handler import JSONRPCHandler
+    handler = JSONRPCHandler(server, max_workers=1)
+
+    responses = _run_rpc(handler, [
+        [1],
+        {"jsonrpc": "2.0", "method": "notifications/cancelled", "params": None},
+        {"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": None},
+        {"jsonrpc": "2.0", "id": 3, "method": "tools/call", "params": {"name": "auzoom_stats", "arguments": []}},
+        {"jsonrpc": "2.0", "id": 4, "method": "tools/list"},
+    ])
+
+    assert [(r["id"], r.get("error", {}).get("code")) for r in responses] == [
+        (None, -32600), (2, -32600), (3, -32602), (4, None)
+    ]
+
+
+def test_jsonrpc_rejects_duplicate_pending_id(server):
+    """A second call reusing a pending id is rejected; the first stays cancellable."""
+    from auzoom.mcp.jsonrpc_handler import JSONRPCHandler
+    gated = _GatedServer(server)
+    handler = JSONRPCHandler(gated, max_workers=2)
+
+    responses = _run_rpc(handler, [
+        _call("x", "slow"),
+        _call("x", "slow"),
+        {"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": "x"}},
+        {"jsonrpc": "2.0", "id": 5, "method": "tools/list"},
+    ], on_response=lambda r: gated.release.set() if r["id"] == 5 else None)
+
+    assert [(r["id"], r.get("error", {}).get("code")) for r in responses] == [("x", -32600), (5, None)]
+
+
+def test_concurrent_loads_keep_graph_consistent(tmp_path):
+    """Parallel reads of the same files leave one node set per file."""
+    from concurrent.futures import ThreadPoolExecutor
+    from auzoom.models import FetchLevel
+    for i in range(8):
+        (tmp_path / f"m{i}.py").write_text("".join(f"def f{j}():\n    return {j}\n\n" for j in range(30)))
+    server = AuZoomMCPServer(str(tmp_path), auto_warm=False)
+    graph = server.graph
+    paths = [str(tmp_path / f"m{i % 8}.py") for i in range(64)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda p: graph.get_file(p, FetchLevel.SKELETON)[1], paths))
+
+    assert all(len(nodes) == 30 for nodes in results)
+    assert len(graph.nodes) == 8 * 30
+    assert sum(len(ids) for ids in graph.file_index.values()) == 8 * 30
+
+
+def test_jsonrpc_awaits_async_writes(server):
+    """An awaitable write (a draining socket) is awaited before the next request is read."""
+    import asyncio
+    from auzoom.mcp.jsonrpc_handler import JSONRPCHandler
+    events = []
+    lines = [json.dumps({"jsonrpc": "2.0", "id": i, "method": "tools/list"}) + "\n" for i in range(3)]
+
+    async def readline():
+        events.append("read")
+        return lines.pop(0) if lines else ""
+
+    async def write(line):
+        await asyncio.sleep(0.01)
+        events.append(json.loads(line)["id"])
+
+    asyncio.run(JSONRPCHandler(server).serve(readline, write))
+    assert events == ["read", 0, "read", 1, "read", 2, "read"]
+
+
+def test_daemon_shares_graph_across_sessions(tmp_path):
+    """Two socket clients share one graph; the daemon exits when idle."""
+    import socket
+    import threading
+    from auzoom.mcp.daemon import AuZoomDaemon
+
+    (tmp_path / "mod.py").write_text("def f():\n    return 1\n")
+    sock_path = str(tmp_path / "d.sock")
+    daemon = AuZoomDaemon(str(tmp_path), sock_path, idle_timeout=0.5, auto_warm=False)
+    thread = threading.Thread(target=daemon.run, daemon=True)
+    thread.start()
+    deadline = time.time() + 5
+    while not Path(sock_path).exists() and time.time() < deadline:
+        time.sleep(0.02)
+    assert Path(sock_path).stat().st_mode & 0o077 == 0  # Owner-only from creation
+
+    def session(request_id):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(sock_path)
+            request = _call(request_id, "auzoom_read_nodes", {"node_ids": ["mod.py::f"]})
+            sock.sendall((json.dumps(request) + "\n").encode())
+            sock.shutdown(socket.SHUT_WR)
+            return json.loads(sock.makefile("rb").readline())
+
+    assert session(1)["id"] == 1
+    assert session(2)["id"] == 2
+    assert daemon.sessions_served == 2
+    assert daemon.server.graph.stats["parses"] == 1  # Second session hit the shared cache
+
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert not Path(sock_path).exists()
+
+
+def test_read_many_tool(tmp_path):
+    """auzoom_read_many expands globs and reuses the per-file read paths."""
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    big = "\n".join(f"def f{i}():\n    return {i}\n" for i in range(60))
+    (pkg / "big_a.py").write_text(big)
+    (pkg / "big_b.py").write_text(big)
+    (pkg / "tiny.py").write_text("X = 1\n")
+    (tmp_path / "README.md").write_text("# Title\n")
+    server = AuZoomMCPServer(str(tmp_path), auto_warm=False)
+
+    result = server.handle_tool_call("auzoom_read_many", {
+        "paths": ["pkg/*.py", "README.md", "missing/*.py"]
+    })
+
+    types = {Path(r["file_path"]).name: r["type"] for r in result["files"]}
+    assert types == {
+        "big_a.py": "python",
+        "big_b.py": "python",
+        "tiny.py": "small_file_bypass",
+        "README.md": "full_content_first_access",
+    }
+    assert result["unmatched"] == ["missing/*.py"]
+    assert not result["truncated"]
+    assert server.graph.stats["parses"] == 2
+
+    capped = server.handle_tool_call("auzoom_read_many", {"paths": ["pkg/*.py"], "max_files": 1})
+    assert capped["count"] == 1 and capped["truncated"]
+
+
+def test_read_with_token_budget(tmp_path):
+    """budget_tokens zooms the target to full, neighbours to summary, rest to skeleton."""
+    helpers = "\n".join(
+        f'def helper_{i}(x):\n    """Helper number {i}."""\n    return x + {i}\n' for i in range(30)
+    )
+    body = "\n".join(f"    total += helper_{i}(total)" for i in range(30))
+    (tmp_path / "mod.py").write_text(
+        helpers + f'\n\ndef target(total):\n    """Sum all helpers."""\n{body}\n    return total\n\n\n'
+        'def caller():\n    return target(0)\n'
+    )
+    server = AuZoomMCPServer(str(tmp_path), auto_warm=False)
+
+    levels = lambda r: {n["name"]: n["level"] for n in r["nodes"]}
+    roomy = server.handle_tool_call("auzoom_read", {
+        "path": "mod.py", "budget_tokens": 4000, "target": "target"
+    })
+    assert roomy["level"] == "auto"
+    assert roomy["targets"][0].endswith("::target")
+    assert levels(roomy)["target"] == "full"
+    assert levels(roomy)["caller"] in ("summary", "full")
+    assert roomy["token_estimate"] <= 4000
+    assert not roomy["omitted"]
+
+    tight = server.handle_tool_call("auzoom_read", {
+        "path": "mod.py", "budget_tokens": 900, "target": "target"
+    })
+    assert tight["token_estimate"] <= 900
+    assert levels(tight)["target"] == "full"
+    assert list(levels(tight).values()).count("skeleton") > 0
+    assert server.graph.stats["parses"] == 1
+
+    for bad in (-5, 0, "900", True):
+        error = server.handle_tool_call("auzoom_read", {"path": "mod.py", "budget_tokens": bad})["error"]
+        assert error.startswith("budget_tokens must be a positive integer")
+
+
+def test_read_delta_mode(tmp_path):
+    """delta=True re-sends only nodes that changed since the session's last read."""
+    funcs = [f"def func_{i}(x):\n    return x + {i}\n" for i in range(40)]
+    target = tmp_path / "mod.py"
+    target.write_text("\n".join(funcs))
+    server = AuZoomMCPServer(str(tmp_path), auto_warm=False)
+
+    first = server.handle_tool_call("auzoom_read", {"path": "mod.py", "level": "full"})
+    assert first["node_count"] == 40
+
+    funcs[7] = "def func_7(x):\n    return x * 7\n"
+    target.write_text("\n".join(funcs[:-1]))  # Edit one function, delete the last
+    delta = server.handle_tool_call("auzoom_read", {"path": "mod.py", "level": "full", "delta": True})
+
+    assert delta["type"] == "python_delta"
+    assert [n["name"] for n in delta["nodes"]] == ["func_7"]
+    assert len(delta["unchanged"]) == 38 and "func_0" in delta["unchanged"]
+    assert delta["removed"] == ["func_39"]
+    assert delta["token_estimate"] < first["token_estimate"] // 10
+
+    # Other sessions have their own state: a fresh session gets everything
+    other = server.handle_tool_call(
+        "auzoom_read", {"path": "mod.py", "level": "full", "delta": True}, session_id="other"
+    )
+    assert len(other["nodes"]) == 39 and other["unchanged"] == []
+
+
+def test_background_init_defers_graph_construction(tmp_path):
+    """With background_init the constructor returns before the graph exists; tools wait for it."""
+    (tmp_path / "mod.py").write_text("def f():\n    return 1\n")
+    server = AuZoomMCPServer(str(tmp_path), auto_warm=False, background_init=True)
+
+    result = server.handle_tool_call("auzoom_read_nodes", {"node_ids": ["mod.py::f"]})
+
+    assert result["count"] == 1
+    stats = server.handle_tool_call("auzoom_stats", {})
+    assert stats["graph_init_ms"] >= 0
+
+
+def test_jsonrpc_chunks_large_results(tmp_path):
+    """Oversized tool results are minified and split at node boundaries."""
+    from auzoom.mcp.jsonrpc_handler import JSONRPCHandler
+    (tmp_path / "mod.py").write_text("\n".join(
+        f'def func_{i}(x):\n    """Docstring {i}."""\n    return x + {i}\n' for i in range(60)
+    ))
+    server = AuZoomMCPServer(str(tmp_path), auto_warm=False)
+    handler = JSONRPCHandler(server, chunk_bytes=4096)
+
+    def call(arguments):
+        line = handler._safe_handle(_call(1, "auzoom_read", arguments))
+        text = json.loads(line)["result"]["content"][0]["text"]
+        assert "\n" not in text and len(text) <= 4096 + 1024
+        return json.loads(text)
+
+    first = call({"path": "mod.py", "level": "full"})
+    names = [n["name"] for n in first["nodes"]]
+    assert first["chunk"]["total_items"] == 60 and first["node_count"] == 60
+    cursor = first["chunk"]["next_cursor"]
+    while cursor:
+        chunk = call({"chunk_cursor": cursor})
+        assert chunk["file_path"] == first["file_path"]
+        names += [n["name"] for n in chunk["nodes"]]
+        cursor = chunk["chunk"]["next_cursor"]
+
+    assert names == [f"func_{i}" for i in range(60)]
+    assert "error" in call({"chunk_cursor": "bogus"})
+    assert server.telemetry.snapshot()["tools"]["auzoom_read"]["count"] > 2  # Continuations are recorded
+
+    line = handler._safe_handle(_call(2, "auzoom_stats", {"chunk_cursor": first["chunk"]["next_cursor"]}))
+    assert "does not accept chunk_cursor" in json.loads(json.loads(line)["result"]["content"][0]["text"])["error"]
+
+
+def test_stats_report_latency_and_phases(tmp_path, monkeypatch):
+    """auzoom_stats exposes per-tool percentiles, phase totals and a JSONL trace."""
+    trace = tmp_path / "trace.jsonl"
+    monkeypatch.setenv("AUZOOM_TRACE", str(trace))
+    (tmp_path / "mod.py").write_text("def f():\n    return 1\n")
+    server = AuZoomMCPServer(str(tmp_path), auto_warm=False)
+
+    for _ in range(5):
+        server.handle_tool_call("auzoom_read_nodes", {"node_ids": ["mod.py::f"]})
+    telemetry = server.handle_tool_call("auzoom_stats", {})["telemetry"]
+
+    read_stats = telemetry["tools"]["auzoom_read_nodes"]
+    assert read_stats["count"] == 5
+    assert 0 < read_stats["p50_ms"] <= read_stats["p95_ms"] <= read_stats["p99_ms"] <= read_stats["max_ms"]
+    assert telemetry["phases"]["parse"]["count"] == 1
+    assert telemetry["bytes_read"] > 0
+    assert telemetry["parses_by_origin"] == {"foreground": 1, "warmer": 0}
+
+    records = [json.loads(line) for line in trace.read_text().splitlines()]
+    assert [r["tool"] for r in records] == ["auzoom_read_nodes"] * 5 + ["auzoom_stats"]
+    assert "parse" in records[0]["phases_ms"]
+
+
+@pytest.mark.parametrize("mode", ["cpu", "mem"])
+def test_profile_mode_records_hotspots(tmp_path, monkeypatch, mode):
+    """AUZOOM_PROFILE writes one profile per call; auzoom_profile aggregates them."""
+    monkeypatch.setenv("AUZOOM_PROFILE", mode)
+    (tmp_path / "mod.py").write_text("def f():\n    return 1\n")
+    server = AuZoomMCPServer(str(tmp_path), auto_warm=False)
+
+    server.handle_tool_call("auzoom_read_nodes", {"node_ids": ["mod.py::f"]})
+    server.handle_tool_call("auzoom_stats", {})
+    result = server.handle_tool_call("auzoom_profile", {"top_n": 5})
+
+    assert result["mode"] == mode
+    assert result["profiles"] == 2
+    assert 0 < len(result["hotspots"]) <= 5
+    assert Path(result["profile_dir"]).is_relative_to(tmp_path / ".auzoom" / "profiles")
+    only_reads = server.handle_tool_call("auzoom_profile", {"tool": "auzoom_read_nodes"})
+    assert only_reads["profiles"] == 1
+
+
+def test_profile_tool_requires_profile_mode(server):
+    """Without AUZOOM_PROFILE the tool explains how to enable profiling."""
+    assert "error" in server.handle_tool_call("auzoom_profile", {})
+
+
+def test_summaries_are_deduplicated_per_file_version(tmp_path):
+    """Repeated reads of an unsummarized file queue one summary job."""
+    (tmp_path / "notes.md").write_text("# Notes\n" + "text\n" * 100)
+    server = AuZoomMCPServer(str(tmp_path), auto_warm=False)
+
+    for _ in range(5):
+        server.handle_tool_call("auzoom_read", {"path": "notes.md", "level": "full"})
+    server.shutdown()
+
+    pool = server.handle_tool_call("auzoom_stats", {})["summary_pool"]
+    assert pool["submitted"] == 1
+    assert pool["completed"] == 1 and pool["pending"] == 0
+    assert server.summarizer.load_cached_summary(tmp_path / "notes.md") is not None
+
+
+def test_requested_summaries_run_before_speculative_ones(tmp_path, monkeypatch):
+    """A summary a read is waiting for jumps summaries queued after full reads."""
+    import threading
+    from auzoom.mcp import file_summarizer
+
+    order, gate = [], threading.Event()
+
+    def recording_summarize(path):
+        order.append(path.name)
+        if len(order) == 1:
+            gate.wait(5)  # Hold the only worker while the queue fills
+        return summarize(path)
+
+    summarize = file_summarizer.summarize_file
+    monkeypatch.setattr(file_summarizer, "summarize_file", recording_summarize)
+    monkeypatch.setenv("AUZOOM_SUMMARY_WORKERS", "1")
+    for name in ("a.md", "b.md", "c.md", "wanted.md"):
+        (tmp_path / name).write_text(f"# {name}\n" + "text\n" * 100)
+    server = AuZoomMCPServer(str(tmp_path), auto_warm=False)
+
+    server.handle_tool_call("auzoom_read", {"path": "a.md", "level": "full"})
+    deadline = time.time() + 5
+    while not order and time.time() < deadline:
+        time.sleep(0.01)
+    for name in ("b.md", "c.md"):
+        server.handle_tool_call("auzoom_read", {"path": name, "level": "full"})
+    server.handle_tool_call("auzoom_read", {"path": "wanted.md", "level": "summary"})
+    gate.set()
+    server.shutdown()
+
+    assert order == ["a.md", "wanted.md", "b.md", "c.md"]
+
+
+def test_daemon_socket_lives_in_private_runtime_dir(tmp_path, monkeypatch):
+    """Sockets go in a 0700 per-user directory; a shared one is refused."""
+    from auzoom.mcp.daemon import socket_path
+
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    path = Path(socket_path(str(tmp_path)))
+    assert path.parent == tmp_path / "auzoom"
+    assert path.parent.stat().st_mode & 0o777 == 0o700
+
+    path.parent.chmod(0o777)
+    with pytest.raises(PermissionError):
+        socket_path(str(tmp_path))
@@ -74,3 +74,27 @@ def callee():
     callee_node = [n for n in nodes if n.name == 'callee'][0]
     # callee should have reverse dependency (caller depends on it)
     assert len(callee_node.dependents) > 0
+
+
+def test_class_bases_extraction():
+    """Base classes are recorded and qualified through import bindings."""
+    test_code = '''
+from ..handlers import BaseHandler as Base
+import pkg.mixins as mx
+from typing import Generic
+
+class Local:
+    pass
+
+class Handler(Base, mx.Logging, Local, Generic[T], metaclass=Meta):
+    pass
+'''
+    with open('/tmp/test_bases.py', 'w') as f:
+        f.write(test_code)
+
+    parser = PythonParser()
+    nodes = parser.parse_file('/tmp/test_bases.py')
+
+    handler = [n for n in nodes if n.name == 'Handler'][0]
+    assert handler.bases == ['..handlers.BaseHandler', 'pkg.mixins.Logging', 'Local', 'typing.Generic']
+    assert handler.to_summary()['bases'] == handler.bases
@@ -0,0 +1,85 @@
+"""Tests for cached, rule-selectable code structure validation."""
+
+from auzoom import AuZoomMCPServer
+from auzoom.core.validator import CodeValidator
+
+
+def test_validate_reuses_results_for_unchanged_files(tmp_path):
+    """Re-validation serves unchanged files from the result cache; edits re-check."""
+    body = "".join(f"    x{i} = {i}\n" for i in range(60))
+    module = tmp_path / "long.py"
+    module.write_text(f"def long_function():\n{body}")
+    (tmp_path / "short.py").write_text("def f():\n    return 1\n")
+    server = AuZoomMCPServer(str(tmp_path), auto_warm=False)
+
+    first = server.handle_tool_call("auzoom_validate", {"scope": "project", "path": str(tmp_path)})
+    assert [v["type"] for v in first["violations"]] == ["function_too_long"]
+    assert first["cached_files"] == 0
+    results = server.diagnostics.validator.results
+    assert (results.hits, results.misses) == (0, 2)  # Each file looked up once
+
+    second = AuZoomMCPServer(str(tmp_path), auto_warm=False).handle_tool_call(
+        "auzoom_validate", {"scope": "project", "path": str(tmp_path)}
+    )
+    assert second["violations"] == first["violations"]
+    assert second["cached_files"] == 2
+
+    module.write_text("def short_function():\n    return 1\n")
+    third = server.handle_tool_call("auzoom_validate", {"scope": "file", "path": str(module)})
+    assert third["compliant"] and third["cached_files"] == 0
+
+
+def test_validate_project_walks_once_and_checks_in_parallel(tmp_path, monkeypatch):
+    """Project validation prunes ignored dirs; pooled checks match in-process ones."""
+    body = "".join(f"    x{i} = {i}\n" for i in range(60))
+    for i in range(CodeValidator.PARALLEL_MIN_FILES + 6):
+        package = tmp_path / f"pkg{i // 10}"
+        package.mkdir(exist_ok=True)
+        (package / f"mod{i}.py").write_text(f"def f{i}():\n{body if i % 7 == 0 else '    pass'}\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "vendored.py").write_text(f"def vendored():\n{body}")
+
+    monkeypatch.setenv("AUZOOM_VALIDATE_WORKERS", "2")
+    pooled = CodeValidator().validate_project(str(tmp_path))
+    monkeypatch.setenv("AUZOOM_VALIDATE_WORKERS", "1")
+    serial = CodeValidator().validate_project(str(tmp_path))
+
+    long_functions = sorted(v.file for v in pooled if v.type == "function_too_long")
+    assert len(long_functions) == 10 and not any("node_modules" in f for f in long_functions)
+    assert sorted(v.file for v in serial if v.type == "function_too_long") == long_functions
+    assert {v.file for v in pooled if v.type == "dir_too_many_files"} == {
+        str(tmp_path / f"pkg{i}") for i in range(7)
+    }
+
+
+def test_validate_rule_subsets_are_memoized_per_rule(tmp_path):
+    """Selected rules run in one pass; enabling a rule later computes only that rule."""
+    (tmp_path / "mod.py").write_text(
+        "def configure(a, b, c, d, e, f):\n"
+        "    for x in a:\n"
+        "        if x:\n"
+        "            while b:\n"
+        "                with c:\n"
+        "                    if d:\n"
+        "                        return e\n"
+        "\n\n"
+        "class Settings:\n"
+        "    \"\"\"Documented.\"\"\"\n"
+        "    def load(self, path):\n"
+        "        return path\n"
+    )
+    server = AuZoomMCPServer(str(tmp_path), auto_warm=False)
+    validate = lambda **args: server.handle_tool_call("auzoom_validate", {"scope": "file", "path": str(tmp_path / "mod.py"), **args})
+
+    assert validate()["compliant"]
+    found = validate(rules=["nesting_depth", "parameter_count"])
+    assert {(v["type"], v["current"]) for v in found["violations"]} == {("nesting_too_deep", 5), ("too_many_parameters", 6)}
+    assert found["cached_files"] == 0
+
+    docs = validate(rules=["docstring", "nesting_depth"])
+    assert sorted(v["message"] for v in docs["violations"]) == [
+        "'configure' has no docstring", "'load' has no docstring",
+        "Function 'configure' nests blocks 5 deep (limit: 4)",
+    ]
+    assert validate(rules=["parameter_count", "docstring"])["cached_files"] == 1
+    assert "Unknown rules: length" in validate(rules=["length"])["error"]
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark: time to first response for the AuZoom MCP server.
+
+Spawns `auzoom.mcp.server` over stdio and measures, per run:
+  initialize   : process start -> initialize response (what hosts time out on)
+  tools/list   : process start -> tools/list response
+  first call   : process start -> first auzoom_stats response (graph ready)
+
+Each mode is run several times and the median is reported:
+  eager       : AUZOOM_BACKGROUND_INIT=0 (graph built before the handshake)
+  background  : default (graph built on a background thread)
+
+Run: python3 benchmark/startup_benchmark.py [path-to-repo] [runs]
+Default: the auzoom/ source itself, 5 runs
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent.parent / "auzoom" / "src"
+
+REQUESTS = [
+    {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+    {"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+    {"jsonrpc": "2.0", "id": 3, "method": "tools/call",
+     "params": {"name": "auzoom_stats", "arguments": {}}},
+]
+LABELS = {1: "initialize", 2: "tools/list", 3: "first call"}
+
+
+def time_startup(repo_path: Path, background: bool) -> dict:
+    """Start one server process and time each response from process start."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    env["AUZOOM_BACKGROUND_INIT"] = "1" if background else "0"
+
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", "from auzoom.mcp.server import main; main()"],
+        cwd=repo_path, env=env, text=True,
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+    for request in REQUESTS:
+        proc.stdin.write(json.dumps(request) + "\n")
+    proc.stdin.flush()
+
+    timings = {}
+    while len(timings) < len(REQUESTS):
+        line = proc.stdout.readline()
+        if not line:
+            break
+        response = json.loads(line)
+        timings[LABELS[response["id"]]] = (time.perf_counter() - start) * 1000
+    proc.stdin.close()
+    proc.wait(timeout=30)
+    return timings
+
+
+def run_benchmark(repo_path: Path, runs: int):
+    """Print median time-to-response per mode."""
+    print(f"\nRepo: {repo_path}  ({runs} runs per mode, median ms from process start)")
+    print(f"\n{'Mode':<12} {'initialize':>12} {'tools/list':>12} {'first call':>12}")
+    print(f"{'-'*52}")
+    for mode, background in (("eager", False), ("background", True)):
+        samples = [time_startup(repo_path, background) for _ in range(runs)]
+        medians = {
+            label: statistics.median(s[label] for s in samples if label in s)
+            for label in LABELS.values()
+        }
+        print(f"{mode:<12} {medians['initialize']:>12.1f} {medians['tools/list']:>12.1f} "
+              f"{medians['first call']:>12.1f}")
+
+
+def main():
+    repo_path = Path(sys.argv[1]).resolve() if len(sys.argv) > 1 else SRC_DIR.parent
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    if not repo_path.exists():
+        print(f"Path not found: {repo_path}")
+        sys.exit(1)
+
+    print("=========================================================")
+    print("AuZoom MCP startup benchmark (time to first response)")
+    print("=========================================================")
+    run_benchmark(repo_path, runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,16 @@
 """MCP server exposing orchestrator tools for Claude Code integration."""
 
 import asyncio
+import os
+import time
+from pathlib import Path
 from typing import Optional
 
 from ..scoring import ComplexityScorer
 from ..registry import ModelRegistry, ModelTier
 from ..executor import Executor
 from ..models import Task
+from ..profiling import ToolProfiler, profile_mode_from_env
 from pydantic import ValidationError
 from .jsonrpc_handler import JSONRPCHandler
 
@@ -19,6 +23,7 @@ class OrchestratorMCPServer:
     - orchestrator_route: Get routing recommendation based on complexity
     - orchestrator_execute: Execute task on specified model
     - orchestrator_validate: Validate output using Sonnet
+    - orchestrator_profile: Hotspots from profiled calls (ORCHESTRATOR_PROFILE=cpu|mem)
     """
 
     def __init__(self):
@@ -26,6 +31,10 @@ class OrchestratorMCPServer:
         self.scorer = ComplexityScorer()
         self.registry = ModelRegistry()
         self.executor = Executor()
+        run_id = f"orchestrator-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        self.profiler = ToolProfiler(
+            profile_mode_from_env(), Path.cwd() / ".auzoom" / "profiles" / run_id
+        )
 
     async def handle_tool_call(self, tool_name: str, arguments: dict) -> dict:
         """
@@ -38,14 +47,18 @@ class OrchestratorMCPServer:
         Returns:
             Tool result dictionary
         """
-        if tool_name == "orchestrator_route":
-            return await self._route(arguments)
-        elif tool_name == "orchestrator_execute":
-            return await self._execute(arguments)
-        elif tool_name == "orchestrator_validate":
-            return await self._validate(arguments)
-        else:
-            return {"error": f"Unknown tool: {tool_name}"}
+        if tool_name == "orchestrator_profile":
+            return self._profile(arguments)
+
+        with self.profiler.profile(tool_name):
+            if tool_name == "orchestrator_route":
+                return await self._route(arguments)
+            elif tool_name == "orchestrator_execute":
+                return await self._execute(arguments)
+            elif tool_name == "orchestrator_validate":
+                return await self._validate(arguments)
+            else:
+                return {"error": f"Unknown tool: {tool_name}"}
 
     async def _route(self, args: dict) -> dict:
         """
@@ -179,6 +192,27 @@ class OrchestratorMCPServer:
             "escalate": validation.get("escalate", False)
         }
 
+    def _profile(self, args: dict) -> dict:
+        """
+        Aggregate per-call profiles into hotspots.
+
+        Args:
+            args: {top_n: int (optional), tool: str (optional),
+                   sort: "cumulative" or "tottime" (cpu mode, optional)}
+
+        Returns:
+            {mode, profiles, hotspots, profile_dir} or error if profiling is off
+        """
+        if not self.profiler.enabled:
+            return {"error": "Profiling disabled: set ORCHESTRATOR_PROFILE=cpu or mem and restart the server"}
+        result = self.profiler.hotspots(
+            top_n=args.get("top_n", 20),
+            tool=args.get("tool"),
+            sort=args.get("sort", "cumulative")
+        )
+        result["profile_dir"] = str(self.profiler.profile_dir)
+        return result
+
     def run(self):
         """Run MCP server (stdio protocol)."""
         handler = JSONRPCHandler(self)
@@ -8,6 +8,7 @@ def get_tools_manifest():
             _orchestrator_route_schema(),
             _orchestrator_execute_schema(),
             _orchestrator_validate_schema(),
+            _orchestrator_profile_schema(),
         ]
     }
 
@@ -114,3 +115,35 @@ def _orchestrator_validate_schema():
             "required": ["task", "output"]
         }
     }
+
+
+def _orchestrator_profile_schema():
+    """Schema for orchestrator_profile tool."""
+    return {
+        "name": "orchestrator_profile",
+        "description": (
+            "Top-N hotspots aggregated over profiled tool calls. "
+            "Requires the server to run with ORCHESTRATOR_PROFILE (or AUZOOM_PROFILE) set to cpu or mem; "
+            "per-call profiles are written under .auzoom/profiles."
+        ),
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "top_n": {
+                    "type": "integer",
+                    "default": 20,
+                    "description": "Number of hotspots to return"
+                },
+                "tool": {
+                    "type": "string",
+                    "description": "Only aggregate profiles of this tool"
+                },
+                "sort": {
+                    "type": "string",
+                    "enum": ["cumulative", "tottime"],
+                    "default": "cumulative",
+                    "description": "CPU mode ordering"
+                }
+            }
+        }
+    }
@@ -187,3 +187,27 @@ class TestOrchestratorMCPServer:
 
             assert "success" in result
             assert "response" in result
+
+    @pytest.mark.asyncio
+    async def test_profile_cpu_mode(self, tmp_path, monkeypatch):
+        """Test ORCHESTRATOR_PROFILE=cpu records one profile per call."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("ORCHESTRATOR_PROFILE", "cpu")
+        server = OrchestratorMCPServer()
+
+        await server.handle_tool_call("orchestrator_route", {"task": "Fix a typo"})
+        result = await server.handle_tool_call("orchestrator_profile", {"top_n": 5})
+
+        assert result["mode"] == "cpu"
+        assert result["profiles"] == 1
+        assert 0 < len(result["hotspots"]) <= 5
+        assert ".auzoom/profiles" in result["profile_dir"]
+
+    @pytest.mark.asyncio
+    async def test_profile_disabled(self, monkeypatch):
+        """Test orchestrator_profile reports an error when profiling is off."""
+        monkeypatch.delenv("ORCHESTRATOR_PROFILE", raising=False)
+        monkeypatch.delenv("AUZOOM_PROFILE", raising=False)
+        server = OrchestratorMCPServer()
+        result = await server.handle_tool_call("orchestrator_profile", {})
+        assert "error" in result